@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -32,7 +33,7 @@ def treasury(config: Config = Depends(get_config), db: Database = Depends(get_db
 
 @router.get("/karma/intents")
 def karma_intents(karma: KarmaEngine = Depends(get_karma)) -> dict[str, Any]:
-    return {"items": [i.__dict__ for i in karma.get_pending_intents()]}
+    return {"items": [asdict(i) for i in karma.get_pending_intents()]}
 
 
 @router.post("/karma/settle")
@@ -49,9 +50,9 @@ def karma_settle(
     if receipt is None:
         raise HTTPException(status_code=400, detail="Settlement not recorded")
 
-    return {"receipt": receipt.__dict__}
+    return {"receipt": asdict(receipt)}
 
 
 @router.get("/karma/receipts")
 def karma_receipts(karma: KarmaEngine = Depends(get_karma)) -> dict[str, Any]:
-    return {"items": [r.__dict__ for r in karma.get_receipts()]}
+    return {"items": [asdict(r) for r in karma.get_receipts()]}
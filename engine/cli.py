@@ -16,7 +16,7 @@ import json
 import os
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -435,7 +435,6 @@ def _cmd_brain(ctx: CliContext, args: argparse.Namespace) -> int:
     try:
         # Optional: run producers prior to orchestration.
         import logging
-        from dataclasses import asdict
 
         from engine.core.client import DataClient
         from engine.core.metrics import REGISTRY
@@ -878,7 +877,7 @@ def _cmd_contributors(ctx: CliContext, args: argparse.Namespace) -> int:
         cid = str(args.id)
         s = scoring.compute_score(cid)
         if bool(getattr(args, "json", False)):
-            print(_json_dumps(s.__dict__))
+            print(_json_dumps(asdict(s)))
         else:
             print(f"score: {s.score:.2f} (hit_rate={s.hit_rate:.2%}, submitted={s.signals_submitted}, accepted={s.signals_accepted}, streak={s.streak})")
         return 0
@@ -887,7 +886,7 @@ def _cmd_contributors(ctx: CliContext, args: argparse.Namespace) -> int:
         limit = int(getattr(args, "limit", 20) or 20)
         items = scoring.leaderboard(limit=limit)
         if bool(getattr(args, "json", False)):
-            print(_json_dumps([s.__dict__ for s in items]))
+            print(_json_dumps([asdict(s) for s in items]))
             return 0
 
         rows = []
@@ -976,13 +975,13 @@ def _cmd_eas(ctx: CliContext, args: argparse.Namespace) -> int:
         try:
             from engine.integrations.eas import EASClient
 
-            client = EASClient(
+            with EASClient(
                 rpc_url=str(config.eas.rpc_url),
                 eas_address=str(config.eas.eas_contract),
                 schema_registry_address=str(config.eas.schema_registry),
                 private_key="",  # not required for verify
-            )
-            ok = bool(client.verify_offchain_attestation(found))
+            ) as client:
+                ok = bool(client.verify_offchain_attestation(found))
         except Exception as e:
             out = {"ok": False, "uid": uid, "error": str(e)}
             print(_json_dumps(out))
@@ -1040,7 +1039,7 @@ def _cmd_webhooks(ctx: CliContext, args: argparse.Namespace) -> int:
     if cmd == "list":
         subs = list_webhook_subscriptions(db)
         if bool(getattr(args, "json", False)):
-            print(_json_dumps([s.__dict__ for s in subs]))
+            print(_json_dumps([asdict(s) for s in subs]))
             return 0
 
         rows: list[list[str]] = []
@@ -1403,7 +1402,8 @@ def _identity_forge(ctx: CliContext, args: argparse.Namespace) -> int:
     import time
 
     use_json = bool(getattr(args, "json", False))
-    threads = int(getattr(args, "threads", None) or (os.cpu_count() or 4))
+    threads_arg = getattr(args, "threads", None)
+    threads = int(threads_arg or (os.cpu_count() or 4))
     prefix = "b1e55ed"
 
     # Expected candidates for 7 hex chars
@@ -1479,7 +1479,8 @@ def _identity_forge(ctx: CliContext, args: argparse.Namespace) -> int:
 
         from engine.integrations.forge import grind
 
-        for msg in grind(prefix):
+        # The Python fallback only goes multi-process when --threads is given explicitly.
+        for msg in grind(prefix, workers=int(threads_arg or 1)):
             if msg.get("type") == "progress" and use_json:
                 print(_json_dumps(msg))
             elif msg.get("type") == "progress" and not use_json:
@@ -1521,25 +1522,25 @@ def _identity_forge(ctx: CliContext, args: argparse.Namespace) -> int:
         if config and bool(config.eas.enabled):
             from engine.integrations.eas import AttestationData, EASClient
 
-            eas = EASClient(
+            with EASClient(
                 rpc_url=config.eas.rpc_url,
                 eas_address=config.eas.eas_contract,
                 schema_registry_address=config.eas.schema_registry,
                 private_key=config.eas.attester_private_key,
-            )
-            att = eas.create_offchain_attestation(
-                AttestationData(
-                    schema_uid=config.eas.schema_uid,
-                    recipient=address,
-                    data={
-                        "nodeId": identity_data["node_id"],
-                        "name": "",
-                        "role": "operator",
-                        "version": "1.0.0-beta.2",
-                        "registeredAt": identity_data["forged_at"],
-                    },
+            ) as eas:
+                att = eas.create_offchain_attestation(
+                    AttestationData(
+                        schema_uid=config.eas.schema_uid,
+                        recipient=address,
+                        data={
+                            "nodeId": identity_data["node_id"],
+                            "name": "",
+                            "role": "operator",
+                            "version": "1.0.0-beta.2",
+                            "registeredAt": identity_data["forged_at"],
+                        },
+                    )
                 )
-            )
             if att:
                 attestation_uid = str(att.get("uid") or "pending")
     except Exception:  # noqa: BLE001
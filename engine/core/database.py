@@ -8,17 +8,19 @@ If you cannot remember the past, you will repeat it.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import threading
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from engine.core.events import EventType, canonical_json
+from engine.core.events import EventType, canonical_json, canonical_json_bytes
 from engine.core.exceptions import DedupeConflictError, EventStoreError
 from engine.core.models import Event, compute_event_hash
 
@@ -144,7 +146,11 @@ CREATE TABLE IF NOT EXISTS positions (
     max_favorable_during REAL
 );
 
-CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
+-- (status, asset, opened_at) serves status-only filters as a prefix, and the
+-- latest-open-position-per-asset lookup without a sort.
+DROP INDEX IF EXISTS idx_positions_status;
+CREATE INDEX IF NOT EXISTS idx_positions_status_asset ON positions(status, asset, opened_at);
+CREATE INDEX IF NOT EXISTS idx_positions_realized ON positions(status, realized_pnl) WHERE status = 'closed' AND realized_pnl IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_positions_asset ON positions(asset);
 
 -- ============================================================
@@ -201,7 +207,11 @@ CREATE TABLE IF NOT EXISTS karma_intents (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_karma_intents_settled ON karma_intents(settled);
+-- Every query filters on settled = 0: a partial index stays small as intents
+-- settle and also serves the created_at ordering. It supersedes the full
+-- idx_karma_intents_settled index, which the planner would otherwise prefer.
+DROP INDEX IF EXISTS idx_karma_intents_settled;
+CREATE INDEX IF NOT EXISTS idx_karma_intents_pending ON karma_intents(created_at) WHERE settled = 0;
 
 -- ============================================================
 -- Karma Settlements
@@ -272,6 +282,7 @@ CREATE TABLE IF NOT EXISTS learning_weights (
 );
 
 CREATE INDEX IF NOT EXISTS idx_learning_weights_ts ON learning_weights(ts);
+CREATE INDEX IF NOT EXISTS idx_learning_weights_cycle_ts ON learning_weights(cycle_type, ts);
 
 -- ============================================================
 -- Producer Scores (learning data)
@@ -343,7 +354,10 @@ CREATE TABLE IF NOT EXISTS webhook_subscriptions (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_enabled ON webhook_subscriptions(enabled);
+-- Covers the per-event dispatch lookup (enabled rows in id order); supersedes
+-- the full idx_webhook_subscriptions_enabled index.
+DROP INDEX IF EXISTS idx_webhook_subscriptions_enabled;
+CREATE INDEX IF NOT EXISTS idx_webhook_subscriptions_active ON webhook_subscriptions(id, event_globs, url) WHERE enabled = 1;
 
 -- ============================================================
 -- Contributors + Attribution
@@ -369,11 +383,13 @@ CREATE TABLE IF NOT EXISTS contributor_signals (
     accepted INTEGER DEFAULT 0,
     profitable INTEGER DEFAULT NULL,
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    created_at_ts INTEGER,
     FOREIGN KEY (contributor_id) REFERENCES contributors(id)
 );
 
 CREATE INDEX IF NOT EXISTS idx_contrib_signals_contributor ON contributor_signals(contributor_id);
 CREATE INDEX IF NOT EXISTS idx_contrib_signals_asset ON contributor_signals(signal_asset);
+CREATE INDEX IF NOT EXISTS idx_contrib_signals_contributor_created ON contributor_signals(contributor_id, created_at);
 """
 
 
@@ -397,6 +413,24 @@ def _iso_to_dt(value: str | None) -> datetime | None:
     return dt.astimezone(UTC)
 
 
+# Hot-path statements as single module-level strings, so every call hits the
+# connection's prepared-statement cache with the same key.
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events (id, type, ts, observed_at, source, contributor_id, trace_id, schema_version, dedupe_key, payload, prev_hash, hash)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Room for every distinct statement the engine issues; the default (128) lets
+# the long tail of dashboard/API queries evict the write path.
+_CACHED_STATEMENTS = 512
+
+# Position quantity (units of the asset) as stored in positions.qty. Generated
+# columns need SQLite 3.31+; older builds get the expression inlined instead.
+_POSITION_QTY_EXPR = "CASE WHEN entry_price > 0 THEN size_notional / entry_price ELSE 0.0 END"
+_HAS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+POSITION_QTY_SQL = "qty" if _HAS_GENERATED_COLUMNS else f"({_POSITION_QTY_EXPR})"
+
+
 @dataclass
 class Database:
     """Event-sourced SQLite database with hash chain."""
@@ -406,24 +440,155 @@ class Database:
     def __post_init__(self) -> None:
         self.db_path = Path(self.db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
         self.conn.row_factory = sqlite3.Row
         self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._tx_created: list[Event] = []
+        self._sp_seq = 0
+        self._register_functions()
         self._init_schema()
         self._last_hash = self._get_last_hash()
 
     def close(self) -> None:
         self.conn.close()
 
+    def _register_functions(self) -> None:
+        from engine.core.webhooks import sql_event_matches
+
+        self.conn.create_function("event_matches", 2, sql_event_matches, deterministic=True)
+
     def _init_schema(self) -> None:
         with self.conn:
             self.conn.executescript(SCHEMA)
             self.conn.execute("PRAGMA journal_mode=WAL")
             self.conn.execute("PRAGMA synchronous=NORMAL")
             self.conn.execute("PRAGMA foreign_keys=ON")
+            # Sorts/temp b-trees stay in RAM; reads go through a 256 MiB mmap window.
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA mmap_size=268435456")
 
         # Lightweight migrations for additive columns (SQLite-friendly).
         self._ensure_column("events", "contributor_id", "TEXT")
+        self._ensure_contributor_signal_epoch()
+        self._ensure_contributor_daily_signals()
+        self._ensure_position_qty()
+
+    def _ensure_position_qty(self) -> None:
+        """Expose positions.qty as a virtual generated column (computed on read, nothing stored)."""
+
+        if not _HAS_GENERATED_COLUMNS:  # pragma: no cover - SQLite < 3.31
+            return
+        # table_info hides generated columns; table_xinfo lists them.
+        cols = {str(r[1]) for r in self.conn.execute("PRAGMA table_xinfo(positions)").fetchall()}
+        if "qty" in cols:
+            return
+        with self.conn:
+            self.conn.execute(f"ALTER TABLE positions ADD COLUMN qty REAL GENERATED ALWAYS AS ({_POSITION_QTY_EXPR}) VIRTUAL")
+
+    def _ensure_contributor_signal_epoch(self) -> None:
+        """Maintain contributor_signals.created_at_ts (epoch seconds) alongside created_at.
+
+        Writers only set created_at (or take its default); a trigger fills the
+        integer column so time-window queries compare and index integers.
+        """
+
+        self._ensure_column("contributor_signals", "created_at_ts", "INTEGER")
+        with self.conn:
+            self.conn.execute("UPDATE contributor_signals SET created_at_ts = CAST(strftime('%s', created_at) AS INTEGER) WHERE created_at_ts IS NULL")
+            self.conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_contrib_signals_created_at_ts
+                AFTER INSERT ON contributor_signals
+                WHEN NEW.created_at_ts IS NULL
+                BEGIN
+                    UPDATE contributor_signals
+                    SET created_at_ts = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+                    WHERE id = NEW.id;
+                END
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_contrib_signals_contributor_ts ON contributor_signals(contributor_id, created_at_ts)")
+
+    def _ensure_contributor_daily_signals(self) -> None:
+        """Materialize per-contributor active days for streak lookups.
+
+        ``day`` is the UTC day number (epoch seconds // 86400), so consecutive
+        days differ by exactly 1.
+
+        Kept in sync by insert/update/delete triggers on contributor_signals;
+        backfilled once when the table is first created. Rows whose
+        ``created_at`` does not parse as a timestamp have no day and are skipped.
+        """
+
+        exists = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contributor_daily_signals'").fetchone()
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS contributor_daily_signals (
+                    contributor_id TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    signal_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (contributor_id, day)
+                ) WITHOUT ROWID
+                """
+            )
+            if exists is None:
+                self.conn.execute(
+                    """
+                    INSERT INTO contributor_daily_signals (contributor_id, day, signal_count)
+                    SELECT contributor_id, CAST(strftime('%s', created_at) AS INTEGER) / 86400 AS day, COUNT(1)
+                    FROM contributor_signals
+                    WHERE strftime('%s', created_at) IS NOT NULL
+                    GROUP BY contributor_id, day
+                    """
+                )
+            # Recreate the insert/delete triggers so databases that already have
+            # the unguarded versions pick up the WHEN clauses.
+            self.conn.execute("DROP TRIGGER IF EXISTS trg_contrib_signals_daily_insert")
+            self.conn.execute("DROP TRIGGER IF EXISTS trg_contrib_signals_daily_delete")
+            self.conn.execute(
+                """
+                CREATE TRIGGER trg_contrib_signals_daily_insert
+                AFTER INSERT ON contributor_signals
+                WHEN strftime('%s', NEW.created_at) IS NOT NULL
+                BEGIN
+                    INSERT INTO contributor_daily_signals (contributor_id, day, signal_count)
+                    VALUES (NEW.contributor_id, CAST(strftime('%s', NEW.created_at) AS INTEGER) / 86400, 1)
+                    ON CONFLICT (contributor_id, day) DO UPDATE SET signal_count = signal_count + 1;
+                END
+                """
+            )
+            self.conn.execute(
+                """
+                CREATE TRIGGER trg_contrib_signals_daily_delete
+                AFTER DELETE ON contributor_signals
+                WHEN strftime('%s', OLD.created_at) IS NOT NULL
+                BEGIN
+                    UPDATE contributor_daily_signals SET signal_count = signal_count - 1
+                    WHERE contributor_id = OLD.contributor_id AND day = CAST(strftime('%s', OLD.created_at) AS INTEGER) / 86400;
+                    DELETE FROM contributor_daily_signals
+                    WHERE contributor_id = OLD.contributor_id AND signal_count <= 0;
+                END
+                """
+            )
+            self.conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_contrib_signals_daily_update
+                AFTER UPDATE OF created_at, contributor_id ON contributor_signals
+                BEGIN
+                    UPDATE contributor_daily_signals SET signal_count = signal_count - 1
+                    WHERE strftime('%s', OLD.created_at) IS NOT NULL
+                      AND contributor_id = OLD.contributor_id AND day = CAST(strftime('%s', OLD.created_at) AS INTEGER) / 86400;
+                    DELETE FROM contributor_daily_signals
+                    WHERE contributor_id = OLD.contributor_id AND signal_count <= 0;
+                    INSERT INTO contributor_daily_signals (contributor_id, day, signal_count)
+                    SELECT NEW.contributor_id, CAST(strftime('%s', NEW.created_at) AS INTEGER) / 86400, 1
+                    WHERE strftime('%s', NEW.created_at) IS NOT NULL
+                    ON CONFLICT (contributor_id, day) DO UPDATE SET signal_count = signal_count + 1;
+                END
+                """
+            )
 
     def _ensure_column(self, table: str, column: str, column_type: str) -> None:
         cols = [str(r[1]) for r in self.conn.execute(f"PRAGMA table_info({table})").fetchall()]
@@ -432,15 +597,84 @@ class Database:
         with self.conn:
             self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into one atomic commit.
+
+        Holds the write lock for the duration. Event appends and nested
+        ``transaction()`` blocks inside run under a SAVEPOINT of this
+        transaction: if one fails, only its own writes are rolled back, and
+        the outer block decides whether to commit the rest. Webhooks fire once
+        the outer block commits.
+        """
+
+        with self._lock:
+            if self._tx_depth:
+                prev_last = self._last_hash
+                n_created = len(self._tx_created)
+                self._tx_depth += 1
+                try:
+                    with self._savepoint():
+                        yield self.conn
+                except BaseException:
+                    self._last_hash = prev_last
+                    del self._tx_created[n_created:]
+                    raise
+                finally:
+                    self._tx_depth -= 1
+                return
+
+            prev_last = self._last_hash
+            self._tx_depth = 1
+            try:
+                with self.conn:
+                    # Open the transaction explicitly so an inner RELEASE does
+                    # not commit it on its own.
+                    if not self.conn.in_transaction:
+                        self.conn.execute("BEGIN")
+                    yield self.conn
+            except BaseException:
+                self._last_hash = prev_last
+                self._tx_created = []
+                raise
+            finally:
+                self._tx_depth = 0
+            created, self._tx_created = self._tx_created, []
+
+        self._dispatch_webhooks(created)
+
+    @contextmanager
+    def _savepoint(self) -> Iterator[None]:
+        # Caller holds ``_lock`` inside an open transaction().
+        self._sp_seq += 1
+        name = f"sp_{self._sp_seq}"
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute(f"ROLLBACK TO {name}")
+            self.conn.execute(f"RELEASE {name}")
+            raise
+        self.conn.execute(f"RELEASE {name}")
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        # Commit on exit, or roll back to a savepoint inside an enclosing
+        # transaction() so a caught failure leaves no partial rows behind.
+        if self._tx_depth:
+            with self._savepoint():
+                yield
+        else:
+            with self.conn:
+                yield
+
     def _get_last_hash(self) -> str | None:
         row = self.conn.execute("SELECT hash FROM events ORDER BY created_at DESC, rowid DESC LIMIT 1").fetchone()
         return None if row is None else str(row[0])
 
     @staticmethod
     def _payload_hash(payload: dict[str, Any]) -> str:
-        import hashlib
-
-        return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+        return hashlib.sha256(canonical_json_bytes(payload)).hexdigest()
 
     def append_event(
         self,
@@ -465,119 +699,197 @@ class Database:
         """
 
         with self._lock:
-            now = ts or datetime.now(tz=UTC)
-            if now.tzinfo is None:
-                now = now.replace(tzinfo=UTC)
-
-            payload_canon = json.loads(canonical_json(payload))
-            p_hash = self._payload_hash(payload_canon)
-
-            if dedupe_key is not None:
-                row = self.conn.execute(
-                    "SELECT event_id, payload_hash FROM event_dedup WHERE dedupe_key = ?",
-                    (dedupe_key,),
-                ).fetchone()
-                if row is not None:
-                    if str(row[1]) != p_hash:
-                        raise DedupeConflictError(f"dedupe_key conflict for {dedupe_key}: payload changed")
-                    existing = self.conn.execute(
-                        "SELECT * FROM events WHERE id = ?",
-                        (str(row[0]),),
-                    ).fetchone()
-                    if existing is None:
-                        raise EventStoreError("dedup index points to missing event")
-                    return self._row_to_event(existing)
-
-            eid = event_id or str(uuid.uuid4())
-            prev = self._last_hash
-            h = compute_event_hash(
-                prev_hash=prev,
-                event_type=event_type,
-                payload=payload_canon,
-                ts=now,
-                source=source,
-                trace_id=trace_id,
-                schema_version=schema_version,
-                dedupe_key=dedupe_key,
-                event_id=eid,
-            )
-
+            prev_last = self._last_hash
             try:
-                with self.conn:
-                    self.conn.execute(
-                        """
-                        INSERT INTO events (
-                            id, type, ts, observed_at, source, contributor_id, trace_id, schema_version, dedupe_key,
-                            payload, prev_hash, hash
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            eid,
-                            str(event_type),
-                            _dt_to_iso(now),
-                            _dt_to_iso(observed_at),
-                            source,
-                            contributor_id,
-                            trace_id,
-                            schema_version,
-                            dedupe_key,
-                            canonical_json(payload_canon),
-                            prev,
-                            h,
-                        ),
+                with self._write():
+                    ev, created = self._append_in_tx(
+                        event_type=event_type,
+                        payload=payload,
+                        event_id=event_id,
+                        observed_at=observed_at,
+                        source=source,
+                        contributor_id=contributor_id,
+                        trace_id=trace_id,
+                        schema_version=schema_version,
+                        dedupe_key=dedupe_key,
+                        ts=ts,
                     )
-                    if dedupe_key is not None:
-                        self.conn.execute(
-                            """
-                            INSERT INTO event_dedup (dedupe_key, event_id, payload_hash, created_at)
-                            VALUES (?, ?, ?, datetime('now'))
-                            """,
-                            (dedupe_key, eid, p_hash),
-                        )
             except sqlite3.IntegrityError as e:
+                self._last_hash = prev_last
                 raise EventStoreError(str(e)) from e
+            except Exception:
+                self._last_hash = prev_last
+                raise
+            if created and self._tx_depth:
+                self._tx_created.append(ev)
+                created = False
+
+        if created:
+            self._dispatch_webhooks([ev])
+        return ev
 
-            self._last_hash = h
-            ev = Event(
-                id=eid,
-                type=event_type,
-                ts=now,
-                observed_at=observed_at,
-                source=source,
-                trace_id=trace_id,
-                schema_version=schema_version,
-                dedupe_key=dedupe_key,
-                payload=payload_canon,
-                prev_hash=prev,
-                hash=h,
+    def _append_in_tx(
+        self,
+        *,
+        event_type: EventType,
+        payload: dict[str, Any],
+        event_id: str | None,
+        observed_at: datetime | None,
+        source: str | None,
+        contributor_id: str | None,
+        trace_id: str | None,
+        schema_version: str,
+        dedupe_key: str | None,
+        ts: datetime | None,
+    ) -> tuple[Event, bool]:
+        """Insert one event inside the caller's transaction (caller holds ``_lock``).
+
+        Returns ``(event, created)``; ``created`` is False for idempotent dedupe hits.
+        Advances ``_last_hash``; the caller restores it if the transaction rolls back.
+        """
+
+        now = ts or datetime.now(tz=UTC)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=UTC)
+
+        # Serialize once: canonical JSON is idempotent under loads/dumps, so the
+        # same string serves the payload hash and the stored column.
+        payload_json = canonical_json(payload)
+        payload_canon = json.loads(payload_json)
+        p_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+
+        if dedupe_key is not None:
+            row = self.conn.execute(
+                "SELECT event_id, payload_hash FROM event_dedup WHERE dedupe_key = ?",
+                (dedupe_key,),
+            ).fetchone()
+            if row is not None:
+                if str(row[1]) != p_hash:
+                    raise DedupeConflictError(f"dedupe_key conflict for {dedupe_key}: payload changed")
+                existing = self.conn.execute(
+                    "SELECT * FROM events WHERE id = ?",
+                    (str(row[0]),),
+                ).fetchone()
+                if existing is None:
+                    raise EventStoreError("dedup index points to missing event")
+                return self._row_to_event(existing), False
+
+        eid = event_id or str(uuid.uuid4())
+        prev = self._last_hash
+        h = compute_event_hash(
+            prev_hash=prev,
+            event_type=event_type,
+            payload=payload_canon,
+            ts=now,
+            source=source,
+            trace_id=trace_id,
+            schema_version=schema_version,
+            dedupe_key=dedupe_key,
+            event_id=eid,
+        )
+
+        self.conn.execute(
+            _INSERT_EVENT_SQL,
+            (
+                eid,
+                str(event_type),
+                _dt_to_iso(now),
+                _dt_to_iso(observed_at),
+                source,
+                contributor_id,
+                trace_id,
+                schema_version,
+                dedupe_key,
+                payload_json,
+                prev,
+                h,
+            ),
+        )
+        if dedupe_key is not None:
+            self.conn.execute(
+                """
+                INSERT INTO event_dedup (dedupe_key, event_id, payload_hash, created_at)
+                VALUES (?, ?, ?, datetime('now'))
+                """,
+                (dedupe_key, eid, p_hash),
             )
 
+        self._last_hash = h
+        ev = Event(
+            id=eid,
+            type=event_type,
+            ts=now,
+            observed_at=observed_at,
+            source=source,
+            trace_id=trace_id,
+            schema_version=schema_version,
+            dedupe_key=dedupe_key,
+            payload=payload_canon,
+            prev_hash=prev,
+            hash=h,
+        )
+        return ev, True
+
+    def _dispatch_webhooks(self, events: list[Event]) -> None:
         # Side effects (best-effort): outbound webhooks.
         try:
             from engine.core.webhooks import dispatch_event_webhooks
 
-            dispatch_event_webhooks(self, ev)
+            for ev in events:
+                dispatch_event_webhooks(self, ev)
         except Exception:
             # Never break event persistence on webhook failure.
             pass
 
-        return ev
-
     def append_events_batch(
         self,
         events: Iterable[tuple[EventType, dict[str, Any], str | None]],
         *,
         source: str | None = None,
+        trace_id: str | None = None,
+        observed_at: datetime | None = None,
+        ts: datetime | None = None,
     ) -> list[Event]:
         """Append a batch of events atomically.
 
         Input tuples: (event_type, payload, dedupe_key)
+
+        All events are written in one transaction; if any insert fails, none are kept.
         """
 
         out: list[Event] = []
+        created: list[Event] = []
         with self._lock:
-            for et, payload, dedupe_key in events:
-                out.append(self.append_event(event_type=et, payload=payload, dedupe_key=dedupe_key, source=source))
+            prev_last = self._last_hash
+            try:
+                with self._write():
+                    for et, payload, dedupe_key in events:
+                        ev, is_new = self._append_in_tx(
+                            event_type=et,
+                            payload=payload,
+                            event_id=None,
+                            observed_at=observed_at,
+                            source=source,
+                            contributor_id=None,
+                            trace_id=trace_id,
+                            schema_version="v1",
+                            dedupe_key=dedupe_key,
+                            ts=ts,
+                        )
+                        out.append(ev)
+                        if is_new:
+                            created.append(ev)
+            except sqlite3.IntegrityError as e:
+                self._last_hash = prev_last
+                raise EventStoreError(str(e)) from e
+            except Exception:
+                self._last_hash = prev_last
+                raise
+            if self._tx_depth:
+                self._tx_created.extend(created)
+                created = []
+
+        self._dispatch_webhooks(created)
         return out
 
     def get_events(
@@ -306,17 +306,29 @@ def payload_model_for(event_type: EventType) -> type[BaseModel] | None:
     return _EVENT_PAYLOAD_MODELS.get(event_type)
 
 
+# One shared encoder: ``json.dumps`` with non-default options builds a fresh
+# JSONEncoder per call. The output format is part of the hash chain and must
+# stay byte-identical to ``json.dumps(sort_keys=True, separators=(",", ":"))``.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def canonical_json(data: Any) -> str:
     """Canonical JSON serialization used for hashing and dedupe."""
 
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CANONICAL_ENCODER.encode(data)
+
+
+def canonical_json_bytes(data: Any) -> bytes:
+    """UTF-8 encoded :func:`canonical_json`, ready to feed a hasher."""
+
+    return _CANONICAL_ENCODER.encode(data).encode("utf-8")
 
 
 def payload_hash(payload: BaseModel | dict[str, Any]) -> str:
     """SHA-256 hash of canonical payload JSON."""
 
     obj = payload.model_dump(mode="json") if isinstance(payload, BaseModel) else payload
-    return hashlib.sha256(canonical_json(obj).encode("utf-8")).hexdigest()
+    return hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
 
 
 def compute_dedupe_key(event_type: EventType, payload: BaseModel | dict[str, Any]) -> str:
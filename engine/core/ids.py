@@ -0,0 +1,18 @@
+"""engine.core.ids
+
+Random identifiers for records created on hot paths (orders, karma intents).
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def new_id() -> str:
+    """Random RFC 4122 version-4 id, formatted like ``str(uuid.uuid4())`` without the UUID object."""
+
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
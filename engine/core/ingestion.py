@@ -25,6 +25,7 @@ from pydantic import BaseModel
 
 from engine.core.database import Database
 from engine.core.events import EventType, compute_dedupe_key
+from engine.core.metrics import REGISTRY, MetricsRegistry, ThreadLocalCounter
 from engine.core.models import Event
 
 EventHandler = Callable[[Event], None]
@@ -34,13 +35,30 @@ def _utc_now() -> datetime:
     return datetime.now(tz=UTC)
 
 
+def _payload_dict(payload: BaseModel | dict[str, Any]) -> dict[str, Any]:
+    # Plain dicts pass through by reference: the event store re-materializes the
+    # payload from its canonical JSON, so the caller's dict is never retained.
+    if type(payload) is dict:
+        return payload
+    if isinstance(payload, BaseModel):
+        # JSON mode keeps datetimes/enums encodable by canonical_json.
+        return payload.model_dump(mode="json")
+    return dict(payload)
+
+
 @dataclass
 class AggregationBus:
     """Routes events to registered handlers by type and deduplicates by dedupe_key."""
 
+    metrics: MetricsRegistry = field(default=REGISTRY, repr=False)
     _handlers: dict[str, list[EventHandler]] = field(default_factory=dict)
     _seen_dedupe: set[str] = field(default_factory=set)
-    _lock: threading.RLock = field(default_factory=threading.RLock)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _events_appended: ThreadLocalCounter = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Per-event counter on the publish path; flushed to the shared counter in batches.
+        self._events_appended = self.metrics.local_counter("ingestion.events_appended")
 
     def register_handler(self, event_type: EventType | str, handler: EventHandler) -> None:
         et = str(event_type)
@@ -81,10 +99,53 @@ class AggregationBus:
             dedupe_key=dkey,
             ts=ts or _utc_now(),
         )
+        self._events_appended.inc()
 
         self.route(ev)
         return ev
 
+    def append_and_route_many(
+        self,
+        db: Database,
+        events: list[tuple[EventType, dict[str, Any], str | None]],
+        *,
+        trace_id: str | None = None,
+        source: str | None = None,
+        observed_at: datetime | None = None,
+        ts: datetime | None = None,
+    ) -> list[Event]:
+        """Batch form of :meth:`append_and_route`: one lock acquisition, one DB transaction.
+
+        Input tuples: (event_type, payload, dedupe_key). The batch is rejected as a
+        whole if any dedupe key was already seen or repeats within the batch.
+        """
+
+        dkeys = [dk or compute_dedupe_key(et, payload) for et, payload, dk in events]
+
+        with self._lock:
+            batch_keys: set[str] = set()
+            for dkey in dkeys:
+                if dkey in self._seen_dedupe or dkey in batch_keys:
+                    raise ValueError(f"duplicate dedupe_key rejected by bus: {dkey}")
+                batch_keys.add(dkey)
+            self._seen_dedupe.update(batch_keys)
+
+        out = db.append_events_batch(
+            [(et, payload, dk) for (et, payload, _), dk in zip(events, dkeys, strict=True)],
+            source=source,
+            trace_id=trace_id,
+            observed_at=observed_at,
+            ts=ts or _utc_now(),
+        )
+        self._events_appended.inc(len(out))
+
+        with self._lock:
+            handlers_by_type = {et: list(hs) for et, hs in self._handlers.items()}
+        for ev in out:
+            for h in handlers_by_type.get(str(ev.type), ()):
+                h(ev)
+        return out
+
 
 @dataclass
 class EventPublisher:
@@ -105,14 +166,34 @@ class EventPublisher:
         observed_at: datetime | None = None,
         ts: datetime | None = None,
     ) -> Event:
-        obj = payload.model_dump(mode="json") if isinstance(payload, BaseModel) else dict(payload)
         return self.bus.append_and_route(
             self.db,
             event_type=event_type,
-            payload=obj,
+            payload=_payload_dict(payload),
             trace_id=trace_id,
             source=source or self.default_source,
             observed_at=observed_at,
             dedupe_key=dedupe_key,
             ts=ts,
         )
+
+    def publish_many(
+        self,
+        events: list[tuple[EventType, BaseModel | dict[str, Any]]],
+        *,
+        trace_id: str | None = None,
+        source: str | None = None,
+        observed_at: datetime | None = None,
+        ts: datetime | None = None,
+    ) -> list[Event]:
+        """Publish a burst of events in one bus/DB round-trip."""
+
+        batch: list[tuple[EventType, dict[str, Any], str | None]] = [(et, _payload_dict(payload), None) for et, payload in events]
+        return self.bus.append_and_route_many(
+            self.db,
+            batch,
+            trace_id=trace_id,
+            source=source or self.default_source,
+            observed_at=observed_at,
+            ts=ts,
+        )
@@ -7,6 +7,7 @@ No Prometheus dependency here. Just a stable interface that can be wired later.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from threading import Lock
 
@@ -43,23 +44,115 @@ class Gauge:
             return float(self._value)
 
 
+class _LocalCell:
+    __slots__ = ("pending", "n", "thread")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.pending = 0.0
+        self.n = 0
+        self.thread = thread
+
+
+class ThreadLocalCounter:
+    """Counter for hot paths: increments accumulate per thread, unsynchronized.
+
+    Every ``flush_every`` increments a thread adds its delta to the shared
+    :class:`Counter`, so the registry snapshot lags by at most that many
+    increments per thread. ``value`` flushes the calling thread and includes
+    the (best-effort) pending deltas of other threads.
+
+    Cells of threads that have exited are folded into the shared counter and
+    dropped whenever a new thread registers or ``value`` is read.
+    """
+
+    def __init__(self, target: Counter, *, flush_every: int = 1024) -> None:
+        self.name = target.name
+        self._target = target
+        self._flush_every = max(1, int(flush_every))
+        self._local = threading.local()
+        self._cells_lock = Lock()
+        self._cells: list[_LocalCell] = []
+
+    def _cell(self) -> _LocalCell:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = _LocalCell(threading.current_thread())
+            self._local.cell = cell
+            with self._cells_lock:
+                self._prune_dead()
+                self._cells.append(cell)
+        return cell
+
+    def _prune_dead(self) -> None:
+        # Caller holds _cells_lock. A dead thread can no longer touch its cell.
+        live: list[_LocalCell] = []
+        for cell in self._cells:
+            if cell.thread.is_alive():
+                live.append(cell)
+            else:
+                self._flush_cell(cell)
+        self._cells = live
+
+    def inc(self, amount: float = 1.0) -> None:
+        cell = self._cell()
+        cell.pending += amount
+        cell.n += 1
+        if cell.n >= self._flush_every:
+            self._flush_cell(cell)
+
+    def _flush_cell(self, cell: _LocalCell) -> None:
+        delta = cell.pending
+        cell.pending = 0.0
+        cell.n = 0
+        if delta:
+            self._target.inc(delta)
+
+    def flush(self) -> None:
+        """Push the calling thread's pending delta to the shared counter."""
+
+        self._flush_cell(self._cell())
+
+    @property
+    def value(self) -> float:
+        self.flush()
+        with self._cells_lock:
+            self._prune_dead()
+            pending = sum(c.pending for c in self._cells)
+        return self._target.value + pending
+
+
 class MetricsRegistry:
     def __init__(self) -> None:
         self._lock = Lock()
         self._counters: dict[str, Counter] = {}
         self._gauges: dict[str, Gauge] = {}
+        self._local_counters: dict[str, ThreadLocalCounter] = {}
 
     def counter(self, name: str) -> Counter:
+        # Double-checked: dict reads are atomic under the GIL, so the common
+        # cache hit skips the lock entirely.
+        c = self._counters.get(name)
+        if c is not None:
+            return c
+        with self._lock:
+            return self._counters.setdefault(name, Counter(name=name))
+
+    def local_counter(self, name: str, *, flush_every: int = 1024) -> ThreadLocalCounter:
+        """Thread-local front for ``counter(name)``; see :class:`ThreadLocalCounter`."""
+
+        lc = self._local_counters.get(name)
+        if lc is not None:
+            return lc
+        target = self.counter(name)
         with self._lock:
-            if name not in self._counters:
-                self._counters[name] = Counter(name=name)
-            return self._counters[name]
+            return self._local_counters.setdefault(name, ThreadLocalCounter(target, flush_every=flush_every))
 
     def gauge(self, name: str) -> Gauge:
+        g = self._gauges.get(name)
+        if g is not None:
+            return g
         with self._lock:
-            if name not in self._gauges:
-                self._gauges[name] = Gauge(name=name)
-            return self._gauges[name]
+            return self._gauges.setdefault(name, Gauge(name=name))
 
     def snapshot(self) -> dict[str, float]:
         with self._lock:
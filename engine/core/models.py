@@ -7,13 +7,14 @@ The event envelope is immutable. The system's memory is append-only.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel
 
-from engine.core.events import EventType, canonical_json
+from engine.core.events import EventType, canonical_json_bytes
 
 
 class Event(BaseModel):
@@ -34,6 +35,14 @@ class Event(BaseModel):
     model_config = {"frozen": True}
 
 
+_SEP = b"|"
+
+
+@functools.cache
+def _event_type_bytes(event_type: EventType) -> bytes:
+    return str(event_type).encode("utf-8")
+
+
 def compute_event_hash(
     *,
     prev_hash: str | None,
@@ -58,17 +67,19 @@ def compute_event_hash(
     All fields are deterministic and tamper-evident.
     """
 
-    # Canonical header fields (deterministic order)
-    header_parts = [
-        prev_hash or "",
-        ts.isoformat(),
-        event_id,
-        str(event_type),
-        schema_version,
-        source or "",
-        trace_id or "",
-        dedupe_key or "",
-    ]
-
-    data = "|".join(header_parts) + "|" + canonical_json(payload)
-    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+    # Canonical header fields (deterministic order), fed straight to the hasher.
+    h = hashlib.sha256()
+    for part in (
+        (prev_hash or "").encode("utf-8"),
+        ts.isoformat().encode("utf-8"),
+        event_id.encode("utf-8"),
+        _event_type_bytes(event_type),
+        schema_version.encode("utf-8"),
+        (source or "").encode("utf-8"),
+        (trace_id or "").encode("utf-8"),
+        (dedupe_key or "").encode("utf-8"),
+    ):
+        h.update(part)
+        h.update(_SEP)
+    h.update(canonical_json_bytes(payload))
+    return h.hexdigest()
@@ -8,7 +8,7 @@ The rules exist to protect you from yourself.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 
 
@@ -39,11 +39,32 @@ class PolicyState:
     day: date | None = None
     realized_pnl_usd: float = 0.0
 
+    # Unix-epoch bounds of ``day`` so the hot path compares floats instead of
+    # allocating a ``date`` per check.
+    _day_start_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+    _day_end_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # A state restored with ``day`` set keeps its PnL until that day ends.
+        if self.day is not None:
+            self._set_day_bounds(self.day)
+
+    def _set_day_bounds(self, d: date) -> None:
+        start = datetime.combine(d, time.min, UTC)
+        self._day_start_ts = start.timestamp()
+        self._day_end_ts = (start + timedelta(days=1)).timestamp()
+
     def _ensure_today(self, now: datetime) -> None:
-        d = now.date()
-        if self.day != d:
-            self.day = d
-            self.realized_pnl_usd = 0.0
+        ts = now.timestamp()
+        if self._day_start_ts <= ts < self._day_end_ts:
+            return
+        self._roll_day(now)
+
+    def _roll_day(self, now: datetime) -> None:
+        d = now.astimezone(UTC).date()
+        self.day = d
+        self.realized_pnl_usd = 0.0
+        self._set_day_bounds(d)
 
     def record_pnl(self, pnl_usd: float, *, now: datetime | None = None) -> None:
         n = now or datetime.now(tz=UTC)
@@ -64,6 +85,11 @@ class PolicyState:
 class TradingPolicyEngine:
     policy: TradingPolicy
     state: PolicyState = field(default_factory=PolicyState)
+    _max_position_size_pct: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # TradingPolicy is frozen, so the coerced limit can be computed once.
+        self._max_position_size_pct = float(self.policy.max_position_size_pct)
 
     def check_kill_switch(self, *, level: int = 0) -> None:
         if self.policy.kill_switch_enabled and int(level) > 0:
@@ -81,7 +107,7 @@ class TradingPolicyEngine:
         equity = float(equity_usd)
         if equity <= 0:
             return
-        max_allowed = equity * float(self.policy.max_position_size_pct)
+        max_allowed = equity * self._max_position_size_pct
         if float(position_notional_usd) > max_allowed:
             raise PolicyViolation(
                 "position_size_limit",
@@ -11,61 +11,130 @@ The map is not the territory, but a good projection comes close.
 from __future__ import annotations
 
 import threading
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from engine.core.events import EventType
 from engine.core.models import Event
 
+EventHandler = Callable[[Event], None]
+
 
 class Projector:
-    def handle(self, event: Event) -> None: ...
+    """Base projector.
+
+    Subclasses declare the event types they consume (``event_types``) and
+    optionally a payload key (``fallback_key``) that routes events of any
+    other type to ``handle_fallback``. :class:`ProjectionManager` resolves
+    both at registration time, so projectors are never called for events
+    they would ignore.
+    """
+
+    event_types: ClassVar[frozenset[EventType]] = frozenset()
+    fallback_key: ClassVar[str | None] = None
+
+    def handle_typed(self, event: Event) -> None: ...
+
+    def handle_fallback(self, event: Event) -> None:
+        self.handle_typed(event)
+
+    def handle(self, event: Event) -> None:
+        if event.type in self.event_types:
+            self.handle_typed(event)
+        elif self.fallback_key is not None and self.fallback_key in event.payload:
+            self.handle_fallback(event)
 
     def get_state(self) -> dict[str, Any]: ...
 
 
 @dataclass
 class OutcomesProjector(Projector):
-    """Tracks trade outcomes (closed positions)."""
+    """Tracks trade outcomes (closed positions).
 
-    outcomes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    Stored column-wise (one list per field, indexed via ``_idx``) so scans
+    over a single field do not touch every row.
+    """
 
-    def handle(self, event: Event) -> None:
-        if event.type != EventType.POSITION_CLOSED_V1 and "realized_pnl" not in event.payload:
-            return
+    event_types: ClassVar[frozenset[EventType]] = frozenset({EventType.POSITION_CLOSED_V1})
+    fallback_key: ClassVar[str | None] = "realized_pnl"
+
+    pids: list[str] = field(default_factory=list)
+    symbols: list[str] = field(default_factory=list)
+    realized_pnl: list[Any] = field(default_factory=list)
+    realized_pnl_pct: list[Any] = field(default_factory=list)
+    exit_reason: list[Any] = field(default_factory=list)
+    event_ids: list[str] = field(default_factory=list)
+    ts: list[datetime] = field(default_factory=list)
+    _idx: dict[str, int] = field(default_factory=dict)
 
+    def handle_typed(self, event: Event) -> None:
         pid = str(event.payload.get("position_id") or "")
         symbol = str(event.payload.get("symbol") or event.payload.get("asset") or "").upper()
         if not pid or not symbol:
             return
 
-        self.outcomes[pid] = {
-            "position_id": pid,
-            "symbol": symbol,
-            "realized_pnl": event.payload.get("realized_pnl"),
-            "realized_pnl_pct": event.payload.get("realized_pnl_pct"),
-            "exit_reason": event.payload.get("exit_reason"),
-            "event_id": event.id,
-            "ts": event.ts,
-        }
+        row = (
+            pid,
+            symbol,
+            event.payload.get("realized_pnl"),
+            event.payload.get("realized_pnl_pct"),
+            event.payload.get("exit_reason"),
+            event.id,
+            event.ts,
+        )
+        cols: tuple[list[Any], ...] = (self.pids, self.symbols, self.realized_pnl, self.realized_pnl_pct, self.exit_reason, self.event_ids, self.ts)
+        i = self._idx.get(pid)
+        if i is None:
+            self._idx[pid] = len(self.pids)
+            for col, v in zip(cols, row, strict=True):
+                col.append(v)
+        else:
+            for col, v in zip(cols, row, strict=True):
+                col[i] = v
+
+    def position_ids_for(self, symbol: str) -> list[str]:
+        sym = str(symbol).upper()
+        return [pid for pid, s in zip(self.pids, self.symbols, strict=True) if s == sym]
 
     def get_state(self) -> dict[str, Any]:
-        return {"outcomes": dict(self.outcomes)}
+        return {
+            "outcomes": {
+                pid: {
+                    "position_id": pid,
+                    "symbol": symbol,
+                    "realized_pnl": pnl,
+                    "realized_pnl_pct": pnl_pct,
+                    "exit_reason": reason,
+                    "event_id": eid,
+                    "ts": ts,
+                }
+                for pid, symbol, pnl, pnl_pct, reason, eid, ts in zip(
+                    self.pids,
+                    self.symbols,
+                    self.realized_pnl,
+                    self.realized_pnl_pct,
+                    self.exit_reason,
+                    self.event_ids,
+                    self.ts,
+                    strict=True,
+                )
+            }
+        }
 
 
 @dataclass
 class PositionConvictionProjector(Projector):
     """Links positions to conviction scores."""
 
+    event_types: ClassVar[frozenset[EventType]] = frozenset({EventType.CONVICTION_V1})
+    fallback_key: ClassVar[str | None] = "commitment_hash"
+
     latest_by_symbol: dict[str, dict[str, Any]] = field(default_factory=dict)
     by_position: dict[str, dict[str, Any]] = field(default_factory=dict)
 
-    def handle(self, event: Event) -> None:
-        if event.type != EventType.CONVICTION_V1 and "commitment_hash" not in event.payload:
-            return
-
+    def handle_typed(self, event: Event) -> None:
         symbol = str(event.payload.get("symbol") or "").upper()
         if not symbol:
             return
@@ -94,15 +163,24 @@ class PositionConvictionProjector(Projector):
 
 @dataclass
 class PositionStateProjector(Projector):
-    """Position lifecycle (open → monitoring → closing → closed)."""
+    """Position lifecycle (open → monitoring → closing → closed).
 
-    positions: dict[str, dict[str, Any]] = field(default_factory=dict)
+    Stored column-wise like :class:`OutcomesProjector`.
+    """
 
-    def handle(self, event: Event) -> None:
-        if event.type not in {EventType.POSITION_OPENED_V1, EventType.POSITION_UPDATED_V1, EventType.POSITION_CLOSED_V1}:
-            if "position_id" not in event.payload:
-                return
+    event_types: ClassVar[frozenset[EventType]] = frozenset({EventType.POSITION_OPENED_V1, EventType.POSITION_UPDATED_V1, EventType.POSITION_CLOSED_V1})
+    fallback_key: ClassVar[str | None] = "position_id"
 
+    pids: list[str] = field(default_factory=list)
+    symbols: list[str | None] = field(default_factory=list)
+    status: list[str] = field(default_factory=list)
+    opened_at: list[datetime | None] = field(default_factory=list)
+    closed_at: list[datetime | None] = field(default_factory=list)
+    last_event_id: list[str] = field(default_factory=list)
+    last_ts: list[datetime] = field(default_factory=list)
+    _idx: dict[str, int] = field(default_factory=dict)
+
+    def handle_typed(self, event: Event) -> None:
         pid = str(event.payload.get("position_id") or "")
         if not pid:
             return
@@ -116,41 +194,70 @@ class PositionStateProjector(Projector):
                 EventType.POSITION_CLOSED_V1: "closed",
             }.get(event.type, "unknown")
 
-        prev = self.positions.get(pid) or {}
-
-        opened_at = prev.get("opened_at")
-        if opened_at is None and event.type == EventType.POSITION_OPENED_V1:
-            opened_at = event.ts
+        i = self._idx.get(pid)
+        if i is None:
+            opened_at = event.ts if event.type == EventType.POSITION_OPENED_V1 else None
+            closed_at = event.ts if event.type == EventType.POSITION_CLOSED_V1 else None
+            self._idx[pid] = len(self.pids)
+            self.pids.append(pid)
+            self.symbols.append(symbol)
+            self.status.append(status)
+            self.opened_at.append(opened_at)
+            self.closed_at.append(closed_at)
+            self.last_event_id.append(event.id)
+            self.last_ts.append(event.ts)
+            return
 
-        closed_at = prev.get("closed_at")
+        if self.opened_at[i] is None and event.type == EventType.POSITION_OPENED_V1:
+            self.opened_at[i] = event.ts
         if event.type == EventType.POSITION_CLOSED_V1:
-            closed_at = event.ts
-
-        self.positions[pid] = {
-            "position_id": pid,
-            "symbol": symbol or prev.get("symbol"),
-            "status": status,
-            "opened_at": opened_at,
-            "closed_at": closed_at,
-            "last_event_id": event.id,
-            "last_ts": event.ts,
-        }
+            self.closed_at[i] = event.ts
+        if symbol:
+            self.symbols[i] = symbol
+        self.status[i] = status
+        self.last_event_id[i] = event.id
+        self.last_ts[i] = event.ts
+
+    def position_ids_with_status(self, status: str) -> list[str]:
+        return [pid for pid, st in zip(self.pids, self.status, strict=True) if st == status]
 
     def get_state(self) -> dict[str, Any]:
-        return {"positions": dict(self.positions)}
+        return {
+            "positions": {
+                pid: {
+                    "position_id": pid,
+                    "symbol": symbol,
+                    "status": status,
+                    "opened_at": opened_at,
+                    "closed_at": closed_at,
+                    "last_event_id": last_event_id,
+                    "last_ts": last_ts,
+                }
+                for pid, symbol, status, opened_at, closed_at, last_event_id, last_ts in zip(
+                    self.pids,
+                    self.symbols,
+                    self.status,
+                    self.opened_at,
+                    self.closed_at,
+                    self.last_event_id,
+                    self.last_ts,
+                    strict=True,
+                )
+            }
+        }
 
 
 @dataclass
 class RegimeStateProjector(Projector):
     """Current market regime."""
 
+    event_types: ClassVar[frozenset[EventType]] = frozenset({EventType.REGIME_CHANGE_V1})
+    fallback_key: ClassVar[str | None] = "regime"
+
     current: dict[str, Any] | None = None
     history: list[dict[str, Any]] = field(default_factory=list)
 
-    def handle(self, event: Event) -> None:
-        if event.type != EventType.REGIME_CHANGE_V1 and "regime" not in event.payload:
-            return
-
+    def handle_typed(self, event: Event) -> None:
         regime = str(event.payload.get("regime") or "").strip() or "TRANSITION"
         row = {"regime": regime, "ts": event.ts, "event_id": event.id}
         self.current = row
@@ -164,12 +271,11 @@ class RegimeStateProjector(Projector):
 class SignalsLatestProjector(Projector):
     """Latest signal per type per symbol."""
 
-    _latest: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    event_types: ClassVar[frozenset[EventType]] = frozenset(et for et in EventType if et.startswith("signal."))
 
-    def handle(self, event: Event) -> None:
-        if not str(event.type).startswith("signal."):
-            return
+    _latest: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
 
+    def handle_typed(self, event: Event) -> None:
         symbol = str(event.payload.get("symbol") or "").upper()
         if not symbol:
             return
@@ -207,7 +313,10 @@ class ProjectionManager:
     """Orchestrates projectors and supports rebuild from event replay."""
 
     def __init__(self) -> None:
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
         self.projectors: list[Projector] = [
             SignalsLatestProjector(),
             RegimeStateProjector(),
@@ -215,17 +324,45 @@ class ProjectionManager:
             PositionStateProjector(),
             OutcomesProjector(),
         ]
+        self._dispatch = self._build_dispatch(self.projectors)
+
+    @staticmethod
+    def _build_dispatch(
+        projectors: list[Projector],
+    ) -> dict[EventType, tuple[list[EventHandler], list[tuple[str, EventHandler]]]]:
+        """Resolve, per event type, the typed handlers and keyed fallbacks to run."""
+
+        dispatch: dict[EventType, tuple[list[EventHandler], list[tuple[str, EventHandler]]]] = {}
+        for et in EventType:
+            typed: list[EventHandler] = []
+            fallbacks: list[tuple[str, EventHandler]] = []
+            for p in projectors:
+                if et in p.event_types:
+                    typed.append(p.handle_typed)
+                elif p.fallback_key is not None:
+                    fallbacks.append((p.fallback_key, p.handle_fallback))
+            dispatch[et] = (typed, fallbacks)
+        return dispatch
+
+    def _apply(self, event: Event) -> None:
+        typed, fallbacks = self._dispatch[event.type]
+        for h in typed:
+            h(event)
+        if fallbacks:
+            payload = event.payload
+            for key, h in fallbacks:
+                if key in payload:
+                    h(event)
 
     def handle(self, event: Event) -> None:
         with self._lock:
-            for p in self.projectors:
-                p.handle(event)
+            self._apply(event)
 
     def rebuild(self, events: Iterable[Event]) -> None:
         with self._lock:
-            self.__init__()
+            self._reset()
             for ev in events:
-                self.handle(ev)
+                self._apply(ev)
 
     def get_state(self) -> dict[str, Any]:
         return {
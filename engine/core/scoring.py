@@ -4,7 +4,8 @@ import math
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from engine.core.contributors import ContributorRegistry
+import numpy as np
+
 from engine.core.database import Database
 
 
@@ -12,21 +13,6 @@ def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, float(x)))
 
 
-def _parse_iso(ts: str | None) -> datetime | None:
-    if not ts:
-        return None
-    v = str(ts)
-    if v.endswith("Z"):
-        v = v[:-1] + "+00:00"
-    try:
-        dt = datetime.fromisoformat(v)
-    except Exception:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
-    return dt.astimezone(UTC)
-
-
 @dataclass(frozen=True, slots=True)
 class ContributorScore:
     contributor_id: str
@@ -41,141 +27,258 @@ class ContributorScore:
     streak: int
 
 
+_LOG1P_100 = math.log1p(100.0)
+
+
+def _conviction_accuracy(avg_win: float | None, avg_loss: float | None) -> float:
+    # compare mean conviction for profitable vs unprofitable among accepted with known outcomes
+    if avg_win is None or avg_loss is None:
+        return 0.5
+    diff = float(avg_win) - float(avg_loss)
+    # map diff to 0..1; assume score scale roughly 0..10
+    return _clamp01(0.5 + diff / 20.0)
+
+
+def _recency(days_since: float | None) -> float:
+    if days_since is None:
+        return 0.0
+    days_since = max(0.0, float(days_since))
+    if days_since <= 7.0:
+        return 1.0
+    return _clamp01(1.0 - (days_since - 7.0) / 30.0)
+
+
+def _composite_scores(
+    *,
+    submitted: np.ndarray,
+    accepted: np.ndarray,
+    profitable: np.ndarray,
+    conviction_accuracy: np.ndarray,
+    recency: np.ndarray,
+    streak: np.ndarray,
+) -> np.ndarray:
+    """Vectorized composite score (0..100) over contributor columns; mirrors _build_score."""
+
+    hit_rate = np.divide(profitable, accepted, out=np.zeros_like(profitable), where=accepted > 0)
+    volume_norm = np.clip(np.log1p(submitted) / _LOG1P_100, 0.0, 1.0)
+    consistency_norm = np.clip(streak / 30.0, 0.0, 1.0)
+    composite = 0.3 * np.clip(hit_rate, 0.0, 1.0) + 0.25 * volume_norm + 0.2 * consistency_norm + 0.15 * conviction_accuracy + 0.1 * recency
+    return 100.0 * np.clip(composite, 0.0, 1.0)
+
+
+def _build_score(
+    contributor_id: str,
+    *,
+    submitted: int,
+    accepted: int,
+    profitable: int,
+    avg_conviction: float,
+    last_active: str,
+    avg_win: float | None,
+    avg_loss: float | None,
+    total_karma: float,
+    streak: int,
+    days_since: float | None,
+) -> ContributorScore:
+    # hit rate
+    hit_rate = float(profitable) / float(accepted) if accepted > 0 else 0.0
+
+    # Composite components
+    hit_rate_norm = _clamp01(hit_rate)
+
+    # log-scaled volume (cap at ~100 submissions)
+    volume_norm = 0.0
+    if submitted > 0:
+        volume_norm = _clamp01(math.log1p(float(submitted)) / _LOG1P_100)
+
+    consistency_norm = _clamp01(float(streak) / 30.0)
+
+    conviction_accuracy = _conviction_accuracy(avg_win, avg_loss)
+
+    # recency bonus
+    recency = _recency(days_since)
+
+    composite = 0.3 * hit_rate_norm + 0.25 * volume_norm + 0.2 * consistency_norm + 0.15 * conviction_accuracy + 0.1 * recency
+    score_0_100 = 100.0 * _clamp01(composite)
+
+    return ContributorScore(
+        contributor_id=contributor_id,
+        signals_submitted=submitted,
+        signals_accepted=accepted,
+        signals_profitable=profitable,
+        hit_rate=hit_rate,
+        avg_conviction=avg_conviction,
+        total_karma_usd=total_karma,
+        score=score_0_100,
+        last_active=last_active,
+        streak=streak,
+    )
+
+
 class ContributorScoring:
     def __init__(self, db: Database):
         self._db = db
-        self._registry = ContributorRegistry(db)
 
-    def _streak_days(self, contributor_id: str) -> int:
-        # Compute consecutive-day streak from contributor_signals.created_at.
-        rows = self._db.conn.execute(
-            """
-            SELECT DISTINCT substr(created_at, 1, 10) as d
-            FROM contributor_signals
-            WHERE contributor_id = ?
-            ORDER BY d DESC
-            """,
-            (contributor_id,),
-        ).fetchall()
-        if not rows:
-            return 0
-
-        days = [str(r[0]) for r in rows if r and r[0] is not None]
-        if not days:
-            return 0
-
-        def to_date(s: str) -> datetime:
-            return datetime.fromisoformat(s).replace(tzinfo=UTC)
-
-        streak = 1
-        prev = to_date(days[0])
-        for d in days[1:]:
-            cur = to_date(d)
-            delta = (prev - cur).days
-            if delta == 1:
-                streak += 1
-                prev = cur
-                continue
-            break
-        return streak
+    # Consecutive-day streak ending at the latest active day, walked entirely in
+    # SQL so only the final count crosses into Python.
+    _STREAK_CTE = """
+        streak(d) AS (
+            SELECT MAX(day)
+            FROM contributor_daily_signals
+            WHERE contributor_id = :cid
+            UNION ALL
+            SELECT streak.d - 1
+            FROM streak
+            WHERE EXISTS (
+                SELECT 1 FROM contributor_daily_signals
+                WHERE contributor_id = :cid AND day = streak.d - 1
+            )
+        )
+    """
 
-    def compute_score(self, contributor_id: str) -> ContributorScore:
-        # Aggregates
-        row = self._db.conn.execute(
-            """
+    # Everything compute_score needs, in one round-trip.
+    _SCORE_SQL = f"""
+        WITH RECURSIVE
+        {_STREAK_CTE},
+        agg AS (
             SELECT
-                COUNT(1) as submitted,
-                SUM(CASE WHEN accepted = 1 THEN 1 ELSE 0 END) as accepted,
-                SUM(CASE WHEN profitable = 1 THEN 1 ELSE 0 END) as profitable,
-                AVG(CASE WHEN signal_score IS NOT NULL THEN signal_score END) as avg_score,
-                MAX(created_at) as last_active
+                COUNT(1) AS submitted,
+                SUM(CASE WHEN accepted = 1 THEN 1 ELSE 0 END) AS accepted,
+                SUM(CASE WHEN profitable = 1 THEN 1 ELSE 0 END) AS profitable,
+                AVG(CASE WHEN signal_score IS NOT NULL THEN signal_score END) AS avg_score,
+                MAX(created_at) AS last_active,
+                MAX(created_at_ts) AS last_ts,
+                AVG(CASE WHEN accepted = 1 AND profitable = 1 THEN signal_score END) AS avg_win,
+                AVG(CASE WHEN accepted = 1 AND profitable = 0 THEN signal_score END) AS avg_loss
             FROM contributor_signals
-            WHERE contributor_id = ?
-            """,
-            (contributor_id,),
-        ).fetchone()
-
-        submitted = int(row[0] or 0)
-        accepted = int(row[1] or 0)
-        profitable = int(row[2] or 0)
-        avg_conviction = float(row[3] or 0.0)
-        last_active = str(row[4] or "")
-
-        # hit rate
-        hit_rate = float(profitable) / float(accepted) if accepted > 0 else 0.0
-
-        # karma by node_id (best-effort)
-        total_karma = 0.0
-        contrib = self._registry.get(contributor_id)
-        if contrib is not None:
-            k_row = self._db.conn.execute(
-                "SELECT SUM(karma_amount_usd) FROM karma_intents WHERE node_id = ?",
-                (contrib.node_id,),
-            ).fetchone()
-            if k_row is not None and k_row[0] is not None:
-                total_karma = float(k_row[0])
-
-        streak = self._streak_days(contributor_id)
-
-        # Composite components
-        hit_rate_norm = _clamp01(hit_rate)
-
-        # log-scaled volume (cap at ~100 submissions)
-        volume_norm = 0.0
-        if submitted > 0:
-            volume_norm = _clamp01(math.log1p(float(submitted)) / math.log1p(100.0))
-
-        consistency_norm = _clamp01(float(streak) / 30.0)
-
-        # conviction accuracy: compare mean conviction for profitable vs unprofitable among accepted with known outcomes
-        acc_row = self._db.conn.execute(
-            """
+            WHERE contributor_id = :cid
+        ),
+        karma AS (
+            SELECT SUM(k.karma_amount_usd) AS total
+            FROM karma_intents k
+            JOIN contributors c ON c.node_id = k.node_id
+            WHERE c.id = :cid
+        )
+        SELECT
+            agg.submitted, agg.accepted, agg.profitable, agg.avg_score, agg.last_active,
+            agg.avg_win, agg.avg_loss, karma.total, (SELECT COUNT(d) FROM streak),
+            (:now - agg.last_ts) / 86400.0
+        FROM agg, karma
+    """
+
+    def _streak_days(self, contributor_id: str) -> int:
+        row = self._db.conn.execute(f"WITH RECURSIVE {self._STREAK_CTE} SELECT COUNT(d) FROM streak", {"cid": contributor_id}).fetchone()
+        return int(row[0] or 0) if row is not None else 0
+
+    def compute_score(self, contributor_id: str, *, now: datetime | None = None) -> ContributorScore:
+        n = now or datetime.now(tz=UTC)
+        row = self._db.conn.execute(self._SCORE_SQL, {"cid": contributor_id, "now": n.timestamp()}).fetchone()
+        return _build_score(
+            contributor_id,
+            submitted=int(row[0] or 0),
+            accepted=int(row[1] or 0),
+            profitable=int(row[2] or 0),
+            avg_conviction=float(row[3] or 0.0),
+            last_active=str(row[4] or ""),
+            avg_win=row[5],
+            avg_loss=row[6],
+            total_karma=float(row[7] or 0.0),
+            streak=int(row[8] or 0),
+            days_since=row[9],
+        )
+
+    # Per-contributor aggregates for every registered contributor in one GROUP BY
+    # pass, with karma joined by node_id.
+    _LEADERBOARD_SQL = """
+        SELECT
+            c.id,
+            COALESCE(agg.submitted, 0),
+            agg.accepted,
+            agg.profitable,
+            agg.avg_score,
+            agg.last_active,
+            agg.avg_win,
+            agg.avg_loss,
+            k.total,
+            d.days_active,
+            (:now - agg.last_ts) / 86400.0
+        FROM contributors c
+        LEFT JOIN (
             SELECT
-                AVG(CASE WHEN profitable = 1 THEN signal_score END) as avg_win,
-                AVG(CASE WHEN profitable = 0 THEN signal_score END) as avg_loss
+                contributor_id,
+                COUNT(1) AS submitted,
+                SUM(CASE WHEN accepted = 1 THEN 1 ELSE 0 END) AS accepted,
+                SUM(CASE WHEN profitable = 1 THEN 1 ELSE 0 END) AS profitable,
+                AVG(CASE WHEN signal_score IS NOT NULL THEN signal_score END) AS avg_score,
+                MAX(created_at) AS last_active,
+                MAX(created_at_ts) AS last_ts,
+                AVG(CASE WHEN accepted = 1 AND profitable = 1 THEN signal_score END) AS avg_win,
+                AVG(CASE WHEN accepted = 1 AND profitable = 0 THEN signal_score END) AS avg_loss
             FROM contributor_signals
-            WHERE contributor_id = ? AND accepted = 1 AND profitable IS NOT NULL AND signal_score IS NOT NULL
-            """,
-            (contributor_id,),
-        ).fetchone()
-
-        conviction_accuracy = 0.5
-        if acc_row is not None and acc_row[0] is not None and acc_row[1] is not None:
-            diff = float(acc_row[0]) - float(acc_row[1])
-            # map diff to 0..1; assume score scale roughly 0..10
-            conviction_accuracy = _clamp01(0.5 + diff / 20.0)
-
-        # recency bonus
-        recency = 0.0
-        last_dt = _parse_iso(last_active)
-        if last_dt is not None:
-            days_since = max(0.0, (datetime.now(tz=UTC) - last_dt).total_seconds() / 86400.0)
-            if days_since <= 7.0:
-                recency = 1.0
-            else:
-                recency = _clamp01(1.0 - (days_since - 7.0) / 30.0)
-
-        composite = 0.3 * hit_rate_norm + 0.25 * volume_norm + 0.2 * consistency_norm + 0.15 * conviction_accuracy + 0.1 * recency
-        score_0_100 = 100.0 * _clamp01(composite)
-
-        return ContributorScore(
-            contributor_id=contributor_id,
-            signals_submitted=submitted,
-            signals_accepted=accepted,
-            signals_profitable=profitable,
-            hit_rate=hit_rate,
-            avg_conviction=avg_conviction,
-            total_karma_usd=total_karma,
-            score=score_0_100,
-            last_active=last_active,
-            streak=streak,
-        )
+            GROUP BY contributor_id
+        ) agg ON agg.contributor_id = c.id
+        LEFT JOIN (
+            SELECT contributor_id, COUNT(1) AS days_active
+            FROM contributor_daily_signals
+            GROUP BY contributor_id
+        ) d ON d.contributor_id = c.id
+        LEFT JOIN (
+            SELECT node_id, SUM(karma_amount_usd) AS total
+            FROM karma_intents
+            GROUP BY node_id
+        ) k ON k.node_id = c.node_id
+        ORDER BY c.registered_at ASC
+    """
 
     def leaderboard(self, *, limit: int = 20) -> list[ContributorScore]:
-        contributors = self._registry.list_all()
-        scores = [self.compute_score(c.id) for c in contributors]
+        limit = int(limit)
+        now_ts = datetime.now(tz=UTC).timestamp()
+        rows = self._db.conn.execute(self._LEADERBOARD_SQL, {"now": now_ts}).fetchall()
+        if limit <= 0 or not rows:
+            return []
+
+        submitted = np.array([float(r[1] or 0) for r in rows])
+        accepted = np.array([float(r[2] or 0) for r in rows])
+        days_active = np.array([float(r[9] or 0) for r in rows])
+        cols = {
+            "submitted": submitted,
+            "accepted": accepted,
+            "profitable": np.array([float(r[3] or 0) for r in rows]),
+            "conviction_accuracy": np.array([_conviction_accuracy(r[6], r[7]) for r in rows]),
+            "recency": np.array([_recency(r[10]) for r in rows]),
+        }
+
+        # Streaks are the expensive per-contributor lookup, so bound first: a
+        # streak is between 0 and the number of active days. Anyone whose best
+        # case ranks below the K-th worst case cannot make the cut.
+        lower = _composite_scores(streak=np.zeros(len(rows)), **cols)
+        upper = _composite_scores(streak=days_active, **cols)
+        lower_keys = sorted(zip(lower.tolist(), accepted.tolist(), submitted.tolist(), strict=True), reverse=True)
+        cutoff = lower_keys[min(limit, len(rows)) - 1]
+
+        scores: list[ContributorScore] = []
+        for i, r in enumerate(rows):
+            # Tolerance keeps float noise between the two score paths from pruning a tie.
+            if (upper[i] + 1e-9, accepted[i], submitted[i]) < cutoff:
+                continue
+            scores.append(
+                _build_score(
+                    str(r[0]),
+                    submitted=int(r[1] or 0),
+                    accepted=int(r[2] or 0),
+                    profitable=int(r[3] or 0),
+                    avg_conviction=float(r[4] or 0.0),
+                    last_active=str(r[5] or ""),
+                    avg_win=r[6],
+                    avg_loss=r[7],
+                    total_karma=float(r[8] or 0.0),
+                    streak=self._streak_days(str(r[0])) if days_active[i] else 0,
+                    days_since=r[10],
+                )
+            )
+
         scores.sort(key=lambda s: (s.score, s.signals_accepted, s.signals_submitted), reverse=True)
-        return scores[: int(limit)]
+        return scores[:limit]
 
     def update_outcomes(self, contributor_id: str, *, signal_id: str, profitable: bool) -> None:
         with self._db.conn:
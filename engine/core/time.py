@@ -7,6 +7,7 @@ This module is the *only* time helper surface in the codebase.
 
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime
 
 
@@ -16,6 +17,25 @@ def utc_now() -> datetime:
     return datetime.now(tz=UTC)
 
 
+_iso_seconds_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso_seconds() -> str:
+    """Return the current UTC time as a second-resolution ISO-8601 string.
+
+    Equal to ``utc_now().replace(microsecond=0).isoformat()``, but formatted at
+    most once per wall-clock second; callers within the same second share it.
+    """
+
+    global _iso_seconds_cache
+    sec = int(time.time())
+    cached = _iso_seconds_cache
+    if cached[0] != sec:
+        cached = (sec, datetime.fromtimestamp(sec, tz=UTC).isoformat())
+        _iso_seconds_cache = cached
+    return cached[1]
+
+
 def parse_dt(value: str) -> datetime:
     """Parse an ISO-8601 datetime string into an aware UTC datetime.
 
@@ -3,25 +3,44 @@
 Persistent outbound webhook subscriptions + dispatcher.
 
 Design goals:
-- stdlib-only HTTP (urllib.request)
-- best-effort delivery (never block/abort event persistence)
+- stdlib-only HTTP (http.client, keep-alive connections reused per thread);
+  honours HTTP(S)_PROXY / NO_PROXY and does not follow redirects
+- best-effort delivery (never block/abort event persistence): deliveries are
+  queued to a small pool of background workers and dropped if the queue is full
 - simple glob matching on event type strings (fnmatch)
 """
 
 from __future__ import annotations
 
+import atexit
+import base64
+import fnmatch
+import functools
+import http.client
 import json
+import queue
+import random
+import re
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
+from datetime import datetime
 from typing import Any
 
+try:  # optional speedup (``speedups`` extra); stdlib json is the fallback
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from engine.core.client import CircuitBreaker
+from engine.core.metrics import REGISTRY
 from engine.core.models import Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebhookSubscription:
     id: int
     url: str
@@ -36,8 +55,25 @@ def _split_event_globs(event_globs: str) -> list[str]:
     return [p for p in parts if p]
 
 
+@functools.lru_cache(maxsize=512)
+def _compile_globs(event_globs: str) -> re.Pattern[str]:
+    # One alternation per subscription; fnmatch.translate anchors each glob.
+    globs = _split_event_globs(event_globs)
+    if not globs:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(g) for g in globs))
+
+
 def subscription_matches(sub: WebhookSubscription, *, event_type: str) -> bool:
-    return any(fnmatchcase(event_type, g) for g in _split_event_globs(sub.event_globs))
+    return _compile_globs(sub.event_globs).match(event_type) is not None
+
+
+def sql_event_matches(event_globs: str | None, event_type: str | None) -> int:
+    """SQLite scalar ``event_matches(event_globs, event_type)``; see :class:`Database`."""
+
+    if event_globs is None or event_type is None:
+        return 0
+    return 1 if _compile_globs(event_globs).match(event_type) is not None else 0
 
 
 def list_webhook_subscriptions(db: Any) -> list[WebhookSubscription]:
@@ -56,55 +92,304 @@ def list_webhook_subscriptions(db: Any) -> list[WebhookSubscription]:
     return out
 
 
+# Matching URLs per event type for the most recently used connection. Event
+# types are a small closed set, so after warm-up dispatch is a dict lookup.
+# The entry is dropped when the subscriptions may have changed: writes through
+# this module bump _subs_generation, and commits from other connections (e.g.
+# the CLI) bump SQLite's PRAGMA data_version.
+_subs_generation = 0
+_match_cache: tuple[Any, tuple[int, int], dict[str, tuple[str, ...]]] | None = None
+
+
+def _bump_subs_generation() -> None:
+    global _subs_generation
+    _subs_generation += 1
+
+
+def _matching_urls(db: Any, event_type: str) -> tuple[str, ...]:
+    global _match_cache
+    conn = db.conn
+    version = (int(conn.execute("PRAGMA data_version").fetchone()[0]), _subs_generation)
+    entry = _match_cache
+    if entry is None or entry[0] is not conn or entry[1] != version:
+        entry = _match_cache = (conn, version, {})
+    urls = entry[2].get(event_type)
+    if urls is None:
+        # Cold path: glob filtering runs inside SQLite, so only matching subscriptions come back.
+        rows = conn.execute(
+            "SELECT url FROM webhook_subscriptions WHERE enabled = 1 AND event_matches(event_globs, ?) ORDER BY id ASC",
+            (event_type,),
+        ).fetchall()
+        urls = entry[2][event_type] = tuple(str(r[0]) for r in rows)
+    return urls
+
+
 def add_webhook_subscription(db: Any, *, url: str, event_globs: str, enabled: bool = True) -> int:
     with db.conn:
         cur = db.conn.execute(
             "INSERT INTO webhook_subscriptions (url, event_globs, enabled) VALUES (?, ?, ?)",
             (url, event_globs, 1 if enabled else 0),
         )
+    _bump_subs_generation()
     return int(cur.lastrowid)
 
 
 def remove_webhook_subscription(db: Any, *, sub_id: int) -> bool:
     with db.conn:
         cur = db.conn.execute("DELETE FROM webhook_subscriptions WHERE id = ?", (int(sub_id),))
+    _bump_subs_generation()
     return int(cur.rowcount) > 0
 
 
-def _post_json(url: str, payload: dict[str, Any], *, timeout_s: float) -> None:
-    body = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=body,
-        method="POST",
-        headers={"Content-Type": "application/json", "User-Agent": "b1e55ed-webhooks/1"},
-    )
-    # urlopen timeout covers connect + read.
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:  # noqa: S310
-        _ = resp.read()  # drain
+def _encode_payload(payload: dict[str, Any]) -> bytes:
+    # Webhook bodies are not hashed or signed; orjson only has to agree with the
+    # stdlib encoding up to whitespace (datetimes go through default=str in both).
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; stdlib handles them
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
+_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "b1e55ed-webhooks/1",
+    "Connection": "keep-alive",
+}
+
+# Per-thread keep-alive connections keyed by (scheme, netloc), so repeated
+# deliveries to the same endpoint skip the TCP/TLS handshake.
+_local = threading.local()
+
+
+def _connections() -> dict[tuple[str, str], http.client.HTTPConnection]:
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    return conns
+
+
+def _drop_connection(key: tuple[str, str]) -> None:
+    conn = _connections().pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+class _ProxyConnection(http.client.HTTPConnection):
+    """Plain-HTTP connection to a forward proxy; requests use absolute-form targets."""
+
+    def __init__(self, host: str, port: int | None, *, timeout: float, proxy_headers: dict[str, str]) -> None:
+        super().__init__(host, port, timeout=timeout)
+        self.proxy_headers = proxy_headers
+
+
+def _open_connection(parts: urllib.parse.SplitResult, timeout_s: float) -> http.client.HTTPConnection:
+    """New connection to the webhook host, or to the proxy configured for it."""
+
+    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    proxy_url = urllib.request.getproxies().get(parts.scheme)
+    if not proxy_url or urllib.request.proxy_bypass(parts.hostname or ""):
+        return conn_cls(parts.netloc, timeout=timeout_s)
+
+    proxy = urllib.parse.urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    proxy_headers: dict[str, str] = {}
+    if proxy.username is not None:
+        cred = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+
+    if parts.scheme == "https":
+        # CONNECT tunnel through the proxy; TLS is still verified against the webhook host.
+        conn = conn_cls(proxy.hostname or "", proxy.port, timeout=timeout_s)
+        conn.set_tunnel(parts.hostname or "", parts.port, headers=proxy_headers)
+        return conn
+
+    return _ProxyConnection(proxy.hostname or "", proxy.port, timeout=timeout_s, proxy_headers=proxy_headers)
+
+
+def _post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise ValueError(f"unsupported webhook url: {url}")
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    key = (parts.scheme, parts.netloc)
+    conns = _connections()
+    for fresh in (False, True):
+        conn = conns.get(key)
+        reused = conn is not None and conn.sock is not None
+        if conn is None:
+            conn = conns[key] = _open_connection(parts, timeout_s)
+        req_target, headers = target, _HEADERS
+        if isinstance(conn, _ProxyConnection):
+            req_target = f"{parts.scheme}://{parts.netloc}{target}"
+            headers = {**_HEADERS, **conn.proxy_headers}
+        # Timeout covers connect + each blocking read.
+        conn.timeout = timeout_s
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout_s)
+        try:
+            conn.request("POST", req_target, body=body, headers=headers)
+            resp = conn.getresponse()
+            _ = resp.read()  # drain so the connection can be reused
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            _drop_connection(key)
+            # The server may close an idle keep-alive socket; retry once on a new one.
+            if reused and not fresh:
+                continue
+            raise urllib.error.URLError(exc) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            _drop_connection(key)
+            if isinstance(exc, TimeoutError):
+                raise
+            raise urllib.error.URLError(exc) from exc
+
+        if resp.will_close:
+            _drop_connection(key)
+        # Redirects are not followed, so anything outside 2xx is a failed delivery.
+        if not 200 <= resp.status < 300:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return
+
+
+# Per-endpoint breakers: an endpoint that keeps failing is skipped for a
+# cooldown instead of tying up a worker with doomed retries. Keyed by URL
+# because subscription ids are only unique within one database.
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_S = 60.0
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker_for(url: str) -> CircuitBreaker:
+    br = _breakers.get(url)
+    if br is not None:
+        return br
+    with _breakers_lock:
+        return _breakers.setdefault(url, CircuitBreaker(threshold=_BREAKER_THRESHOLD, cooldown_s=_BREAKER_COOLDOWN_S))
+
+
+def _deliver(url: str, body: bytes) -> None:
+    """POST ``body`` to ``url``, trying up to 3 times with decorrelated-jitter backoff."""
+
+    breaker = _breaker_for(url)
+    if not breaker.allow():
+        REGISTRY.counter("webhooks.circuit_open").inc()
+        return
+
+    backoff_s = 0.5
+    for attempt in range(1, 4):
+        try:
+            _post_bytes(url, body, timeout_s=3.0)
+            breaker.on_success()
+            return
+        except (urllib.error.URLError, TimeoutError, ValueError):
+            if attempt < 3:
+                time.sleep(backoff_s)
+                # Decorrelated jitter keeps failing endpoints from retrying in lockstep.
+                backoff_s = random.uniform(0.1, min(4.0, backoff_s * 3.0))
+    breaker.on_failure()
+
+
+_WORKERS = 8
+_QUEUE_MAX = 10_000
+# How long interpreter exit waits for queued deliveries before giving up on them.
+_EXIT_DRAIN_S = 10.0
+_queue: queue.Queue[tuple[str, bytes]] = queue.Queue(maxsize=_QUEUE_MAX)
+_workers_lock = threading.Lock()
+_workers_started = False
+
+
+def _worker() -> None:
+    while True:
+        url, body = _queue.get()
+        try:
+            _deliver(url, body)
+        except Exception:
+            pass
+        finally:
+            _queue.task_done()
+
+
+def _ensure_workers() -> None:
+    global _workers_started
+    if _workers_started:
+        return
+    with _workers_lock:
+        if _workers_started:
+            return
+        for i in range(_WORKERS):
+            threading.Thread(target=_worker, name=f"webhook-{i}", daemon=True).start()
+        # Workers are daemons; without this a short-lived process (e.g. a CLI
+        # command) would exit with its deliveries still queued.
+        atexit.register(wait_for_webhooks, _EXIT_DRAIN_S)
+        _workers_started = True
+
+
+def wait_for_webhooks(timeout: float | None = None) -> bool:
+    """Block until every queued delivery has finished (tests, graceful shutdown).
+
+    Returns False if ``timeout`` seconds pass with deliveries still pending.
+    """
+
+    if timeout is None:
+        _queue.join()
+        return True
+    deadline = time.monotonic() + timeout
+    with _queue.all_tasks_done:
+        while _queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _queue.all_tasks_done.wait(remaining)
+    return True
+
+
+# Batched appends share one ts/observed_at object across every event, so a
+# single identity-keyed slot turns repeat isoformat() calls into a lookup.
+# (An equality-keyed cache would be wrong: equal aware datetimes can carry
+# different offsets and so format differently.)
+_last_iso: tuple[datetime, str] | None = None
+
+
+def _iso(dt: datetime | None) -> str | None:
+    global _last_iso
+    if dt is None:
+        return None
+    last = _last_iso
+    if last is not None and last[0] is dt:
+        return last[1]
+    out = dt.isoformat()
+    _last_iso = (dt, out)
+    return out
 
 
 def dispatch_event_webhooks(db: Any, event: Event) -> None:
-    """Dispatch webhooks for a committed event.
+    """Queue webhook deliveries for a committed event.
 
     Best-effort semantics:
     - does nothing if no enabled subscriptions match
-    - for each subscription, tries up to 3 times with exponential backoff
+    - returns without waiting on the network; background workers POST each
+      subscription, trying up to 3 times with jittered backoff
+    - endpoints that failed 5 deliveries in a row are skipped for 60s
+    - if the delivery queue is full the delivery is dropped and counted in
+      ``webhooks.dropped``
     """
 
     event_type = str(event.type)
 
-    rows = db.conn.execute("SELECT id, url, event_globs, enabled, created_at FROM webhook_subscriptions WHERE enabled = 1").fetchall()
-
-    if not rows:
+    urls = _matching_urls(db, event_type)
+    if not urls:
         return
 
     payload = {
         "event": {
             "id": event.id,
             "type": event_type,
-            "ts": event.ts.isoformat(),
-            "observed_at": event.observed_at.isoformat() if event.observed_at else None,
+            "ts": _iso(event.ts),
+            "observed_at": _iso(event.observed_at),
             "source": event.source,
             "trace_id": event.trace_id,
             "schema_version": event.schema_version,
@@ -115,23 +400,12 @@ def dispatch_event_webhooks(db: Any, event: Event) -> None:
         }
     }
 
-    for r in rows:
-        sub = WebhookSubscription(
-            id=int(r[0]),
-            url=str(r[1]),
-            event_globs=str(r[2]),
-            enabled=bool(int(r[3])),
-            created_at=str(r[4]),
-        )
-        if not subscription_matches(sub, event_type=event_type):
-            continue
-
-        backoff_s = 0.5
-        for attempt in range(1, 4):
-            try:
-                _post_json(sub.url, payload, timeout_s=3.0)
-                break
-            except (urllib.error.URLError, TimeoutError, ValueError):
-                if attempt < 3:
-                    time.sleep(backoff_s)
-                    backoff_s *= 2
+    # Encoded once; every subscription and retry sends the same body.
+    body = _encode_payload(payload)
+
+    _ensure_workers()
+    for url in urls:
+        try:
+            _queue.put_nowait((url, body))
+        except queue.Full:
+            REGISTRY.counter("webhooks.dropped").inc()
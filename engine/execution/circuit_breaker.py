@@ -30,6 +30,7 @@ class TokenBucket:
 
     capacity: float
     refill_rate_per_s: float
+    # ``None`` means "start full" / "start now"; __post_init__ resolves both.
     tokens: float | None = None
     updated_at: float | None = None
 
@@ -43,22 +44,27 @@ class TokenBucket:
         if self.updated_at is None:
             self.updated_at = time.monotonic()
 
-    def _refill(self, now: float) -> None:
-        assert self.tokens is not None
-        assert self.updated_at is not None
-        dt = max(0.0, now - self.updated_at)
-        self.tokens = min(self.capacity, self.tokens + dt * self.refill_rate_per_s)
+    def _refill(self, now: float) -> float:
+        # Kept for wait_time_s; try_take inlines the same update.
+        tokens, updated_at = self.tokens, self.updated_at
+        assert tokens is not None and updated_at is not None
+        tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * self.refill_rate_per_s)
+        self.tokens = tokens
         self.updated_at = now
+        return tokens
 
     def try_take(self, amount: float = 1.0, *, now: float | None = None) -> bool:
         if amount <= 0:
             return True
         n = time.monotonic() if now is None else float(now)
-        self._refill(n)
-        assert self.tokens is not None
-        if self.tokens + 1e-12 < amount:
+        tokens, updated_at = self.tokens, self.updated_at
+        assert tokens is not None and updated_at is not None
+        tokens = min(self.capacity, tokens + max(0.0, n - updated_at) * self.refill_rate_per_s)
+        self.updated_at = n
+        if tokens + 1e-12 < amount:
+            self.tokens = tokens
             return False
-        self.tokens -= amount
+        self.tokens = tokens - amount
         return True
 
     def wait_time_s(self, amount: float = 1.0, *, now: float | None = None) -> float:
@@ -67,12 +73,10 @@ class TokenBucket:
         if amount <= 0:
             return 0.0
         n = time.monotonic() if now is None else float(now)
-        self._refill(n)
-        assert self.tokens is not None
-        if self.tokens >= amount:
+        tokens = self._refill(n)
+        if tokens >= amount:
             return 0.0
-        missing = amount - self.tokens
-        return float(missing / self.refill_rate_per_s)
+        return float((amount - tokens) / self.refill_rate_per_s)
 
 
 @dataclass(slots=True)
@@ -125,11 +129,13 @@ class CircuitBreaker:
     def call(self, fn: Callable[[], T]) -> T:
         """Call ``fn`` if allowed, else raise CircuitBreakerError."""
 
-        if not self.can_call():
-            wait = self.backoff_remaining_s()
+        # One clock read covers the gate and both "retry in" messages.
+        n = self._now()
+        if not self.can_call(now=n):
+            wait = self.backoff_remaining_s(now=n)
             if wait > 0:
                 raise CircuitBreakerError(f"{self.name}: circuit open for {wait:.2f}s")
-            wait_bucket = self.bucket.wait_time_s(1.0)
+            wait_bucket = self.bucket.wait_time_s(1.0, now=n)
             raise CircuitBreakerError(f"{self.name}: rate limited, retry in {wait_bucket:.2f}s")
 
         try:
@@ -11,12 +11,14 @@ The unit tests in Sprint 2B rely on an injected API object.
 
 from __future__ import annotations
 
-import uuid
+import dataclasses
 from dataclasses import dataclass
 from typing import Protocol
 
+from engine.core.ids import new_id
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HLOrder:
     id: str
     symbol: str
@@ -63,7 +65,7 @@ class InMemoryHyperliquidApi:
         self._orders: dict[str, HLOrder] = {}
 
     def place_order(self, *, symbol: str, side: str, size: float, price: float | None = None) -> HLOrder:
-        oid = str(uuid.uuid4())
+        oid = new_id()
         o = HLOrder(id=oid, symbol=symbol, side=side, size=float(size), price=price, status="open")
         self._orders[oid] = o
         return o
@@ -74,15 +76,7 @@ class InMemoryHyperliquidApi:
             return False
         if o.status == "filled":
             return False
-        self._orders[order_id] = HLOrder(
-            id=o.id,
-            symbol=o.symbol,
-            side=o.side,
-            size=o.size,
-            price=o.price,
-            status="canceled",
-            filled_price=o.filled_price,
-        )
+        self._orders[order_id] = dataclasses.replace(o, status="canceled")
         return True
 
     def get_order(self, *, order_id: str) -> HLOrder | None:
@@ -90,13 +84,5 @@ class InMemoryHyperliquidApi:
 
     def fill_order(self, *, order_id: str, fill_price: float) -> HLOrder:
         o = self._orders[order_id]
-        self._orders[order_id] = HLOrder(
-            id=o.id,
-            symbol=o.symbol,
-            side=o.side,
-            size=o.size,
-            price=o.price,
-            status="filled",
-            filled_price=float(fill_price),
-        )
+        self._orders[order_id] = dataclasses.replace(o, status="filled", filled_price=float(fill_price))
         return self._orders[order_id]
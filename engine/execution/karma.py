@@ -20,19 +20,41 @@ Tone constraint: builders, conviction, pride. No shame language.
 
 from __future__ import annotations
 
+import base64
+import functools
 import json
-import uuid
+import sqlite3
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from engine.core.config import Config
 from engine.core.database import Database
-from engine.core.events import EventType, canonical_json
+from engine.core.events import EventType, canonical_json_bytes
+from engine.core.ids import new_id
 from engine.security.identity import NodeIdentity
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=64)
+def _placeholders(n: int) -> str:
+    return ",".join("?" * n)
+
+
+@functools.lru_cache(maxsize=64)
+def _claim_sql(n: int) -> str:
+    # Same text for the same batch size, so sqlite3's statement cache reuses the prepared statement.
+    return f"""
+        UPDATE karma_intents SET settled = 1, batch_id = ?
+        WHERE id IN ({_placeholders(n)}) AND settled = 0
+        RETURNING id, karma_amount_usd
+    """
+
+
+# UPDATE ... RETURNING needs SQLite 3.35+.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@dataclass(frozen=True, slots=True)
 class KarmaIntent:
     id: str
     trade_id: str
@@ -44,7 +66,7 @@ class KarmaIntent:
     created_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KarmaReceipt:
     id: str
     intent_ids: list[str]
@@ -63,14 +85,27 @@ def _utc_now_iso(now_fn: Callable[[], datetime] | None = None) -> str:
     return n.astimezone(UTC).isoformat()
 
 
+# Cursor row factories. Column affinity already yields str for TEXT and float
+# for REAL columns, so only NULL-able columns need normalising.
+def _intent_from_row(_cursor: sqlite3.Cursor, r: tuple) -> KarmaIntent:
+    return KarmaIntent(r[0], r[1], r[2], r[3], r[4], r[5], r[6] or "", r[7] or "")
+
+
+def _receipt_from_row(_cursor: sqlite3.Cursor, r: tuple) -> KarmaReceipt:
+    intent_ids = json.loads(r[1]) if r[1] is not None else []
+    return KarmaReceipt(r[0], intent_ids, r[2], r[3], r[4], r[5], r[6] or "", r[7] or "")
+
+
+def _sign_bytes(identity: NodeIdentity, data: bytes) -> str:
+    """Return base64 signature over already-canonical bytes."""
+
+    return base64.b64encode(identity.sign(data)).decode("ascii")
+
+
 def _sign_payload(identity: NodeIdentity, payload: dict) -> str:
     """Return base64 signature for canonical-json payload."""
 
-    data = canonical_json(payload).encode("utf-8")
-    sig = identity.sign(data)
-    import base64
-
-    return base64.b64encode(sig).decode("ascii")
+    return _sign_bytes(identity, canonical_json_bytes(payload))
 
 
 class KarmaEngine:
@@ -119,7 +154,7 @@ class KarmaEngine:
             pct = float(self._config.karma.percentage)
             amount = pnl * pct
 
-            intent_id = str(uuid.uuid4())
+            intent_id = new_id()
             created_at = _utc_now_iso(self._now_fn)
 
             payload = {
@@ -133,40 +168,33 @@ class KarmaEngine:
             }
             sig_b64 = _sign_payload(self._identity, payload)
 
-            with self._db.conn:
-                self._db.conn.execute(
+            # The row and its event commit together, so neither exists without the other.
+            with self._db.transaction() as conn:
+                conn.execute(
                     """
                     INSERT INTO karma_intents (
                         id, trade_id, realized_pnl_usd, karma_percentage, karma_amount_usd,
                         node_id, signature, settled, batch_id, created_at
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, 0, NULL, datetime('now'))
                     """,
-                    (
-                        intent_id,
-                        str(trade_id),
-                        pnl,
-                        pct,
-                        amount,
-                        self._identity.node_id,
-                        sig_b64,
-                    ),
+                    (intent_id, str(trade_id), pnl, pct, amount, self._identity.node_id, sig_b64),
                 )
 
-            # Emit an event as well (append-only memory)
-            self._db.append_event(
-                event_type=EventType.KARMA_INTENT_V1,
-                payload={
-                    "trade_id": str(trade_id),
-                    "realized_pnl_usd": pnl,
-                    "karma_percentage": pct,
-                    "karma_amount_usd": amount,
-                    "node_id": self._identity.node_id,
-                    "signature_b64": sig_b64,
-                    "intent_id": intent_id,
-                },
-                dedupe_key=f"karma.intent:{intent_id}",
-                source="karma",
-            )
+                # Emit an event as well (append-only memory)
+                self._db.append_event(
+                    event_type=EventType.KARMA_INTENT_V1,
+                    payload={
+                        "trade_id": str(trade_id),
+                        "realized_pnl_usd": pnl,
+                        "karma_percentage": pct,
+                        "karma_amount_usd": amount,
+                        "node_id": self._identity.node_id,
+                        "signature_b64": sig_b64,
+                        "intent_id": intent_id,
+                    },
+                    dedupe_key=f"karma.intent:{intent_id}",
+                    source="karma",
+                )
 
             return KarmaIntent(
                 id=intent_id,
@@ -183,7 +211,9 @@ class KarmaEngine:
             return None
 
     def get_pending_intents(self) -> list[KarmaIntent]:
-        rows = self._db.conn.execute(
+        cur = self._db.conn.cursor()
+        cur.row_factory = _intent_from_row
+        return cur.execute(
             """
             SELECT id, trade_id, realized_pnl_usd, karma_percentage, karma_amount_usd,
                    node_id, signature, created_at
@@ -192,21 +222,6 @@ class KarmaEngine:
             ORDER BY created_at ASC
             """
         ).fetchall()
-        out: list[KarmaIntent] = []
-        for r in rows:
-            out.append(
-                KarmaIntent(
-                    id=str(r[0]),
-                    trade_id=str(r[1]),
-                    realized_pnl_usd=float(r[2]),
-                    karma_percentage=float(r[3]),
-                    karma_amount_usd=float(r[4]),
-                    node_id=str(r[5]),
-                    signature_b64=str(r[6]) if r[6] is not None else "",
-                    created_at=str(r[7]) if r[7] is not None else "",
-                )
-            )
-        return out
 
     def settle(self, *, intent_ids: list[str], tx_hash: str | None = None) -> KarmaReceipt | None:
         """Batch-settle intents.
@@ -226,40 +241,44 @@ class KarmaEngine:
             if not destination:
                 return None
 
-            # Load intents
-            q_marks = ",".join(["?"] * len(intent_ids))
-            rows = self._db.conn.execute(
-                f"""
-                SELECT id, karma_amount_usd
-                FROM karma_intents
-                WHERE id IN ({q_marks}) AND settled = 0
-                """,
-                tuple(intent_ids),
-            ).fetchall()
-
-            if not rows:
-                return None
-
-            settled_ids = [str(r[0]) for r in rows]
-            total = sum(float(r[1]) for r in rows)
-
-            receipt_id = str(uuid.uuid4())
+            receipt_id = new_id()
             created_at = _utc_now_iso(self._now_fn)
             status = "pending" if tx_hash is None else "submitted"
 
-            receipt_payload = {
-                "id": receipt_id,
-                "intent_ids": settled_ids,
-                "total_usd": total,
-                "destination_wallet": destination,
-                "tx_hash": tx_hash,
-                "status": status,
-                "node_id": self._identity.node_id,
-                "created_at": created_at,
-            }
-            sig_b64 = _sign_payload(self._identity, receipt_payload)
-
+            q_marks = _placeholders(len(intent_ids))
             with self._db.conn:
+                # Claim the still-pending intents and read their amounts in one
+                # statement; the transaction rolls back if the receipt insert fails.
+                if _HAS_RETURNING:
+                    rows = self._db.conn.execute(_claim_sql(len(intent_ids)), (receipt_id, *intent_ids)).fetchall()
+                else:  # pragma: no cover - SQLite < 3.35
+                    rows = self._db.conn.execute(
+                        f"SELECT id, karma_amount_usd FROM karma_intents WHERE id IN ({q_marks}) AND settled = 0",
+                        tuple(intent_ids),
+                    ).fetchall()
+                    self._db.conn.execute(
+                        f"UPDATE karma_intents SET settled = 1, batch_id = ? WHERE id IN ({q_marks}) AND settled = 0",
+                        (receipt_id, *intent_ids),
+                    )
+
+                if not rows:
+                    return None
+
+                settled_ids = [str(r[0]) for r in rows]
+                total = sum(float(r[1]) for r in rows)
+
+                receipt_payload = {
+                    "id": receipt_id,
+                    "intent_ids": settled_ids,
+                    "total_usd": total,
+                    "destination_wallet": destination,
+                    "tx_hash": tx_hash,
+                    "status": status,
+                    "node_id": self._identity.node_id,
+                    "created_at": created_at,
+                }
+                sig_b64 = _sign_payload(self._identity, receipt_payload)
+
                 self._db.conn.execute(
                     """
                     INSERT INTO karma_settlements (
@@ -276,37 +295,23 @@ class KarmaEngine:
                         sig_b64,
                     ),
                 )
-                self._db.conn.execute(
-                    f"""UPDATE karma_intents SET settled = 1, batch_id = ? WHERE id IN ({q_marks})""",
-                    (receipt_id, *settled_ids),
-                )
 
-            self._db.append_event(
-                event_type=EventType.KARMA_SETTLEMENT_V1,
-                payload={
-                    "receipt_id": receipt_id,
-                    "intent_ids": settled_ids,
-                    "total_usd": total,
-                    "destination_wallet": destination,
-                    "tx_hash": tx_hash,
-                    "status": status,
-                    "signature_b64": sig_b64,
-                },
-                dedupe_key=f"karma.settlement:{receipt_id}",
-                source="karma",
-            )
-            self._db.append_event(
-                event_type=EventType.KARMA_RECEIPT_V1,
-                payload={
-                    "receipt_id": receipt_id,
-                    "intent_ids": settled_ids,
-                    "total_usd": total,
-                    "destination_wallet": destination,
-                    "tx_hash": tx_hash,
-                    "status": status,
-                    "signature_b64": sig_b64,
-                },
-                dedupe_key=f"karma.receipt:{receipt_id}",
+            # Settlement and receipt events carry the same payload; append both
+            # in one transaction.
+            event_payload = {
+                "receipt_id": receipt_id,
+                "intent_ids": settled_ids,
+                "total_usd": total,
+                "destination_wallet": destination,
+                "tx_hash": tx_hash,
+                "status": status,
+                "signature_b64": sig_b64,
+            }
+            self._db.append_events_batch(
+                [
+                    (EventType.KARMA_SETTLEMENT_V1, event_payload, f"karma.settlement:{receipt_id}"),
+                    (EventType.KARMA_RECEIPT_V1, event_payload, f"karma.receipt:{receipt_id}"),
+                ],
                 source="karma",
             )
 
@@ -324,27 +329,12 @@ class KarmaEngine:
             return None
 
     def get_receipts(self) -> list[KarmaReceipt]:
-        rows = self._db.conn.execute(
+        cur = self._db.conn.cursor()
+        cur.row_factory = _receipt_from_row
+        return cur.execute(
             """
             SELECT id, intent_ids, total_usd, destination_wallet, tx_hash, status, signature, created_at
             FROM karma_settlements
             ORDER BY created_at DESC
             """
         ).fetchall()
-
-        out: list[KarmaReceipt] = []
-        for r in rows:
-            intent_ids = json.loads(str(r[1])) if r[1] is not None else []
-            out.append(
-                KarmaReceipt(
-                    id=str(r[0]),
-                    intent_ids=[str(x) for x in intent_ids],
-                    total_usd=float(r[2]),
-                    destination_wallet=str(r[3]),
-                    tx_hash=str(r[4]) if r[4] is not None else None,
-                    status=str(r[5]),
-                    signature_b64=str(r[6]) if r[6] is not None else "",
-                    created_at=str(r[7]) if r[7] is not None else "",
-                )
-            )
-        return out
@@ -79,16 +79,17 @@ class OMS:
         idem = idempotency_key or str(uuid.uuid4())
 
         # Record intent event for auditability.
+        # The payload model validates and coerces the intent's fields itself.
         payload = TradeIntentPayload(
             symbol=intent.symbol,
             direction=intent.direction,
-            size_pct=float(intent.size_pct),
-            leverage=float(intent.leverage),
-            conviction_score=float(intent.conviction_score),
-            regime=str(intent.regime),
-            rationale=str(intent.rationale),
-            stop_loss_pct=float(intent.stop_loss_pct) if intent.stop_loss_pct is not None else None,
-            take_profit_pct=float(intent.take_profit_pct) if intent.take_profit_pct is not None else None,
+            size_pct=intent.size_pct,
+            leverage=intent.leverage,
+            conviction_score=intent.conviction_score,
+            regime=intent.regime,
+            rationale=intent.rationale,
+            stop_loss_pct=intent.stop_loss_pct,
+            take_profit_pct=intent.take_profit_pct,
         ).model_dump(mode="json")
         self.db.append_event(
             event_type=EventType.TRADE_INTENT_V1,
@@ -98,19 +99,23 @@ class OMS:
             ts=_utc_now(),
         )
 
+        equity = float(equity_usd)
+        mid = float(mid_price)
+        leverage = float(intent.leverage)
+
         pf = self.preflight.check(
             intent,
             mode=mode,
-            equity_usd=float(equity_usd),
+            equity_usd=equity,
             gas_balances=gas_balances,
         )
         if not pf.approved:
-            return OMSResult(status="rejected", mode=mode, reasons=pf.reasons)
+            return OMSResult(status="rejected", mode=mode, reasons=list(pf.reasons))
 
         # Size notional (USD) - ignore intent.size_pct here; sizing uses conviction and caps.
         max_pct = float(self.config.risk.max_position_pct)
         notional = self.sizer.size_usd(
-            equity_usd=float(equity_usd),
+            equity_usd=equity,
             conviction_score=max(0.0, min(1.0, float(intent.conviction_score) / 100.0)),
             corr_to_portfolio=float(corr_to_portfolio),
             portfolio_heat_pct=float(portfolio_heat_pct),
@@ -122,68 +127,75 @@ class OMS:
         stop_loss = None
         take_profit = None
         if intent.stop_loss_pct is not None:
-            stop_loss = float(mid_price) * (1.0 - float(intent.stop_loss_pct))
+            stop_loss = mid * (1.0 - intent.stop_loss_pct)
         if intent.take_profit_pct is not None:
-            take_profit = float(mid_price) * (1.0 + float(intent.take_profit_pct))
+            take_profit = mid * (1.0 + intent.take_profit_pct)
 
         if mode == "paper":
-            fill = self.paper.execute_market(
-                symbol=intent.symbol,
-                direction=intent.direction,
-                notional_usd=float(notional),
-                leverage=float(intent.leverage),
-                mid_price=float(mid_price),
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                idempotency_key=idem,
-            )
-
-            # Persist execution events as well (redundant with tables, but useful for the event bus).
-            self.db.append_event(
-                event_type=EventType.ORDER_SUBMITTED_V1,
-                payload={
-                    "order_id": fill.order_id,
-                    "position_id": fill.position_id,
-                    "venue": "paper",
-                    "type": "market",
-                    "side": fill.side,
-                    "symbol": fill.symbol,
-                    "size": float(fill.fill_size),
-                    "idempotency_key": idem,
-                },
-                source="execution.oms",
-            )
-            self.db.append_event(
-                event_type=EventType.ORDER_FILLED_V1,
-                payload={
-                    "order_id": fill.order_id,
-                    "position_id": fill.position_id,
-                    "fill_price": float(fill.fill_price),
-                    "fill_size": float(fill.fill_size),
-                    "fee_usd": float(fill.fee_usd),
-                },
-                source="execution.oms",
-            )
-            self.db.append_event(
-                event_type=EventType.POSITION_OPENED_V1,
-                payload={
-                    "position_id": fill.position_id,
-                    "platform": "paper",
-                    "asset": fill.symbol,
-                    "direction": intent.direction,
-                    "entry_price": float(fill.fill_price),
-                    "size_notional": float(fill.notional_usd),
-                    "leverage": float(intent.leverage),
-                },
-                source="execution.oms",
-            )
+            # Fill rows and execution events commit as one transaction.
+            with self.db.transaction():
+                fill = self.paper.execute_market(
+                    symbol=intent.symbol,
+                    direction=intent.direction,
+                    notional_usd=notional,
+                    leverage=leverage,
+                    mid_price=mid,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    idempotency_key=idem,
+                )
+
+                # Persist execution events as well (redundant with tables, but useful for the event bus).
+                self.db.append_events_batch(
+                    [
+                        (
+                            EventType.ORDER_SUBMITTED_V1,
+                            {
+                                "order_id": fill.order_id,
+                                "position_id": fill.position_id,
+                                "venue": "paper",
+                                "type": "market",
+                                "side": fill.side,
+                                "symbol": fill.symbol,
+                                "size": fill.fill_size,
+                                "idempotency_key": idem,
+                            },
+                            None,
+                        ),
+                        (
+                            EventType.ORDER_FILLED_V1,
+                            {
+                                "order_id": fill.order_id,
+                                "position_id": fill.position_id,
+                                "fill_price": fill.fill_price,
+                                "fill_size": fill.fill_size,
+                                "fee_usd": fill.fee_usd,
+                            },
+                            None,
+                        ),
+                        (
+                            EventType.POSITION_OPENED_V1,
+                            {
+                                "position_id": fill.position_id,
+                                "platform": "paper",
+                                "asset": fill.symbol,
+                                "direction": intent.direction,
+                                "entry_price": fill.fill_price,
+                                "size_notional": fill.notional_usd,
+                                "leverage": leverage,
+                            },
+                            None,
+                        ),
+                    ],
+                    source="execution.oms",
+                )
 
             return OMSResult(
                 status="filled",
                 mode=mode,
                 order_id=fill.order_id,
                 position_id=fill.position_id,
-                notional_usd=float(notional),
+                notional_usd=notional,
             )
 
         if mode == "live":
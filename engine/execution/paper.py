@@ -15,14 +15,22 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from typing import Any
 
 from engine.core.database import Database
+from engine.core.time import utc_now_iso_seconds
 
-
-def _utc_now() -> datetime:
-    return datetime.now(tz=UTC).replace(microsecond=0)
+# Single-line constants: one stable key each in the connection's statement cache.
+_INSERT_POSITION_SQL = (
+    "INSERT INTO positions (id, platform, asset, direction, entry_price, size_notional, leverage, stop_loss, take_profit, opened_at, status)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'open')"
+)
+_INSERT_ORDER_SQL = (
+    "INSERT INTO orders (id, position_id, venue, type, side, symbol, size, price, fill_price, fill_size, status, idempotency_key,"
+    " created_at, filled_at, updated_at)"
+    " VALUES (?, ?, ?, 'market', ?, ?, ?, ?, ?, ?, 'filled', ?, ?, ?, ?)"
+    " ON CONFLICT(idempotency_key) DO NOTHING"
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -46,25 +54,44 @@ class PaperFill:
     realized_pnl_usd: float | None
 
 
+@dataclass(frozen=True, slots=True)
+class OpenPositionRow:
+    """The columns of an open ``positions`` row the broker reads back."""
+
+    id: str
+    asset: str
+    direction: str
+    entry_price: float
+    size_notional: float
+    leverage: float
+    status: str
+
+
 class PaperBroker:
-    """Writes orders + positions into the shared DB."""
+    """Writes orders + positions into the shared DB.
+
+    Writes go through ``Database.transaction()``, so a caller that already holds
+    a transaction (e.g. the OMS) gets the fill committed together with its own
+    writes.
+    """
 
     def __init__(self, db: Database, *, config: PaperConfig | None = None) -> None:
         self.db = db
         self.cfg = config or PaperConfig()
 
     def _fill_price(self, *, mid: float, side: str) -> float:
-        slip = float(self.cfg.slippage_bps) / 10_000.0
+        slip = self.cfg.slippage_bps / 10_000.0
         if side == "buy":
-            return float(mid) * (1.0 + slip)
-        return float(mid) * (1.0 - slip)
+            return mid * (1.0 + slip)
+        return mid * (1.0 - slip)
 
-    def _existing_open_position(self, symbol: str) -> dict[str, Any] | None:
+    def _existing_open_position(self, symbol: str) -> OpenPositionRow | None:
         row = self.db.conn.execute(
-            "SELECT * FROM positions WHERE asset = ? AND status = 'open' ORDER BY opened_at DESC LIMIT 1",
+            "SELECT id, asset, direction, entry_price, size_notional, leverage, status FROM positions"
+            " WHERE asset = ? AND status = 'open' ORDER BY opened_at DESC LIMIT 1",
             (symbol,),
         ).fetchone()
-        return None if row is None else dict(row)
+        return None if row is None else OpenPositionRow(*row)
 
     def execute_market(
         self,
@@ -79,8 +106,9 @@ class PaperBroker:
         idempotency_key: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> PaperFill:
-        sym = str(symbol).upper().strip()
-        dirn = str(direction).lower().strip()
+        # Normalise every argument once; everything below works on these locals.
+        sym = symbol.upper().strip()
+        dirn = direction.lower().strip()
         if dirn not in {"long", "short"}:
             raise ValueError("direction must be 'long' or 'short'")
 
@@ -92,86 +120,79 @@ class PaperBroker:
         if n_usd <= 0:
             raise ValueError("notional_usd must be > 0")
 
+        lev = float(leverage)
+        sl = float(stop_loss) if stop_loss is not None else None
+        tp = float(take_profit) if take_profit is not None else None
+
         side = "buy" if dirn == "long" else "sell"
         fill_px = self._fill_price(mid=mid, side=side)
         qty = n_usd / fill_px
-        fee = abs(n_usd) * float(self.cfg.fee_rate)
+        fee = n_usd * self.cfg.fee_rate
 
-        now = _utc_now().isoformat()
+        now = utc_now_iso_seconds()
 
-        # idempotency: orders table has unique constraint on idempotency_key.
+        # idempotency: orders table has unique constraint on idempotency_key; a
+        # duplicate is detected by the order insert below, not a pre-SELECT.
         idem = idempotency_key
         if idem is None:
             idem = str(uuid.uuid4())
 
-        existing = self.db.conn.execute(
-            "SELECT id, position_id, fill_price, fill_size, status FROM orders WHERE idempotency_key = ?",
-            (idem,),
-        ).fetchone()
-        if existing is not None:
-            # Already executed.
-            oid = str(existing[0])
-            pid = str(existing[1])
-            return PaperFill(
-                order_id=oid,
-                position_id=pid,
-                symbol=sym,
-                side=side,
-                fill_price=float(existing[2] or 0.0),
-                fill_size=float(existing[3] or 0.0),
-                notional_usd=float(n_usd),
-                fee_usd=float(fee),
-                realized_pnl_usd=None,
-            )
-
         order_id = str(uuid.uuid4())
         position_id = str(uuid.uuid4())
 
         # For Sprint 2A we open a new position per intent. Closing is done via PnLTracker.
-        with self.db.conn:
-            self.db.conn.execute(
-                """
-                INSERT INTO positions (
-                  id, platform, asset, direction, entry_price, size_notional, leverage,
-                  stop_loss, take_profit, opened_at, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'open')
-                """,
+        with self.db.transaction() as conn:
+            conn.execute(
+                _INSERT_POSITION_SQL,
                 (
                     position_id,
-                    str(self.cfg.platform),
+                    self.cfg.platform,
                     sym,
                     dirn,
-                    float(fill_px),
-                    float(n_usd),
-                    float(leverage),
-                    float(stop_loss) if stop_loss is not None else None,
-                    float(take_profit) if take_profit is not None else None,
+                    fill_px,
+                    n_usd,
+                    lev,
+                    sl,
+                    tp,
                     now,
                 ),
             )
-            self.db.conn.execute(
-                """
-                INSERT INTO orders (
-                  id, position_id, venue, type, side, symbol, size, price,
-                  fill_price, fill_size, status, idempotency_key, created_at, filled_at, updated_at
-                ) VALUES (?, ?, ?, 'market', ?, ?, ?, ?, ?, ?, 'filled', ?, ?, ?, ?)
-                """,
+            cur = conn.execute(
+                _INSERT_ORDER_SQL,
                 (
                     order_id,
                     position_id,
-                    str(self.cfg.venue),
+                    self.cfg.venue,
                     side,
                     sym,
-                    float(qty),
+                    qty,
                     None,
-                    float(fill_px),
-                    float(qty),
-                    str(idem),
+                    fill_px,
+                    qty,
+                    idem,
                     now,
                     now,
                     now,
                 ),
             )
+            if cur.rowcount == 0:
+                # Already executed: drop the position opened above and return the original fill.
+                conn.execute("DELETE FROM positions WHERE id = ?", (position_id,))
+                existing = conn.execute(
+                    "SELECT id, position_id, fill_price, fill_size FROM orders WHERE idempotency_key = ?",
+                    (idem,),
+                ).fetchone()
+                return PaperFill(
+                    order_id=str(existing[0]),
+                    position_id=str(existing[1]),
+                    symbol=sym,
+                    side=side,
+                    fill_price=existing[2] or 0.0,
+                    fill_size=existing[3] or 0.0,
+                    notional_usd=n_usd,
+                    fee_usd=fee,
+                    realized_pnl_usd=None,
+                )
 
         _ = metadata  # reserved
         return PaperFill(
@@ -179,9 +200,9 @@ class PaperBroker:
             position_id=position_id,
             symbol=sym,
             side=side,
-            fill_price=float(fill_px),
-            fill_size=float(qty),
-            notional_usd=float(n_usd),
-            fee_usd=float(fee),
+            fill_price=fill_px,
+            fill_size=qty,
+            notional_usd=n_usd,
+            fee_usd=fee,
             realized_pnl_usd=None,
         )
@@ -12,14 +12,32 @@ position ledger.
 
 from __future__ import annotations
 
+import sqlite3
 from dataclasses import dataclass
-from datetime import UTC, datetime
 
-from engine.core.database import Database
+from engine.core.database import POSITION_QTY_SQL, Database
+from engine.core.time import utc_now_iso_seconds
 
+# UPDATE ... RETURNING needs SQLite 3.35+.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Realized P&L is computed in SQL from the row being closed (same arithmetic as
+# unrealized_usd), so closing needs no fetch-then-update round-trip.
+_CLOSE_SQL = f"""
+    UPDATE positions SET
+        status = 'closed',
+        closed_at = ?,
+        realized_pnl = CASE direction WHEN 'long' THEN ? - entry_price ELSE entry_price - ? END * {POSITION_QTY_SQL}
+    WHERE id = ? AND status = 'open'
+"""
+
+_OPEN_BOOK_SQL = f"SELECT asset, direction, entry_price, {POSITION_QTY_SQL} FROM positions WHERE status = 'open'"
 
-def _utc_now() -> datetime:
-    return datetime.now(tz=UTC).replace(microsecond=0)
+
+def _unrealized(direction: str, entry: float, qty: float, mark: float) -> float:
+    if direction == "long":
+        return (mark - entry) * qty
+    return (entry - mark) * qty
 
 
 @dataclass(frozen=True, slots=True)
@@ -35,7 +53,7 @@ class PnLTracker:
 
     def unrealized_usd(self, *, position_id: str, mark_price: float) -> float:
         row = self.db.conn.execute(
-            "SELECT direction, entry_price, size_notional, status FROM positions WHERE id = ?",
+            f"SELECT direction, entry_price, {POSITION_QTY_SQL}, status FROM positions WHERE id = ?",
             (str(position_id),),
         ).fetchone()
         if row is None:
@@ -43,63 +61,45 @@ class PnLTracker:
         if str(row[3]) != "open":
             return 0.0
 
-        direction = str(row[0])
-        entry = float(row[1])
-        notional = float(row[2])
-        qty = notional / entry if entry > 0 else 0.0
-        mp = float(mark_price)
-
-        if direction == "long":
-            return (mp - entry) * qty
-        return (entry - mp) * qty
+        return _unrealized(str(row[0]), float(row[1]), float(row[2]), float(mark_price))
 
     def close_position(self, *, position_id: str, exit_price: float, reason: str = "") -> float:
         """Mark a position closed and store realized_pnl."""
 
-        row = self.db.conn.execute(
-            "SELECT direction, entry_price, size_notional, status FROM positions WHERE id = ?",
-            (str(position_id),),
-        ).fetchone()
-        if row is None:
-            raise ValueError("position not found")
-        if str(row[3]) != "open":
-            raise ValueError("position not open")
-
-        direction = str(row[0])
-        entry = float(row[1])
-        notional = float(row[2])
-        qty = notional / entry if entry > 0 else 0.0
+        pid = str(position_id)
         xp = float(exit_price)
+        params = (utc_now_iso_seconds(), xp, xp, pid)
+        with self.db.transaction() as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(_CLOSE_SQL + " RETURNING realized_pnl", params).fetchone()
+            else:  # pragma: no cover - SQLite < 3.35
+                row = None
+                if conn.execute(_CLOSE_SQL, params).rowcount:
+                    row = conn.execute("SELECT realized_pnl FROM positions WHERE id = ?", (pid,)).fetchone()
+            if row is None:
+                exists = conn.execute("SELECT 1 FROM positions WHERE id = ?", (pid,)).fetchone()
+                raise ValueError("position not found" if exists is None else "position not open")
 
-        realized = (xp - entry) * qty if direction == "long" else (entry - xp) * qty
-
-        now = _utc_now().isoformat()
-        with self.db.conn:
-            self.db.conn.execute(
-                "UPDATE positions SET status = 'closed', closed_at = ?, realized_pnl = ? WHERE id = ?",
-                (now, float(realized), str(position_id)),
-            )
             # Optional audit trail
             if reason:
-                self.db.conn.execute(
+                conn.execute(
                     "INSERT INTO audit_log (action, actor, component, details) VALUES (?, ?, ?, ?)",
                     ("position_closed", "system", "execution.pnl", f"{position_id}:{reason}"),
                 )
 
-        return float(realized)
+        return float(row[0])
 
     def snapshot(self, *, current_prices: dict[str, float]) -> PnLSnapshot:
+        # One read for the open book, one aggregate for realized: no per-position lookups.
         unreal = 0.0
-        for row in self.db.conn.execute("SELECT id, asset FROM positions WHERE status = 'open'").fetchall():
-            pid = str(row[0])
-            sym = str(row[1]).upper()
-            px = current_prices.get(sym)
+        rows = self.db.conn.execute(_OPEN_BOOK_SQL)
+        for asset, direction, entry, qty in rows:
+            px = current_prices.get(str(asset).upper())
             if px is None:
                 continue
-            unreal += self.unrealized_usd(position_id=pid, mark_price=float(px))
+            unreal += _unrealized(str(direction), float(entry), float(qty), float(px))
 
-        realized = 0.0
-        for row in self.db.conn.execute("SELECT realized_pnl FROM positions WHERE status = 'closed' AND realized_pnl IS NOT NULL").fetchall():
-            realized += float(row[0])
+        row = self.db.conn.execute("SELECT COALESCE(SUM(realized_pnl), 0.0) FROM positions WHERE status = 'closed' AND realized_pnl IS NOT NULL").fetchone()
+        realized = float(row[0])
 
-        return PnLSnapshot(realized_usd=float(realized), unrealized_usd=float(unreal), total_usd=float(realized + unreal))
+        return PnLSnapshot(realized_usd=realized, unrealized_usd=float(unreal), total_usd=float(realized + unreal))
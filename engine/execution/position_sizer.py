@@ -13,6 +13,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class KellyParams:
@@ -35,18 +37,33 @@ class RiskLimits:
     min_position_usd: float = 10.0
 
 
+def _kelly_fraction(kelly: KellyParams) -> float:
+    p = max(0.0, min(1.0, float(kelly.p)))
+    b = max(1e-9, float(kelly.b))
+    # Non-positive expectancy (p <= 1 / (1 + b)) never sizes a position.
+    if p * (1.0 + b) <= 1.0:
+        return 0.0
+    f = p - (1.0 - p) / b
+    return f * float(kelly.fraction_multiplier)
+
+
 class PositionSizer:
     def __init__(self, *, kelly: KellyParams | None = None, limits: RiskLimits | None = None) -> None:
         self.kelly = kelly or KellyParams()
         self.limits = limits or RiskLimits()
 
+    @property
+    def kelly(self) -> KellyParams:
+        return self._kelly
+
+    @kelly.setter
+    def kelly(self, value: KellyParams) -> None:
+        # KellyParams is frozen, so the fraction only changes when the params are replaced.
+        self._kelly = value
+        self._kelly_f = _kelly_fraction(value)
+
     def kelly_fraction(self) -> float:
-        p = max(0.0, min(1.0, float(self.kelly.p)))
-        b = max(1e-9, float(self.kelly.b))
-        q = 1.0 - p
-        f = (b * p - q) / b
-        f = max(0.0, f)
-        return float(f) * float(self.kelly.fraction_multiplier)
+        return self._kelly_f
 
     def size_usd(
         self,
@@ -119,3 +136,30 @@ class CorrelationAwareSizer:
         if sized < float(self.base.limits.min_position_usd):
             return 0.0
         return float(sized)
+
+    def size_usd_batch(
+        self,
+        *,
+        equity_usd: float,
+        conviction_scores: np.ndarray,
+        corr_to_portfolio: np.ndarray | float = 0.0,
+        portfolio_heat_pct: np.ndarray | float = 0.0,
+        max_position_pct: float | None = None,
+    ) -> np.ndarray:
+        """Vectorized :meth:`size_usd` over a batch of candidates (elementwise identical)."""
+
+        conv = np.clip(np.asarray(conviction_scores, dtype=float), 0.0, 1.0)
+        eq = max(0.0, float(equity_usd))
+        if eq <= 0:
+            return np.zeros_like(conv)
+
+        limits = self.base.limits
+        cap_pct = float(max_position_pct) if max_position_pct is not None else float(limits.max_position_pct)
+        raw_fraction = np.minimum(self.base.kelly_fraction() * (0.25 + 0.75 * conv), cap_pct)
+
+        corr = np.clip(np.abs(np.asarray(corr_to_portfolio, dtype=float)), 0.0, 1.0)
+        heat = np.clip(np.asarray(portfolio_heat_pct, dtype=float), 0.0, 1.0)
+        sized = eq * raw_fraction * np.maximum(0.0, 1.0 - corr * heat)
+
+        # mult <= 1, so this single floor also covers the base sizer's min-size check.
+        return np.where(sized < float(limits.min_position_usd), 0.0, sized)
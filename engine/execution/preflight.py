@@ -13,7 +13,9 @@ The preflight layer is a *hard gate*; it should be deterministic and easy to tes
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 from engine.brain.kill_switch import KillSwitch
@@ -24,11 +26,27 @@ class PreflightError(RuntimeError):
     pass
 
 
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+
 @dataclass(frozen=True, slots=True)
 class PreflightResult:
     approved: bool
-    reasons: list[str] = field(default_factory=list)
-    details: dict[str, Any] = field(default_factory=dict)
+    reasons: tuple[str, ...] = ()
+    # The factory hands back the shared empty proxy; nothing is allocated.
+    details: Mapping[str, Any] = field(default_factory=lambda: _NO_DETAILS)
+
+
+# Immutable, so every approval can share one instance.
+_PREFLIGHT_OK = PreflightResult(approved=True)
+
+
+# Gas amounts are compared as integer nano-units so the check needs no float epsilon.
+_GAS_SCALE = 1_000_000_000
+
+
+def _quantize_gas(amount: float) -> int:
+    return int(round(float(amount) * _GAS_SCALE))
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,6 +54,15 @@ class GasRequirement:
     venue: str
     asset: str
     min_amount: float
+    key: tuple[str, str] = field(init=False, repr=False, compare=False)
+    label: str = field(init=False, repr=False, compare=False)
+    min_amount_q: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the lookup key and quantized threshold are derived once here.
+        object.__setattr__(self, "key", (str(self.venue), str(self.asset)))
+        object.__setattr__(self, "label", f"{self.venue}:{self.asset}")
+        object.__setattr__(self, "min_amount_q", _quantize_gas(self.min_amount))
 
 
 class Preflight:
@@ -59,37 +86,80 @@ class Preflight:
         kill_switch_level: int | None = None,
         gas_balances: dict[tuple[str, str], float] | None = None,
     ) -> PreflightResult:
+        return self.check_many(
+            [intent],
+            mode=mode,
+            equity_usd=equity_usd,
+            kill_switch_level=kill_switch_level,
+            gas_balances=gas_balances,
+        )[0]
+
+    def check_many(
+        self,
+        intents: list[Any],
+        *,
+        mode: str,
+        equity_usd: float,
+        kill_switch_level: int | None = None,
+        gas_balances: dict[tuple[str, str], float] | None = None,
+    ) -> list[PreflightResult]:
+        """Preflight a batch of intents against one portfolio snapshot.
+
+        Kill switch and gas checks do not depend on the intent, so they run once
+        and their outcome is shared; only the policy pretrade check is per intent.
+        """
+
         m = str(mode)
-        reasons: list[str] = []
-        details: dict[str, Any] = {"mode": m}
+        equity = float(equity_usd)
+        kill_reasons: list[str] = []
+        gas_reasons: list[str] = []
 
-        # Kill switch gate (canonical source of truth)
+        # Kill switch gate (canonical source of truth); the policy check is a no-op at level 0.
         level = int(kill_switch_level) if kill_switch_level is not None else int(self.kill_switch.level)
-        details["kill_switch_level"] = level
-        try:
-            self.policy.check_kill_switch(level=level)
-        except PolicyViolation as e:
-            reasons.append(e.rule)
-
-        # TradingPolicyEngine handles daily loss + position size + leverage
-        try:
-            self.policy.pretrade_check(intent, equity_usd=float(equity_usd), kill_switch_level=level)
-        except PolicyViolation as e:
-            reasons.append(e.rule)
-            details.setdefault("policy_message", str(e))
+        if level > 0:
+            try:
+                self.policy.check_kill_switch(level=level)
+            except PolicyViolation as e:
+                kill_reasons.append(e.rule)
 
         # Gas checks are only meaningful in live mode.
+        gas: Mapping[str, float] | None = None
         if m == "live" and self.gas_requirements:
+            have_by_label: dict[str, float] = {}
             balances = gas_balances or {}
             for req in self.gas_requirements:
-                key = (str(req.venue), str(req.asset))
-                have = float(balances.get(key, 0.0))
-                details.setdefault("gas", {})[f"{req.venue}:{req.asset}"] = have
-                if have + 1e-12 < float(req.min_amount):
-                    reasons.append("insufficient_gas")
+                have = float(balances.get(req.key, 0.0))
+                have_by_label[req.label] = have
+                if _quantize_gas(have) < req.min_amount_q:
+                    gas_reasons.append("insufficient_gas")
                     break
-
-        return PreflightResult(approved=(len(reasons) == 0), reasons=reasons, details=details)
+            gas = MappingProxyType(have_by_label)
+
+        results: list[PreflightResult] = []
+        for intent in intents:
+            reasons = list(kill_reasons)
+
+            # TradingPolicyEngine handles daily loss + position size + leverage
+            policy_message: str | None = None
+            try:
+                self.policy.pretrade_check(intent, equity_usd=equity, kill_switch_level=level)
+            except PolicyViolation as e:
+                reasons.append(e.rule)
+                policy_message = str(e)
+            reasons.extend(gas_reasons)
+
+            # Green paper-mode path: nothing to explain, so skip building details.
+            if not reasons and gas is None:
+                results.append(_PREFLIGHT_OK)
+                continue
+
+            details: dict[str, Any] = {"mode": m, "kill_switch_level": level}
+            if policy_message is not None:
+                details["policy_message"] = policy_message
+            if gas is not None:
+                details["gas"] = gas
+            results.append(PreflightResult(approved=not reasons, reasons=tuple(reasons), details=MappingProxyType(details)))
+        return results
 
 
 def default_policy_from_risk(
@@ -17,7 +17,6 @@ scheduler to be useful. The orchestrator (or operator) can call `run_*()`.
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
@@ -25,9 +24,12 @@ from engine.brain.learning import LearningLoop, write_learned_weights_yaml
 from engine.core.config import Config
 from engine.core.database import Database
 from engine.core.time import utc_now
+from engine.core.types import OutcomeAttribution, WeightAdjustment
 
 CycleType = Literal["daily", "weekly", "monthly"]
 
+_INSERT_WEIGHT_SQL = "INSERT INTO learning_weights (cycle_type, domain, old_weight, new_weight, delta, reason, ts) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
 
 def _iso(dt: datetime) -> str:
     if dt.tzinfo is None:
@@ -35,13 +37,49 @@ def _iso(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat()
 
 
+# Hand-rolled instead of dataclasses.asdict, which deep-copies field by field.
+# The nested dicts only hold floats, so a shallow copy gives the same result.
+def _attribution_to_dict(a: OutcomeAttribution) -> dict[str, Any]:
+    return {
+        "position_id": a.position_id,
+        "conviction_id": a.conviction_id,
+        "realized_pnl": a.realized_pnl,
+        "direction_correct": a.direction_correct,
+        "time_held_hours": a.time_held_hours,
+        "max_drawdown_pct": a.max_drawdown_pct,
+        "regime_at_entry": a.regime_at_entry,
+        "domain_scores_at_entry": dict(a.domain_scores_at_entry),
+    }
+
+
+def _weight_adj_to_dict(wa: WeightAdjustment) -> dict[str, Any]:
+    return {
+        "previous_weights": dict(wa.previous_weights),
+        "new_weights": dict(wa.new_weights),
+        "deltas": dict(wa.deltas),
+        "observations": wa.observations,
+        "window_days": wa.window_days,
+        "applied": wa.applied,
+        "reason": wa.reason,
+    }
+
+
 class LearningLoopIntegration:
     def __init__(self, *, db: Database, config: Config):
         self.db = db
         self.config = config
         self.loop = LearningLoop(db=db, config=config)
+        # Last persisted run per cycle type; dropped whenever this instance writes history.
+        self._last_run_cache: dict[str, datetime | None] = {}
 
     def _last_run_ts(self, cycle_type: CycleType) -> datetime | None:
+        if cycle_type in self._last_run_cache:
+            return self._last_run_cache[cycle_type]
+        last = self._load_last_run_ts(cycle_type)
+        self._last_run_cache[cycle_type] = last
+        return last
+
+    def _load_last_run_ts(self, cycle_type: CycleType) -> datetime | None:
         row = self.db.conn.execute(
             "SELECT ts FROM learning_weights WHERE cycle_type = ? ORDER BY ts DESC LIMIT 1",
             (str(cycle_type),),
@@ -67,31 +105,26 @@ class LearningLoopIntegration:
             return (ref - last) >= timedelta(days=30)
         return False
 
+    def _record_weight_changes(self, cycle_type: CycleType, wa: WeightAdjustment, ts: str) -> None:
+        # One timestamp per cycle; all domains go in as a single executemany. The
+        # learning loop already hands back str domains and float weights.
+        reason = wa.reason
+        new = wa.new_weights
+        rows = []
+        for domain, old_w in wa.previous_weights.items():
+            new_w = new.get(domain, old_w)
+            rows.append((cycle_type, domain, old_w, new_w, new_w - old_w, reason, ts))
+        with self.db.conn:
+            self.db.conn.executemany(_INSERT_WEIGHT_SQL, rows)
+        self._last_run_cache.pop(cycle_type, None)
+
     def run_monthly(self) -> dict[str, Any]:
         result = self.loop.run()
 
         wa = result.weight_adjustment
         # Persist domain weight changes to DB history.
         if wa.applied and wa.new_weights != wa.previous_weights:
-            with self.db.conn:
-                for domain, old_w in wa.previous_weights.items():
-                    new_w = float(wa.new_weights.get(domain, old_w))
-                    delta = float(new_w - float(old_w))
-                    self.db.conn.execute(
-                        """
-                        INSERT INTO learning_weights (cycle_type, domain, old_weight, new_weight, delta, reason, ts)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            "monthly",
-                            str(domain),
-                            float(old_w),
-                            float(new_w),
-                            float(delta),
-                            str(wa.reason),
-                            _iso(result.cycle_timestamp),
-                        ),
-                    )
+            self._record_weight_changes("monthly", wa, _iso(result.cycle_timestamp))
 
             # Persist overlay YAML.
             write_learned_weights_yaml(self.config, wa.new_weights)
@@ -99,34 +132,16 @@ class LearningLoopIntegration:
         return {
             "cycle_type": "monthly",
             "timestamp": result.cycle_timestamp,
-            "weight_adjustment": asdict(wa),
-            "outcome_attributions": [asdict(a) for a in result.outcome_attributions],
+            "weight_adjustment": _weight_adj_to_dict(wa),
+            "outcome_attributions": [_attribution_to_dict(a) for a in result.outcome_attributions],
         }
 
     def run_weekly(self) -> dict[str, Any]:
         # Weekly: only propose/compute weight adjustment.
         wa = self.loop.adjust_domain_weights()
         if wa.applied and wa.new_weights != wa.previous_weights:
-            with self.db.conn:
-                for domain, old_w in wa.previous_weights.items():
-                    new_w = float(wa.new_weights.get(domain, old_w))
-                    delta = float(new_w - float(old_w))
-                    self.db.conn.execute(
-                        """
-                        INSERT INTO learning_weights (cycle_type, domain, old_weight, new_weight, delta, reason, ts)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            "weekly",
-                            str(domain),
-                            float(old_w),
-                            float(new_w),
-                            float(delta),
-                            str(wa.reason),
-                            _iso(utc_now()),
-                        ),
-                    )
-        return {"cycle_type": "weekly", "weight_adjustment": asdict(wa)}
+            self._record_weight_changes("weekly", wa, _iso(utc_now()))
+        return {"cycle_type": "weekly", "weight_adjustment": _weight_adj_to_dict(wa)}
 
     def run_daily(self) -> dict[str, Any]:
         # Daily: attribution only (writes outcomes back to conviction_scores).
@@ -134,5 +149,5 @@ class LearningLoopIntegration:
         return {
             "cycle_type": "daily",
             "timestamp": res.cycle_timestamp,
-            "attributions": [asdict(a) for a in res.outcome_attributions],
+            "attributions": [_attribution_to_dict(a) for a in res.outcome_attributions],
         }
@@ -32,14 +32,15 @@ def write_outcome_for_closed_position(
 ) -> dict[str, Any]:
     """Compute and persist outcome attribution for a closed position."""
 
-    row = db.conn.execute("SELECT * FROM positions WHERE id = ?", (str(position_id),)).fetchone()
+    # Primary-key probe for just the two columns checked here.
+    row = db.conn.execute("SELECT status, realized_pnl FROM positions WHERE id = ?", (str(position_id),)).fetchone()
     if row is None:
         raise ValueError(f"Unknown position_id: {position_id}")
 
-    if str(row["status"]) != "closed":
+    status, realized_pnl = row
+    if status != "closed":
         raise ValueError(f"Position {position_id} is not closed")
 
-    realized_pnl = row["realized_pnl"]
     if realized_pnl is None:
         raise ValueError(f"Position {position_id} missing realized_pnl")
 
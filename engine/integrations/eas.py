@@ -12,6 +12,7 @@ This module intentionally implements only a minimal subset.
 
 from __future__ import annotations
 
+import functools
 import json
 import time
 from dataclasses import dataclass
@@ -22,30 +23,58 @@ import httpx
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 ZERO_BYTES32 = "0x" + "00" * 32
 
+# Keep-alive pool for the JSON-RPC endpoint; connect failures are retried by the transport.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+_HTTP_RETRIES = 2
+
+
+@functools.cache
+def _eth() -> tuple[Any, Any]:
+    """Resolve ``(Account, encode_typed_data)`` once; failures are not cached, so a later install is picked up."""
 
-def _require_eth_account() -> None:
     try:
-        import eth_account  # type: ignore[import-not-found]  # noqa: F401
+        from eth_account import Account  # type: ignore[import-not-found]
+        from eth_account.messages import encode_typed_data  # type: ignore[import-not-found]
     except Exception as e:  # pragma: no cover
         raise RuntimeError("EAS support requires eth-account (install with: pip install b1e55ed[eas])") from e
+    return Account, encode_typed_data
 
 
-def _norm_hex32(v: str) -> str:
-    s = str(v)
+def _require_eth_account() -> None:
+    _eth()
+
+
+_HEXCHARS = frozenset("0123456789abcdef")
+
+
+def _norm_hex(v: str, nbytes: int, what: str) -> str:
+    s = str(v).lower()
     if not s.startswith("0x"):
         s = "0x" + s
-    if len(s) != 66:
-        raise ValueError(f"expected 32-byte hex string, got {v}")
-    return s.lower()
+    if len(s) != 2 + 2 * nbytes or not _HEXCHARS.issuperset(s[2:]):
+        raise ValueError(f"expected {what} hex string, got {v}")
+    return s
+
+
+def _norm_hex32(v: str) -> str:
+    return _norm_hex(v, 32, "32-byte")
 
 
 def _norm_addr(v: str) -> str:
-    s = str(v)
-    if not s.startswith("0x"):
-        s = "0x" + s
-    if len(s) != 42:
-        raise ValueError(f"expected address hex string, got {v}")
-    return s.lower()
+    return _norm_hex(v, 20, "address")
+
+
+def _as_bytes(v: bytes | bytearray | memoryview | str, nbytes: int, what: str) -> bytes:
+    if isinstance(v, bytes | bytearray | memoryview):
+        b = bytes(v)
+        if len(b) != nbytes:
+            raise ValueError(f"expected {what} value, got {len(b)} bytes")
+        return b
+    return bytes.fromhex(_norm_hex(v, nbytes, what)[2:])
+
+
+def _as_bytes32(v: bytes | bytearray | memoryview | str) -> bytes:
+    return _as_bytes(v, 32, "32-byte")
 
 
 def _keccak_bytes(data: bytes) -> bytes:
@@ -56,6 +85,27 @@ def _keccak_bytes(data: bytes) -> bytes:
     return keccak(data)
 
 
+# EIP-712 type layout is fixed, so it is built once and shared (read-only) by every
+# typed-data message; only the domain varies per client.
+_EIP712_TYPES: dict[str, list[dict[str, str]]] = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Attestation": [
+        {"name": "schema", "type": "bytes32"},
+        {"name": "recipient", "type": "address"},
+        {"name": "time", "type": "uint64"},
+        {"name": "expirationTime", "type": "uint64"},
+        {"name": "revocable", "type": "bool"},
+        {"name": "refUID", "type": "bytes32"},
+        {"name": "data", "type": "bytes"},
+    ],
+}
+
+
 @dataclass(frozen=True)
 class AttestationData:
     schema_uid: str
@@ -95,7 +145,27 @@ class EASClient:
         self._schema_registry = _norm_addr(schema_registry_address)
         self._private_key = str(private_key)
         self._chain_id = int(chain_id)
-        self._http = httpx.Client(timeout=30)
+        self._eip712_domain: dict[str, Any] = {
+            "name": "EAS Attestation",
+            "version": "1.0",
+            "chainId": self._chain_id,
+            "verifyingContract": self._eas,
+        }
+        self._http = httpx.Client(
+            timeout=30,
+            transport=httpx.HTTPTransport(limits=_HTTP_LIMITS, retries=_HTTP_RETRIES),
+        )
+
+    def close(self) -> None:
+        """Release pooled RPC connections."""
+
+        self._http.close()
+
+    def __enter__(self) -> EASClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def register_schema(self, schema: str, *, resolver: str = ZERO_ADDRESS, revocable: bool = True) -> str:
         raise NotImplementedError("Schema registration should be done manually via etherscan or deployment script")
@@ -103,46 +173,27 @@ class EASClient:
     def _eip712_typed_data(
         self,
         *,
-        schema_uid: str,
+        schema_uid: str | bytes,
         recipient: str,
         attested_at: int,
         expiration: int,
         revocable: bool,
-        ref_uid: str,
+        ref_uid: str | bytes,
         payload_bytes: bytes,
     ) -> dict[str, Any]:
+        # Callers pass already-normalised values: hex strings when the message is
+        # emitted as JSON, raw bytes32 when it is only hashed for verification.
         return {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-                "Attestation": [
-                    {"name": "schema", "type": "bytes32"},
-                    {"name": "recipient", "type": "address"},
-                    {"name": "time", "type": "uint64"},
-                    {"name": "expirationTime", "type": "uint64"},
-                    {"name": "revocable", "type": "bool"},
-                    {"name": "refUID", "type": "bytes32"},
-                    {"name": "data", "type": "bytes"},
-                ],
-            },
+            "types": _EIP712_TYPES,
             "primaryType": "Attestation",
-            "domain": {
-                "name": "EAS Attestation",
-                "version": "1.0",
-                "chainId": int(self._chain_id),
-                "verifyingContract": self._eas,
-            },
+            "domain": self._eip712_domain,
             "message": {
-                "schema": _norm_hex32(schema_uid),
-                "recipient": _norm_addr(recipient),
+                "schema": schema_uid,
+                "recipient": recipient,
                 "time": int(attested_at),
                 "expirationTime": int(expiration),
                 "revocable": bool(revocable),
-                "refUID": _norm_hex32(ref_uid),
+                "refUID": ref_uid,
                 "data": payload_bytes,
             },
         }
@@ -153,24 +204,23 @@ class EASClient:
         Returns a JSON-serializable signed object.
         """
 
-        _require_eth_account()
+        account, encode_typed_data = _eth()
         if not self._private_key:
             raise ValueError("attester private_key is required to create off-chain attestations")
 
-        from eth_account import Account
-        from eth_account.messages import encode_typed_data  # type: ignore[import-not-found]
-
-        acct = Account.from_key(self._private_key)
+        acct = account.from_key(self._private_key)
         attester = str(acct.address).lower()
 
         ts = int(time.time())
-        ref = data.ref_uid or ZERO_BYTES32
+        schema_uid = _norm_hex32(data.schema_uid)
+        recipient = _norm_addr(data.recipient)
+        ref = _norm_hex32(data.ref_uid or ZERO_BYTES32)
 
         payload_bytes = json.dumps(data.data, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
         typed = self._eip712_typed_data(
-            schema_uid=data.schema_uid,
-            recipient=data.recipient,
+            schema_uid=schema_uid,
+            recipient=recipient,
             attested_at=ts,
             expiration=int(data.expiration or 0),
             revocable=bool(data.revocable),
@@ -179,26 +229,28 @@ class EASClient:
         )
 
         msg = encode_typed_data(full_message=typed)
-        sig = Account.sign_message(msg, private_key=self._private_key).signature
+        sig = account.sign_message(msg, private_key=self._private_key).signature
         sig_hex = "0x" + sig.hex()
 
         uid = "0x" + _keccak_bytes(sig).hex()
 
         return {
             "uid": uid,
-            "schema_uid": _norm_hex32(data.schema_uid),
+            "schema_uid": schema_uid,
             "attester": attester,
-            "recipient": _norm_addr(data.recipient),
+            "recipient": recipient,
             "time": ts,
             "expiration": int(data.expiration or 0),
             "revocable": bool(data.revocable),
-            "ref_uid": _norm_hex32(ref),
-            "data": json.loads(payload_bytes.decode("utf-8")),
+            "ref_uid": ref,
+            # Decoded from the signed bytes so it always matches data_bytes.
+            "data": json.loads(payload_bytes),
             "data_bytes": "0x" + payload_bytes.hex(),
             "signature": sig_hex,
             "eip712": {
-                "domain": typed["domain"],
-                "types": typed["types"],
+                # Copies: the shared domain/type dicts must not escape to callers.
+                "domain": dict(typed["domain"]),
+                "types": {name: [dict(f) for f in fields] for name, fields in typed["types"].items()},
                 "primaryType": typed["primaryType"],
                 # message is not included here because `data` is bytes; we include both
                 # a decoded dict (`data`) and hex (`data_bytes`) for verifiers.
@@ -211,21 +263,28 @@ class EASClient:
         }
 
     def verify_offchain_attestation(self, attestation: dict[str, Any]) -> bool:
-        _require_eth_account()
+        account, encode_typed_data = _eth()
+        return self._verify(attestation, account, encode_typed_data)
 
-        from eth_account import Account
-        from eth_account.messages import encode_typed_data
+    def verify_many(self, attestations: list[dict[str, Any]]) -> list[bool]:
+        """Verify a batch of off-chain attestations; same result per item as :meth:`verify_offchain_attestation`."""
 
+        account, encode_typed_data = _eth()
+        verify = self._verify
+        return [verify(a, account, encode_typed_data) for a in attestations]
+
+    def _verify(self, attestation: dict[str, Any], account: Any, encode_typed_data: Any) -> bool:
         try:
             sig_hex = str(attestation.get("signature") or "")
             sig = bytes.fromhex(sig_hex.removeprefix("0x"))
 
-            schema_uid = _norm_hex32(str(attestation.get("schema_uid") or ""))
+            # bytes32 fields are only hashed here, so they go to the encoder as raw bytes.
+            schema_uid = _as_bytes32(attestation.get("schema_uid") or "")
             recipient = _norm_addr(str(attestation.get("recipient") or ZERO_ADDRESS))
             ts = int(attestation.get("time") or 0)
             expiration = int(attestation.get("expiration") or 0)
             revocable = bool(attestation.get("revocable") is True)
-            ref_uid = _norm_hex32(str(attestation.get("ref_uid") or ZERO_BYTES32))
+            ref_uid = _as_bytes32(attestation.get("ref_uid") or ZERO_BYTES32)
 
             data_bytes_hex = str(attestation.get("data_bytes") or "")
             payload_bytes = bytes.fromhex(data_bytes_hex.removeprefix("0x"))
@@ -240,7 +299,7 @@ class EASClient:
                 payload_bytes=payload_bytes,
             )
             msg = encode_typed_data(full_message=typed)
-            recovered = str(Account.recover_message(msg, signature=sig)).lower()
+            recovered = str(account.recover_message(msg, signature=sig)).lower()
             attester = str(attestation.get("attester") or "").lower()
 
             if not attester:
@@ -270,3 +329,27 @@ class EASClient:
         if "error" in out:
             raise RuntimeError(str(out["error"]))
         return out.get("result")
+
+    def rpc_batch(self, calls: list[tuple[str, list[object]]]) -> list[Any]:
+        """Send several JSON-RPC calls in one POST; results come back in call order."""
+
+        if not calls:
+            return []
+        payload = [{"jsonrpc": "2.0", "id": i, "method": str(method), "params": list(params)} for i, (method, params) in enumerate(calls)]
+        r = self._http.post(self._rpc_url, json=payload)
+        r.raise_for_status()
+        out = r.json()
+        if not isinstance(out, list):
+            # Nodes answer a malformed batch with a single error object.
+            raise RuntimeError(str(out.get("error") if isinstance(out, dict) else out))
+        # Servers may answer a batch in any order; match responses back by id.
+        by_id = {o.get("id"): o for o in out}
+        results: list[Any] = []
+        for i in range(len(calls)):
+            o = by_id.get(i)
+            if o is None:
+                raise RuntimeError(f"missing JSON-RPC response for batch id {i}")
+            if "error" in o:
+                raise RuntimeError(str(o["error"]))
+            results.append(o.get("result"))
+        return results
@@ -36,11 +36,13 @@ accidental schema changes.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
 CONTRIBUTOR_SCHEMA = "bytes32 nodeId, string name, string role, string version, uint64 registeredAt"
 
 
+@functools.lru_cache(maxsize=64)
 def compute_schema_hash(schema: str) -> str:
     """Compute a deterministic hash of the schema string.
 
@@ -57,7 +59,9 @@ def compute_schema_hash(schema: str) -> str:
     return "0x" + h.hex()
 
 
-EXPECTED_SCHEMA_HASH = compute_schema_hash(CONTRIBUTOR_SCHEMA)
+# keccak256(CONTRIBUTOR_SCHEMA), precomputed so importing this module needs
+# neither eth-utils nor a hash at startup. Pinned by test_schema_hash_is_stable.
+EXPECTED_SCHEMA_HASH = "0x2eba868d26fc0f641257dff7b93c1d9970c3e15a216e4d28419d2bfd18633417"
 
 
 @dataclass(frozen=True, slots=True)
@@ -1,11 +1,15 @@
 """engine.integrations.forge
 
 Pure-Python vanity address grinder (fallback when Rust binary unavailable).
-~50K candidates/sec on a single core. Use the Rust grinder for production.
+~50K candidates/sec on a single core; ``workers`` spreads the search over
+processes. Use the Rust grinder for production.
 """
 
 from __future__ import annotations
 
+import multiprocessing as mp
+import os
+import queue
 import time
 from collections.abc import Generator
 from typing import Any
@@ -39,51 +43,137 @@ def _keccak256(data: bytes) -> bytes:
         raise ImportError("No keccak256 implementation available. Install eth-account or pycryptodome.") from e
 
 
-def grind(prefix: str = "b1e55ed", *, report_interval: float = 1.0) -> Generator[dict[str, Any], None, None]:
+_BATCH_KEYS = 4096
+
+
+def _prefix_matcher(prefix: str) -> tuple[int, int, int]:
+    """Return ``(nbytes, shift, target)`` so a raw address matches when
+    ``int.from_bytes(addr[:nbytes]) >> shift == target``."""
+
+    nibbles = len(prefix)
+    nbytes = (nibbles + 1) // 2
+    target = int(prefix, 16) if prefix else 0
+    return nbytes, 4 * (nibbles % 2), target
+
+
+def grind(
+    prefix: str = "b1e55ed",
+    *,
+    report_interval: float = 1.0,
+    workers: int = 1,
+) -> Generator[dict[str, Any], None, None]:
     """Grind for a vanity Ethereum address.
 
-    Yields progress dicts and finally a 'found' dict.
+    Yields progress dicts and finally a 'found' dict. With ``workers > 1`` the
+    search runs in that many processes and their candidate counts are merged.
 
-    Uses eth_account for key generation.
+    Keys are drawn from the OS CSPRNG in batches and derived with eth_keys (which
+    uses libsecp256k1 via coincurve when installed); the prefix test runs on the
+    raw address bytes, so only the winning candidate is hex-encoded.
     """
 
     try:
-        from eth_account import Account  # type: ignore[import-not-found]
+        from eth_keys import keys  # type: ignore[import-not-found]
+        from eth_utils import keccak, to_checksum_address  # type: ignore[import-not-found]
     except Exception as e:
         raise ImportError("eth-account required for Python grinder. Install with: uv sync --extra eas") from e
 
-    prefix_lower = prefix.lower()
+    if workers > 1:
+        yield from _grind_parallel(prefix, report_interval=report_interval, workers=workers)
+        return
+
+    private_key = keys.PrivateKey
+    nbytes, shift, target = _prefix_matcher(prefix.lower())
     candidates = 0
     start = time.monotonic()
     last_report = start
 
     while True:
-        acct = Account.create()
-        addr = acct.address.lower()
-        pk = acct.key.hex()
-
-        candidates += 1
-
-        # Check prefix (skip "0x")
-        if addr[2 : 2 + len(prefix_lower)] == prefix_lower:
-            elapsed_ms = int((time.monotonic() - start) * 1000)
-            yield {
-                "type": "found",
-                "address": acct.address,
-                "private_key": pk,
-                "candidates": candidates,
-                "elapsed_ms": elapsed_ms,
-            }
-            return
-
-        now = time.monotonic()
-        if now - last_report >= report_interval:
-            elapsed_ms = int((now - start) * 1000)
-            rate = int(candidates / (now - start)) if now > start else 0
-            yield {
-                "type": "progress",
-                "candidates": candidates,
-                "elapsed_ms": elapsed_ms,
-                "rate": rate,
-            }
-            last_report = now
+        buf = os.urandom(32 * _BATCH_KEYS)
+        for off in range(0, len(buf), 32):
+            sk = buf[off : off + 32]
+            try:
+                pub = private_key(sk).public_key.to_bytes()
+            except Exception:
+                # Zero or >= curve order; vanishingly rare, just draw again.
+                continue
+            addr = keccak(pub)[-20:]
+            candidates += 1
+
+            if int.from_bytes(addr[:nbytes], "big") >> shift == target:
+                elapsed_ms = int((time.monotonic() - start) * 1000)
+                yield {
+                    "type": "found",
+                    "address": to_checksum_address(addr),
+                    "private_key": "0x" + sk.hex(),
+                    "candidates": candidates,
+                    "elapsed_ms": elapsed_ms,
+                }
+                return
+
+            now = time.monotonic()
+            if now - last_report >= report_interval:
+                elapsed_ms = int((now - start) * 1000)
+                rate = int(candidates / (now - start)) if now > start else 0
+                yield {
+                    "type": "progress",
+                    "candidates": candidates,
+                    "elapsed_ms": elapsed_ms,
+                    "rate": rate,
+                }
+                last_report = now
+
+
+def _grind_worker(prefix: str, report_interval: float, worker_id: int, out: Any) -> None:
+    for msg in grind(prefix, report_interval=report_interval):
+        out.put((worker_id, msg))
+
+
+def _grind_parallel(prefix: str, *, report_interval: float, workers: int) -> Generator[dict[str, Any], None, None]:
+    # Each worker runs the single-process grinder. Spawned rather than forked:
+    # the parent may already run threads (webhook workers, timers), and forking
+    # a multi-threaded process can deadlock.
+    ctx = mp.get_context("spawn")
+    out: Any = ctx.Queue()
+    procs = [ctx.Process(target=_grind_worker, args=(prefix, report_interval, w, out), daemon=True) for w in range(workers)]
+    counts = [0] * workers
+    start = time.monotonic()
+    last_report = start
+
+    try:
+        for proc in procs:
+            proc.start()
+
+        while True:
+            try:
+                worker_id, msg = out.get(timeout=report_interval)
+            except queue.Empty:
+                if not any(proc.is_alive() for proc in procs):
+                    raise RuntimeError("all forge workers exited without finding an address") from None
+                continue
+
+            if msg["type"] == "found":
+                counts[worker_id] = int(msg["candidates"])
+                yield {
+                    **msg,
+                    "candidates": sum(counts),
+                    "elapsed_ms": int((time.monotonic() - start) * 1000),
+                }
+                return
+
+            counts[worker_id] = int(msg["candidates"])
+            now = time.monotonic()
+            if now - last_report >= report_interval:
+                candidates = sum(counts)
+                yield {
+                    "type": "progress",
+                    "candidates": candidates,
+                    "elapsed_ms": int((now - start) * 1000),
+                    "rate": int(candidates / (now - start)) if now > start else 0,
+                }
+                last_report = now
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.join()
@@ -15,7 +15,7 @@ from engine.core.config import Config
 from engine.core.database import Database
 from engine.core.events import EventType
 from engine.core.policy import TradingPolicy, TradingPolicyEngine
-from engine.core.webhooks import list_webhook_subscriptions
+from engine.core.webhooks import list_webhook_subscriptions, wait_for_webhooks
 from engine.execution.oms import OMS, default_sizer_from_config
 from engine.execution.paper import PaperBroker
 from engine.execution.preflight import Preflight
@@ -293,10 +293,10 @@ def test_webhook_delivery(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> No
 
     sent: list[dict[str, object]] = []
 
-    def fake_post_json(url: str, payload: dict[str, object], *, timeout_s: float) -> None:
-        sent.append({"url": url, "payload": payload, "timeout_s": timeout_s})
+    def fake_post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+        sent.append({"url": url, "payload": json.loads(body), "timeout_s": timeout_s})
 
-    monkeypatch.setattr("engine.core.webhooks._post_json", fake_post_json)
+    monkeypatch.setattr("engine.core.webhooks._post_bytes", fake_post_bytes)
 
     db.append_event(
         event_type=EventType.SIGNAL_PRICE_ALERT_V1,
@@ -304,6 +304,8 @@ def test_webhook_delivery(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> No
         ts=datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
     )
 
+    wait_for_webhooks()
+
     assert len(sent) == 1
     assert sent[0]["url"] == "http://example/hook"
     assert sent[0]["payload"]["event"]["type"] == str(EventType.SIGNAL_PRICE_ALERT_V1)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import fields
 from datetime import UTC, datetime, timedelta
 
 from engine.core.database import Database
+from engine.core.types import OutcomeAttribution, WeightAdjustment
 from engine.integration.learning_loop import LearningLoopIntegration
 
 
@@ -84,7 +86,10 @@ def test_learning_monthly_cycle_persists_weights(test_config, temp_dir):
         )
 
     integ = LearningLoopIntegration(db=db, config=test_config)
+    assert integ.should_run("monthly") is True
     summary = integ.run_monthly()
+    # Writing history drops the cached "never ran" answer.
+    assert integ.should_run("monthly") is False
 
     # Learned weights file written
     learned_path = test_config.data_dir / "learned_weights.yaml"
@@ -96,3 +101,9 @@ def test_learning_monthly_cycle_persists_weights(test_config, temp_dir):
 
     wa = summary["weight_adjustment"]
     assert wa["applied"] is True
+    # The summary serializers must cover every dataclass field.
+    assert set(wa) == {f.name for f in fields(WeightAdjustment)}
+    assert summary["outcome_attributions"]
+    assert set(summary["outcome_attributions"][0]) == {f.name for f in fields(OutcomeAttribution)}
+    hist = db.conn.execute("SELECT COUNT(*), COUNT(DISTINCT ts), SUM(ABS(delta - (new_weight - old_weight)) > 1e-12) FROM learning_weights").fetchone()
+    assert tuple(hist) == (len(wa["previous_weights"]), 1, 0)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 
 from engine.core.database import Database
 from engine.core.events import EventType
-from engine.core.webhooks import add_webhook_subscription
+from engine.core.webhooks import add_webhook_subscription, wait_for_webhooks
 
 
 def test_append_event_triggers_webhook_dispatch(temp_dir, monkeypatch) -> None:
@@ -14,10 +15,10 @@ def test_append_event_triggers_webhook_dispatch(temp_dir, monkeypatch) -> None:
 
     sent: list[dict[str, object]] = []
 
-    def fake_post_json(url: str, payload: dict[str, object], *, timeout_s: float) -> None:
-        sent.append({"url": url, "payload": payload, "timeout_s": timeout_s})
+    def fake_post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+        sent.append({"url": url, "payload": json.loads(body), "timeout_s": timeout_s})
 
-    monkeypatch.setattr("engine.core.webhooks._post_json", fake_post_json)
+    monkeypatch.setattr("engine.core.webhooks._post_bytes", fake_post_bytes)
 
     db.append_event(
         event_type=EventType.SIGNAL_PRICE_ALERT_V1,
@@ -25,6 +26,8 @@ def test_append_event_triggers_webhook_dispatch(temp_dir, monkeypatch) -> None:
         ts=datetime.now(tz=UTC),
     )
 
+    wait_for_webhooks()
+
     assert len(sent) == 1
     assert sent[0]["url"] == "http://example/hook"
     assert sent[0]["payload"]["event"]["type"] == str(EventType.SIGNAL_PRICE_ALERT_V1)
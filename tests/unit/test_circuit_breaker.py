@@ -41,3 +41,31 @@ def test_call_raises_when_limited() -> None:
 
     with pytest.raises(CircuitBreakerError):
         br.call(lambda: 123)
+
+
+def test_token_bucket_ignores_clock_going_backwards() -> None:
+    bucket = TokenBucket(capacity=2, refill_rate_per_s=1.0, tokens=0.0, updated_at=10.0)
+
+    assert bucket.try_take(now=5.0) is False
+    assert bucket.tokens == 0.0
+    assert bucket.wait_time_s(now=5.0) == 1.0
+
+    assert bucket.try_take(now=6.5) is True
+    assert abs(bucket.tokens - 0.5) < 1e-12
+    assert bucket.try_take(0.0, now=0.0) is True
+
+
+def test_call_reads_the_clock_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    bucket = TokenBucket(capacity=1, refill_rate_per_s=1.0, tokens=0.0, updated_at=0.0)
+    br = CircuitBreaker(name="venue", bucket=bucket)
+    reads: list[float] = []
+
+    def fake_monotonic() -> float:
+        reads.append(0.25)
+        return 0.25
+
+    monkeypatch.setattr("engine.execution.circuit_breaker.time.monotonic", fake_monotonic)
+
+    with pytest.raises(CircuitBreakerError, match="retry in 0.75s"):
+        br.call(lambda: 123)
+    assert len(reads) == 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -66,3 +67,120 @@ def test_leaderboard_limit(tmp_path: Path) -> None:
 
     lb = scoring.leaderboard(limit=3)
     assert len(lb) == 3
+
+
+def test_streak_stops_at_gap(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    c = reg.register(node_id="n", name="x", role="agent", metadata={})
+    scoring = ContributorScoring(db)
+    assert scoring.compute_score(c.id).streak == 0
+
+    now = datetime.now(tz=UTC)
+    for i, days_ago in enumerate([0, 0, 1, 3, 4]):
+        _insert_signal(db, contributor_id=c.id, event_id=f"e{i}", accepted=1, profitable=None, score=1.0, created_at=now - timedelta(days=days_ago))
+
+    assert scoring.compute_score(c.id).streak == 2
+
+
+def test_compute_score_includes_karma_and_conviction_accuracy(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    c = reg.register(node_id="node-k", name="x", role="agent", metadata={})
+
+    now = datetime.now(tz=UTC)
+    _insert_signal(db, contributor_id=c.id, event_id="e1", accepted=1, profitable=1, score=8.0, created_at=now)
+    _insert_signal(db, contributor_id=c.id, event_id="e2", accepted=1, profitable=0, score=4.0, created_at=now)
+    with db.conn:
+        for i, amt in enumerate([1.5, 2.5]):
+            db.conn.execute(
+                "INSERT INTO karma_intents (id, trade_id, realized_pnl_usd, karma_percentage, karma_amount_usd, node_id) VALUES (?, ?, 1.0, 0.01, ?, ?)",
+                (f"k{i}", f"t{i}", amt, "node-k"),
+            )
+
+    s = ContributorScoring(db).compute_score(c.id)
+    assert s.total_karma_usd == 4.0
+    assert s.streak == 1
+    # hit 0.5, volume log1p(2)/log1p(100), streak 1/30, accuracy 0.5 + 4/20, recency 1
+    expected = 0.3 * 0.5 + 0.25 * math.log1p(2) / math.log1p(100) + 0.2 / 30 + 0.15 * 0.7 + 0.1
+    assert abs(s.score - 100.0 * expected) < 1e-9
+
+
+def test_leaderboard_matches_compute_score(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    scoring = ContributorScoring(db)
+
+    now = datetime.now(tz=UTC)
+    ids = []
+    for i in range(4):
+        c = reg.register(node_id=f"n{i}", name=f"c{i}", role="agent", metadata={})
+        ids.append(c.id)
+        for j in range(i):
+            _insert_signal(db, contributor_id=c.id, event_id=f"e{i}-{j}", accepted=1, profitable=j % 2, score=float(j), created_at=now - timedelta(days=j))
+
+    lb = scoring.leaderboard(limit=10)
+    assert [s.contributor_id for s in lb][-1] == ids[0]
+    assert lb == sorted((scoring.compute_score(cid) for cid in ids), key=lambda s: (s.score, s.signals_accepted, s.signals_submitted), reverse=True)
+    assert scoring.leaderboard(limit=2) == lb[:2]
+    assert scoring.leaderboard(limit=0) == []
+
+
+def test_recency_decays_after_a_week(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    c = reg.register(node_id="n", name="x", role="agent", metadata={})
+
+    now = datetime(2026, 3, 1, tzinfo=UTC)
+    _insert_signal(db, contributor_id=c.id, event_id="e1", accepted=0, profitable=None, score=1.0, created_at=now - timedelta(days=22))
+
+    s = ContributorScoring(db).compute_score(c.id, now=now)
+    expected = 0.25 * math.log1p(1) / math.log1p(100) + 0.2 / 30 + 0.15 * 0.5 + 0.1 * (1.0 - 15.0 / 30.0)
+    assert abs(s.score - 100.0 * expected) < 1e-9
+
+
+def test_daily_signals_skip_unparseable_created_at(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    c = reg.register(node_id="n", name="x", role="agent", metadata={})
+
+    now = datetime.now(tz=UTC)
+    _insert_signal(db, contributor_id=c.id, event_id="e1", accepted=0, profitable=None, score=1.0, created_at=now)
+    with db.conn:
+        db.conn.execute(
+            "INSERT INTO contributor_signals (contributor_id, event_id, accepted, signal_score, created_at) VALUES (?, ?, 0, 1.0, ?)",
+            (c.id, "e2", "not-a-timestamp"),
+        )
+        db.conn.execute("DELETE FROM contributor_signals WHERE event_id = 'e2'")
+        db.conn.execute(
+            "INSERT INTO contributor_signals (contributor_id, event_id, accepted, signal_score, created_at) VALUES (?, ?, 0, 1.0, ?)",
+            (c.id, "e3", "not-a-timestamp"),
+        )
+        # Force the one-time backfill to run again on reopen.
+        db.conn.execute("DROP TABLE contributor_daily_signals")
+    db.close()
+
+    db = Database(tmp_path / "brain.db")
+    rows = db.conn.execute("SELECT signal_count FROM contributor_daily_signals WHERE contributor_id = ?", (c.id,)).fetchall()
+    assert [int(r[0]) for r in rows] == [1]
+    assert ContributorScoring(db).compute_score(c.id).streak == 1
+
+
+def test_daily_signals_follow_created_at_updates(tmp_path: Path) -> None:
+    db = Database(tmp_path / "brain.db")
+    reg = ContributorRegistry(db)
+    c = reg.register(node_id="n", name="x", role="agent", metadata={})
+
+    now = datetime.now(tz=UTC)
+    _insert_signal(db, contributor_id=c.id, event_id="e1", accepted=0, profitable=None, score=1.0, created_at=now)
+    _insert_signal(db, contributor_id=c.id, event_id="e2", accepted=0, profitable=None, score=1.0, created_at=now - timedelta(days=3))
+    assert ContributorScoring(db).compute_score(c.id).streak == 1
+
+    with db.conn:
+        db.conn.execute(
+            "UPDATE contributor_signals SET created_at = ? WHERE event_id = 'e2'",
+            ((now - timedelta(days=1)).isoformat(),),
+        )
+    assert ContributorScoring(db).compute_score(c.id).streak == 2
+    n = db.conn.execute("SELECT COUNT(1) FROM contributor_daily_signals WHERE contributor_id = ?", (c.id,)).fetchone()
+    assert int(n[0]) == 2
@@ -48,6 +48,17 @@ def test_dedup_is_idempotent_and_conflicts_on_payload_change(temp_dir: Path) ->
         db.close()
 
 
+def test_connection_pragmas(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    try:
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert db.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert db.conn.execute("PRAGMA busy_timeout").fetchone()[0] >= 5000
+    finally:
+        db.close()
+
+
 def test_batch_append(temp_dir: Path) -> None:
     db = Database(temp_dir / "brain.db")
     try:
@@ -62,3 +73,117 @@ def test_batch_append(temp_dir: Path) -> None:
         assert out[0].source == "unit"
     finally:
         db.close()
+
+
+def test_transaction_groups_writes_and_rolls_back_hash_chain(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    try:
+        with pytest.raises(RuntimeError), db.transaction():
+            db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "BTC"})
+            db.append_events_batch([(EventType.SIGNAL_TA_V1, {"symbol": "ETH"}, None)])
+            raise RuntimeError("boom")
+        assert db.get_events(limit=10) == []
+
+        with db.transaction():
+            with db.transaction():
+                db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "SOL"})
+            db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "ARB"})
+        assert len(db.get_events(limit=10)) == 2
+        assert db.verify_hash_chain() is True
+    finally:
+        db.close()
+
+
+def test_caught_inner_failure_rolls_back_only_inner_writes(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    try:
+        with db.transaction():
+            db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "BTC"}, dedupe_key="k0")
+            with pytest.raises(RuntimeError), db.transaction():
+                db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "ETH"})
+                raise RuntimeError("inner")
+            # The first row of this batch is written before the dedupe conflict.
+            with pytest.raises(DedupeConflictError):
+                db.append_events_batch(
+                    [
+                        (EventType.SIGNAL_TA_V1, {"symbol": "SOL"}, "k1"),
+                        (EventType.SIGNAL_TA_V1, {"symbol": "ARB"}, "k0"),
+                    ]
+                )
+            db.append_event(event_type=EventType.SIGNAL_TA_V1, payload={"symbol": "DOGE"})
+
+        symbols = [e.payload["symbol"] for e in reversed(db.get_events(limit=10))]
+        assert symbols == ["BTC", "DOGE"]
+        assert db.conn.execute("SELECT COUNT(1) FROM event_dedup").fetchone()[0] == 1
+        assert db.verify_hash_chain() is True
+    finally:
+        db.close()
+
+
+def test_contributor_signals_epoch_column_is_maintained(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    try:
+        with db.conn:
+            db.conn.execute(
+                "INSERT INTO contributors (id, node_id, name, role, registered_at, updated_at) VALUES ('c', 'n', 'x', 'agent', 'now', 'now')",
+            )
+            db.conn.execute(
+                "INSERT INTO contributor_signals (contributor_id, event_id, created_at) VALUES ('c', 'e1', '2026-01-01T00:00:10.5+00:00')",
+            )
+            db.conn.execute("INSERT INTO contributor_signals (contributor_id, event_id) VALUES ('c', 'e2')")
+        rows = db.conn.execute("SELECT created_at_ts, CAST(strftime('%s', created_at) AS INTEGER) FROM contributor_signals ORDER BY id").fetchall()
+        assert rows[0][0] == 1767225610
+        assert rows[1][0] == rows[1][1]
+    finally:
+        db.close()
+
+
+def test_pending_karma_and_active_webhook_queries_use_partial_indexes(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+
+    def plan(sql: str, params: tuple = ()) -> str:
+        return " ".join(str(r[3]) for r in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall())
+
+    pending = plan("SELECT id FROM karma_intents WHERE settled = 0 ORDER BY created_at ASC")
+    assert "idx_karma_intents_pending" in pending
+    assert "TEMP B-TREE" not in pending
+
+    active = plan("SELECT url FROM webhook_subscriptions WHERE enabled = 1 AND event_matches(event_globs, ?) ORDER BY id ASC", ("signal.ta.v1",))
+    assert "idx_webhook_subscriptions_active" in active
+
+
+def test_position_and_learning_lookups_use_indexes(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+
+    def plan(sql: str, params: tuple = ()) -> str:
+        return " ".join(str(r[3]) for r in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall())
+
+    latest = plan("SELECT id FROM positions WHERE asset = ? AND status = 'open' ORDER BY opened_at DESC LIMIT 1", ("BTC",))
+    assert "idx_positions_status_asset" in latest
+    assert "TEMP B-TREE" not in latest
+
+    last_run = plan("SELECT ts FROM learning_weights WHERE cycle_type = ? ORDER BY ts DESC LIMIT 1", ("weekly",))
+    assert "idx_learning_weights_cycle_ts" in last_run
+    assert "TEMP B-TREE" not in last_run
+
+    realized = plan("SELECT COALESCE(SUM(realized_pnl), 0.0) FROM positions WHERE status = 'closed' AND realized_pnl IS NOT NULL")
+    assert "COVERING INDEX idx_positions_realized" in realized
+    db.close()
+
+
+def test_positions_qty_is_generated_and_migration_is_idempotent(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    with db.conn:
+        db.conn.execute(
+            "INSERT INTO positions (id, platform, asset, direction, entry_price, size_notional, leverage, opened_at, status)"
+            " VALUES ('p1', 'paper', 'BTC', 'long', 50000.0, 1000.0, 1.0, '2026-01-01T00:00:00+00:00', 'open'),"
+            " ('p0', 'paper', 'ETH', 'long', 0.0, 1000.0, 1.0, '2026-01-01T00:00:00+00:00', 'open')"
+        )
+    db.close()
+
+    db = Database(temp_dir / "brain.db")
+    try:
+        qty = dict(db.conn.execute("SELECT id, qty FROM positions").fetchall())
+        assert qty == {"p1": 1000.0 / 50000.0, "p0": 0.0}
+    finally:
+        db.close()
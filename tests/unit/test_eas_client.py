@@ -14,7 +14,7 @@ except Exception:  # pragma: no cover
 
 from engine.core.contributors import ContributorRegistry
 from engine.core.database import Database
-from engine.integrations.eas import AttestationData, EASClient
+from engine.integrations.eas import ZERO_ADDRESS, AttestationData, EASClient, _as_bytes32, _norm_addr, _norm_hex32
 from engine.integrations.eas_schema import CONTRIBUTOR_SCHEMA, EXPECTED_SCHEMA_HASH, compute_schema_hash
 
 
@@ -46,11 +46,32 @@ def test_offchain_attestation_sign_and_verify(tmp_path: Path) -> None:
     assert str(att.get("signature")).startswith("0x")
 
     assert client.verify_offchain_attestation(att) is True
+    assert att["data"] == json.loads(bytes.fromhex(att["data_bytes"][2:]))
+
+    nested = {"b": (1, 2), "a": {"z": 1}}
+    att_nested = client.create_offchain_attestation(AttestationData(schema_uid="0x" + "11" * 32, recipient=ZERO_ADDRESS, data=nested))
+    nested["a"]["z"] = 2
+    assert att_nested["data"] == {"a": {"z": 1}, "b": [1, 2]}
+    assert list(att_nested["data"]) == ["a", "b"]
 
     # Tamper the signed data bytes => verification should fail
     att2 = json.loads(json.dumps(att))
     att2["data_bytes"] = "0x" + "ff" * 32  # corrupt the signed payload
     assert client.verify_offchain_attestation(att2) is False
+    assert client.verify_many([att, att2, {}]) == [True, False, False]
+
+
+def test_hex_normalisation_validates_length_and_digits() -> None:
+    assert _norm_addr("AB" * 20) == "0x" + "ab" * 20
+    assert _norm_hex32("0x" + "0F" * 32) == "0x" + "0f" * 32
+    for bad in ("0x" + "zz" * 20, "0x12", ""):
+        with pytest.raises(ValueError, match="address"):
+            _norm_addr(bad)
+    with pytest.raises(ValueError, match="32-byte"):
+        _norm_hex32("0x" + "g" * 64)
+    assert _as_bytes32("0x" + "0F" * 32) == _as_bytes32(memoryview(b"\x0f" * 32)) == b"\x0f" * 32
+    with pytest.raises(ValueError, match="32-byte"):
+        _as_bytes32(b"\x00" * 20)
 
 
 def test_rpc_call_with_mocked_http(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -77,6 +98,41 @@ def test_rpc_call_with_mocked_http(monkeypatch: pytest.MonkeyPatch) -> None:
     assert client.rpc_call("eth_chainId", []) == "0x01"
 
 
+def test_rpc_batch_orders_results_by_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = EASClient(
+        rpc_url="https://example.invalid",
+        eas_address="0xA1207F3BBa224E2c9c3c6D5aF63D0eb1582Ce587",
+        schema_registry_address="0xA7b39296258348C78294F95B872b282326A97BDF",
+    )
+    posts: list[Any] = []
+
+    class FakeResp:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> list[dict[str, Any]]:
+            return [{"jsonrpc": "2.0", "id": 1, "result": "0x10"}, {"jsonrpc": "2.0", "id": 0, "result": "0x01"}]
+
+    def fake_post(url: str, *, json: list[dict[str, Any]]) -> FakeResp:  # type: ignore[override]
+        posts.append(json)
+        return FakeResp()
+
+    monkeypatch.setattr(client._http, "post", fake_post)
+    assert client.rpc_batch([("eth_chainId", []), ("eth_blockNumber", [])]) == ["0x01", "0x10"]
+    assert len(posts) == 1
+    assert [c["method"] for c in posts[0]] == ["eth_chainId", "eth_blockNumber"]
+
+
+def test_client_context_manager_closes_http_pool() -> None:
+    with EASClient(
+        rpc_url="https://example.invalid",
+        eas_address="0xA1207F3BBa224E2c9c3c6D5aF63D0eb1582Ce587",
+        schema_registry_address="0xA7b39296258348C78294F95B872b282326A97BDF",
+    ) as client:
+        assert client._http.is_closed is False
+    assert client._http.is_closed is True
+
+
 class FakeEASClient:
     def __init__(self, *, should_fail: bool = False):
         self.should_fail = should_fail
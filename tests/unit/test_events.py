@@ -11,6 +11,7 @@ from engine.core.events import (
     EventType,
     TASignalPayload,
     canonical_json,
+    canonical_json_bytes,
     compute_dedupe_key,
 )
 
@@ -39,6 +40,14 @@ def test_canonical_json_is_stable() -> None:
     assert canonical_json(a) == canonical_json(b)
 
 
+def test_canonical_json_matches_hash_chain_format() -> None:
+    # The hash chain depends on this exact byte form.
+    data = {"z": [1.5, 1e16, None], "a": "é", "m": {"y": True, "x": 0}}
+    expected = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    assert canonical_json(data) == expected
+    assert canonical_json_bytes(data) == expected.encode("utf-8")
+
+
 def test_compute_dedupe_key_is_deterministic() -> None:
     payload = {"symbol": "BTC", "rsi_14": 50.0}
     k1 = compute_dedupe_key(EventType.SIGNAL_TA_V1, payload)
@@ -58,3 +67,21 @@ def test_event_envelope_model_is_frozen() -> None:
 
     with pytest.raises(ValidationError, match="frozen"):
         env.hash = "nope"  # type: ignore[misc]
+
+
+def test_compute_event_hash_is_pinned() -> None:
+    from datetime import UTC, datetime
+
+    from engine.core.models import compute_event_hash
+
+    h = compute_event_hash(
+        prev_hash="prev",
+        event_type=EventType.SIGNAL_TA_V1,
+        payload={"symbol": "BTC", "rsi_14": 55.5, "note": "é"},
+        ts=datetime(2026, 1, 1, tzinfo=UTC),
+        source="src",
+        dedupe_key="k",
+        event_id="e1",
+    )
+    # sha256("prev|<ts>|e1|signal.ta.v1|v1|src||k|<canonical payload>")
+    assert h == "63bb82fcdb95ff97ee50ed06f8036b0fb6b755340d1523d94b448a1e95fa2bfc"
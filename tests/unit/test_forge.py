@@ -61,6 +61,31 @@ def test_python_grinder_progress_message_format() -> None:
     assert int(progress["rate"]) >= 0
 
 
+def test_python_grinder_parallel_workers_find_prefix() -> None:
+    pytest.importorskip("eth_account")
+
+    from engine.integrations.forge import grind
+
+    found = None
+    for msg in grind("b1", report_interval=0.01, workers=2):
+        if msg.get("type") == "found":
+            found = msg
+            break
+
+    assert found is not None
+    assert found["address"].lower().startswith("0xb1")
+    assert int(found["candidates"]) > 0
+
+
+def test_prefix_matcher_compares_raw_address_bytes() -> None:
+    from engine.integrations.forge import _prefix_matcher
+
+    addr = bytes.fromhex("b1e55ed0" + "00" * 16)
+    for prefix, ok in (("b1e55ed", True), ("b1e55e", True), ("b1e55ee", False), ("", True)):
+        nbytes, shift, target = _prefix_matcher(prefix)
+        assert (int.from_bytes(addr[:nbytes], "big") >> shift == target) is ok
+
+
 def test_cli_parser_has_identity_forge() -> None:
     from engine.cli import build_parser
 
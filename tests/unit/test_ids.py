@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import uuid
+
+from engine.core.ids import new_id
+
+
+def test_new_id_is_uuid4_shaped() -> None:
+    ids = {new_id() for _ in range(100)}
+    assert len(ids) == 100
+    for i in ids:
+        u = uuid.UUID(i)
+        assert u.version == 4 and str(u) == i
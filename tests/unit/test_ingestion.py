@@ -7,6 +7,7 @@ import pytest
 from engine.core.database import Database
 from engine.core.events import EventType
 from engine.core.ingestion import AggregationBus, EventPublisher
+from engine.core.metrics import MetricsRegistry
 
 
 def test_bus_routes_events_to_handlers_and_dedupes(tmp_path) -> None:
@@ -35,3 +36,46 @@ def test_bus_routes_events_to_handlers_and_dedupes(tmp_path) -> None:
         )
 
     db.close()
+
+
+def test_publish_many_appends_batch_and_routes(tmp_path) -> None:
+    db = Database(tmp_path / "db.sqlite")
+    bus = AggregationBus()
+    pub = EventPublisher(db=db, bus=bus, default_source="test")
+
+    seen: list[str] = []
+    bus.register_handler(EventType.SIGNAL_TA_V1, lambda ev: seen.append(ev.payload["symbol"]))
+
+    out = pub.publish_many(
+        [
+            (EventType.SIGNAL_TA_V1, {"symbol": "BTC", "rsi_14": 40.0}),
+            (EventType.SIGNAL_TA_V1, {"symbol": "ETH", "rsi_14": 60.0}),
+        ],
+        ts=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    assert [ev.source for ev in out] == ["test", "test"]
+    assert out[1].prev_hash == out[0].hash
+    assert seen == ["BTC", "ETH"]
+    assert db.verify_hash_chain()
+
+    with pytest.raises(ValueError):
+        pub.publish_many([(EventType.SIGNAL_TA_V1, {"symbol": "BTC", "rsi_14": 40.0})])
+
+    db.close()
+
+
+def test_bus_counts_appended_events(tmp_path) -> None:
+    db = Database(tmp_path / "db.sqlite")
+    reg = MetricsRegistry()
+    pub = EventPublisher(db=db, bus=AggregationBus(metrics=reg), default_source="test")
+
+    pub.publish(EventType.SIGNAL_TA_V1, {"symbol": "SOL", "rsi_14": 50.0})
+    pub.publish_many(
+        [
+            (EventType.SIGNAL_TA_V1, {"symbol": "BTC", "rsi_14": 40.0}),
+            (EventType.SIGNAL_TA_V1, {"symbol": "ETH", "rsi_14": 60.0}),
+        ]
+    )
+
+    assert reg.local_counter("ingestion.events_appended").value == 3.0
+    db.close()
@@ -3,8 +3,11 @@ from __future__ import annotations
 import base64
 from pathlib import Path
 
+import pytest
+
 from engine.core.config import Config
 from engine.core.database import Database
+from engine.core.events import EventType
 from engine.execution.karma import KarmaEngine
 from engine.security.identity import generate_node_identity
 
@@ -129,3 +132,74 @@ def test_settlement_batch_and_receipt(tmp_path: Path) -> None:
     receipts = k.get_receipts()
     assert len(receipts) == 1
     assert receipts[0].id == receipt.id
+
+    (settlement,) = db.get_events(event_type=EventType.KARMA_SETTLEMENT_V1, limit=10)
+    (receipt_ev,) = db.get_events(event_type=EventType.KARMA_RECEIPT_V1, limit=10)
+    assert settlement.payload == receipt_ev.payload
+    assert settlement.payload["signature_b64"] == receipt.signature_b64
+
+
+def test_settle_only_claims_pending_intents(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    db = Database(tmp_path / "db.sqlite")
+    ident = generate_node_identity()
+
+    k = KarmaEngine(config=cfg, db=db, identity=ident)
+    i1 = k.record_intent(trade_id="a", realized_pnl_usd=100.0)
+    i2 = k.record_intent(trade_id="b", realized_pnl_usd=200.0)
+    assert i1 is not None and i2 is not None
+
+    first = k.settle(intent_ids=[i1.id], tx_hash="0xabc")
+    assert first is not None and first.status == "submitted"
+    assert k.settle(intent_ids=[i1.id]) is None
+
+    second = k.settle(intent_ids=[i1.id, i2.id, "missing"])
+    assert second is not None
+    assert second.intent_ids == [i2.id]
+    assert abs(second.total_usd - i2.karma_amount_usd) < 1e-9
+
+    batches = dict(db.conn.execute("SELECT id, batch_id FROM karma_intents").fetchall())
+    assert batches == {i1.id: first.id, i2.id: second.id}
+    assert len(k.get_receipts()) == 2
+
+
+def test_listed_intents_and_receipts_round_trip(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    db = Database(tmp_path / "db.sqlite")
+    ident = generate_node_identity()
+
+    k = KarmaEngine(config=cfg, db=db, identity=ident)
+    intent = k.record_intent(trade_id="a", realized_pnl_usd=100.0)
+    assert intent is not None
+
+    (listed,) = k.get_pending_intents()
+    assert (listed.id, listed.trade_id, listed.node_id, listed.signature_b64) == (intent.id, "a", intent.node_id, intent.signature_b64)
+    assert isinstance(listed.karma_amount_usd, float) and listed.karma_amount_usd == intent.karma_amount_usd
+
+    receipt = k.settle(intent_ids=[intent.id])
+    assert receipt is not None
+    (stored,) = k.get_receipts()
+    assert stored.intent_ids == [intent.id]
+    assert stored.tx_hash is None
+    assert (stored.total_usd, stored.status, stored.signature_b64) == (receipt.total_usd, "pending", receipt.signature_b64)
+
+
+def test_intent_row_and_event_commit_together(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = _cfg(tmp_path)
+    db = Database(tmp_path / "db.sqlite")
+    ident = generate_node_identity()
+
+    k = KarmaEngine(config=cfg, db=db, identity=ident)
+
+    def boom(**_kwargs: object) -> None:
+        raise RuntimeError("event store down")
+
+    monkeypatch.setattr(db, "append_event", boom)
+    assert k.record_intent(trade_id="a", realized_pnl_usd=10.0) is None
+    assert db.conn.execute("SELECT COUNT(1) FROM karma_intents").fetchone()[0] == 0
+
+    monkeypatch.undo()
+    intent = k.record_intent(trade_id="b", realized_pnl_usd=10.0)
+    assert intent is not None
+    assert [p.id for p in k.get_pending_intents()] == [intent.id]
+    assert len(db.get_events(event_type=EventType.KARMA_INTENT_V1, limit=10)) == 1
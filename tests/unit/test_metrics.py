@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+
+from engine.core.metrics import MetricsRegistry
+
+
+def test_local_counter_flushes_to_shared_counter() -> None:
+    reg = MetricsRegistry()
+    c = reg.local_counter("events", flush_every=10)
+
+    for _ in range(25):
+        c.inc()
+
+    # Two full flushes reached the shared counter; the remainder is still local.
+    assert reg.snapshot()["counter.events"] == 20.0
+    assert c.value == 25.0
+    assert reg.snapshot()["counter.events"] == 25.0
+
+
+def test_local_counter_aggregates_across_threads() -> None:
+    reg = MetricsRegistry()
+    c = reg.local_counter("events", flush_every=7)
+
+    def work() -> None:
+        for _ in range(1000):
+            c.inc()
+        c.flush()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert reg.counter("events").value == 4000.0
+    assert reg.local_counter("events") is c
+
+
+def test_local_counter_folds_and_drops_dead_thread_cells() -> None:
+    reg = MetricsRegistry()
+    c = reg.local_counter("events", flush_every=1000)
+
+    def work() -> None:
+        for _ in range(5):
+            c.inc()
+
+    for _ in range(3):
+        t = threading.Thread(target=work)
+        t.start()
+        t.join()
+
+    # Nothing reached the flush threshold, but the exited threads' deltas are kept.
+    assert c.value == 15.0
+    assert reg.counter("events").value == 15.0
+    assert len(c._cells) == 1  # only the reading thread's cell remains
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from engine.brain.kill_switch import KillSwitch
 from engine.core.config import Config
 from engine.core.database import Database
+from engine.core.events import EventType
 from engine.core.policy import TradingPolicy, TradingPolicyEngine
 from engine.core.types import TradeIntent
 from engine.execution.oms import OMS, default_sizer_from_config
@@ -54,3 +57,48 @@ def test_submit_intent_paper_creates_fill_and_events(temp_dir: Path, test_config
     types = {e.type for e in evs}
     assert "execution.trade_intent.v1" in {str(t) for t in types}
     assert "execution.order_filled.v1" in {str(t) for t in types}
+
+    post_fill = [e for e in reversed(evs) if e.source == "execution.oms" and str(e.type) != "execution.trade_intent.v1"]
+    assert [str(e.type) for e in post_fill] == ["execution.order_submitted.v1", "execution.order_filled.v1", "execution.position_opened.v1"]
+    assert post_fill[1].prev_hash == post_fill[0].hash and post_fill[2].prev_hash == post_fill[1].hash
+
+
+def test_submit_paper_rolls_back_fill_when_event_batch_fails(temp_dir: Path, test_config: Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    db = Database(temp_dir / "brain.db")
+    ks = KillSwitch(test_config, db)
+    policy_engine = TradingPolicyEngine(
+        policy=TradingPolicy(
+            max_daily_loss_usd=0.0,
+            max_position_size_pct=test_config.risk.max_position_pct,
+            kill_switch_enabled=True,
+            max_leverage_default=test_config.risk.max_leverage,
+        )
+    )
+    oms = OMS(config=test_config, db=db, preflight=Preflight(policy=policy_engine, kill_switch=ks), sizer=default_sizer_from_config(test_config))
+
+    # Fail on the second event of the batch, after the first row is written.
+    real_append = db._append_in_tx
+
+    def failing_append(**kwargs):  # type: ignore[no-untyped-def]
+        if kwargs["event_type"] == EventType.ORDER_FILLED_V1:
+            raise RuntimeError("event store down")
+        return real_append(**kwargs)
+
+    monkeypatch.setattr(db, "_append_in_tx", failing_append)
+
+    intent = TradeIntent(
+        symbol="BTC",
+        direction="long",
+        size_pct=0.05,
+        leverage=1.0,
+        conviction_score=80.0,
+        regime="BULL",
+        rationale="unit test",
+    )
+    with pytest.raises(RuntimeError, match="event store down"):
+        oms.submit(intent, mid_price=50_000.0, equity_usd=10_000.0)
+
+    assert db.conn.execute("SELECT COUNT(1) FROM positions").fetchone()[0] == 0
+    assert db.conn.execute("SELECT COUNT(1) FROM orders").fetchone()[0] == 0
+    assert "execution.order_submitted.v1" not in {str(e.type) for e in db.get_events(limit=50)}
+    assert db.verify_hash_chain() is True
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from engine.core.config import Config
+from engine.core.database import Database
+from engine.execution.paper import PaperBroker
+from engine.execution.pnl import PnLTracker
+from engine.integration.outcome_writer import write_outcome_for_closed_position
+
+
+def test_write_outcome_rejects_unknown_open_and_unpriced_positions(temp_dir: Path, test_config: Config) -> None:
+    db = Database(temp_dir / "brain.db")
+    fill = PaperBroker(db).execute_market(symbol="BTC", direction="long", notional_usd=1000.0, mid_price=50_000.0)
+
+    with pytest.raises(ValueError, match="Unknown position_id"):
+        write_outcome_for_closed_position(db=db, config=test_config, position_id="missing")
+    with pytest.raises(ValueError, match="is not closed"):
+        write_outcome_for_closed_position(db=db, config=test_config, position_id=fill.position_id)
+
+    PnLTracker(db).close_position(position_id=fill.position_id, exit_price=51_000.0)
+    with db.conn:
+        db.conn.execute("UPDATE positions SET realized_pnl = NULL WHERE id = ?", (fill.position_id,))
+    with pytest.raises(ValueError, match="missing realized_pnl"):
+        write_outcome_for_closed_position(db=db, config=test_config, position_id=fill.position_id)
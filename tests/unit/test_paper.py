@@ -53,3 +53,18 @@ def test_paper_idempotency_key_returns_existing(temp_dir: Path) -> None:
 
     assert a.order_id == b.order_id
     assert a.position_id == b.position_id
+    assert db.conn.execute("SELECT COUNT(1) FROM positions").fetchone()[0] == 1
+    assert db.conn.execute("SELECT COUNT(1) FROM orders").fetchone()[0] == 1
+
+
+def test_existing_open_position_returns_latest_open_row(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    broker = PaperBroker(db)
+    assert broker._existing_open_position("BTC") is None
+
+    fill = broker.execute_market(symbol="btc", direction="short", notional_usd=500.0, leverage=2.0, mid_price=40_000.0)
+    pos = broker._existing_open_position("BTC")
+    assert pos is not None
+    assert (pos.id, pos.asset, pos.direction, pos.status) == (fill.position_id, "BTC", "short", "open")
+    assert pos.entry_price == fill.fill_price
+    assert (pos.size_notional, pos.leverage) == (500.0, 2.0)
@@ -27,8 +27,44 @@ def test_unrealized_and_realized_pnl_long(temp_dir: Path) -> None:
     assert u > 0
 
     r = pnl.close_position(position_id=fill.position_id, exit_price=55_000.0, reason="tp")
-    assert r > 0
+    assert r == pytest.approx(u)
+    row = db.conn.execute("SELECT status, realized_pnl FROM positions WHERE id = ?", (fill.position_id,)).fetchone()
+    assert row["status"] == "closed"
+    assert row["realized_pnl"] == r
 
     # can't close twice
     with pytest.raises(ValueError):
         pnl.close_position(position_id=fill.position_id, exit_price=55_000.0)
+    with pytest.raises(ValueError, match="not open"):
+        pnl.close_position(position_id=fill.position_id, exit_price=55_000.0)
+    with pytest.raises(ValueError, match="not found"):
+        pnl.close_position(position_id="missing", exit_price=55_000.0)
+
+
+def test_close_short_realizes_loss_when_price_rises(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    fill = PaperBroker(db).execute_market(symbol="ETH", direction="short", notional_usd=1000.0, mid_price=2000.0, idempotency_key="pnl2")
+    pnl = PnLTracker(db)
+
+    expected = pnl.unrealized_usd(position_id=fill.position_id, mark_price=2200.0)
+    assert expected < 0
+    assert pnl.close_position(position_id=fill.position_id, exit_price=2200.0) == pytest.approx(expected)
+
+
+def test_snapshot_sums_open_marks_and_closed_realized(temp_dir: Path) -> None:
+    db = Database(temp_dir / "brain.db")
+    broker = PaperBroker(db)
+    pnl = PnLTracker(db)
+
+    btc = broker.execute_market(symbol="BTC", direction="long", notional_usd=1000.0, mid_price=50_000.0)
+    eth = broker.execute_market(symbol="ETH", direction="short", notional_usd=500.0, mid_price=2000.0)
+    sol = broker.execute_market(symbol="SOL", direction="long", notional_usd=200.0, mid_price=100.0)
+    realized = pnl.close_position(position_id=sol.position_id, exit_price=110.0)
+
+    prices = {"BTC": 51_000.0, "ETH": 1900.0}
+    snap = pnl.snapshot(current_prices=prices)
+    unreal = pnl.unrealized_usd(position_id=btc.position_id, mark_price=prices["BTC"])
+    unreal += pnl.unrealized_usd(position_id=eth.position_id, mark_price=prices["ETH"])
+    assert snap.realized_usd == pytest.approx(realized)
+    assert snap.unrealized_usd == pytest.approx(unreal)
+    assert snap.total_usd == pytest.approx(realized + unreal)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from engine.core.policy import PolicyViolation, TradingPolicy, TradingPolicyEngine
+from engine.core.policy import PolicyState, PolicyViolation, TradingPolicy, TradingPolicyEngine
 
 
 @dataclass(frozen=True)
@@ -67,3 +68,24 @@ def test_policy_pretrade_check_runs_all() -> None:
 
     intent = _Intent(size_pct=0.10, leverage=3.0, regime="neutral")
     eng.pretrade_check(intent, equity_usd=1000.0, kill_switch_level=0)
+
+
+def test_policy_daily_loss_resets_on_utc_day_rollover() -> None:
+    eng = TradingPolicyEngine(TradingPolicy(max_daily_loss_usd=100.0))
+    day1 = datetime(2026, 1, 1, 23, 59, tzinfo=UTC)
+
+    eng.state.record_pnl(-150.0, now=day1)
+    assert eng.state.daily_loss_usd(now=day1) == 150.0
+
+    day2 = day1 + timedelta(minutes=2)
+    assert eng.state.daily_loss_usd(now=day2) == 0.0
+    eng.check_daily_loss_limit(now=day2)
+
+
+def test_policy_state_restored_same_day_keeps_loss() -> None:
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    state = PolicyState(day=now.date(), realized_pnl_usd=-500.0)
+
+    assert state.daily_loss_usd(now=now) == 500.0
+    assert state.daily_loss_usd(now=now + timedelta(hours=11)) == 500.0
+    assert state.daily_loss_usd(now=now + timedelta(hours=12)) == 0.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from engine.execution.position_sizer import CorrelationAwareSizer, KellyParams, PositionSizer
 
 
@@ -8,6 +10,17 @@ def test_kelly_fraction_non_negative() -> None:
     assert s.kelly_fraction() >= 0.0
 
 
+def test_kelly_fraction_tracks_replaced_params() -> None:
+    s = PositionSizer(kelly=KellyParams(p=0.6, b=1.5, fraction_multiplier=0.5))
+    assert abs(s.kelly_fraction() - (1.5 * 0.6 - 0.4) / 1.5 * 0.5) < 1e-12
+
+    s.kelly = KellyParams(p=0.4, b=1.0)
+    assert s.kelly_fraction() == 0.0
+    # Break-even expectancy (p == 1 / (1 + b)) also sizes nothing.
+    s.kelly = KellyParams(p=0.5, b=1.0)
+    assert s.kelly_fraction() == 0.0
+
+
 def test_correlation_aware_sizing_reduces_with_corr_and_heat() -> None:
     base = PositionSizer(kelly=KellyParams(p=0.6, b=1.5, fraction_multiplier=0.5))
     s = CorrelationAwareSizer(base)
@@ -17,3 +30,19 @@ def test_correlation_aware_sizing_reduces_with_corr_and_heat() -> None:
 
     assert a >= b
     assert b >= 0.0
+
+
+def test_size_usd_batch_matches_scalar_path() -> None:
+    s = CorrelationAwareSizer(PositionSizer(kelly=KellyParams(p=0.6, b=1.5, fraction_multiplier=0.5)))
+    conv = np.array([0.0, 0.3, 1.0, 1.5, -0.2, 0.9])
+    corr = np.array([0.0, -0.8, 1.0, 0.2, 0.0, 0.99])
+    heat = np.array([0.5, 0.5, 0.5, 2.0, 0.0, 1.0])
+
+    got = s.size_usd_batch(equity_usd=10_000, conviction_scores=conv, corr_to_portfolio=corr, portfolio_heat_pct=heat)
+    want = [
+        s.size_usd(equity_usd=10_000, conviction_score=c, corr_to_portfolio=r, portfolio_heat_pct=h)
+        for c, r, h in zip(conv.tolist(), corr.tolist(), heat.tolist(), strict=True)
+    ]
+    assert np.allclose(got, want, rtol=1e-12, atol=0.0)
+    assert (got == 0.0).tolist() == [w == 0.0 for w in want]
+    assert not s.size_usd_batch(equity_usd=0.0, conviction_scores=conv).any()
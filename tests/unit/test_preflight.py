@@ -43,6 +43,15 @@ def test_preflight_blocks_on_kill_switch(temp_dir: Path, test_config: Config) ->
     res = preflight.check(intent, mode="paper", equity_usd=10_000.0)
     assert res.approved is False
     assert "kill_switch" in res.reasons
+    assert res.details["mode"] == "paper"
+    assert res.details["kill_switch_level"] == int(KillSwitchLevel.DEFENSIVE)
+    assert "kill switch level" in res.details["policy_message"]
+
+    ok = preflight.check(intent, mode="paper", equity_usd=10_000.0, kill_switch_level=0)
+    assert ok.approved is True
+    assert ok.reasons == ()
+    assert ok.details == {}
+    assert preflight.check(intent, mode="paper", equity_usd=10_000.0, kill_switch_level=0) is ok
 
 
 def test_preflight_gas_check_live_mode(temp_dir: Path, test_config: Config) -> None:
@@ -73,6 +82,48 @@ def test_preflight_gas_check_live_mode(temp_dir: Path, test_config: Config) -> N
     )
     assert res.approved is False
     assert "insufficient_gas" in res.reasons
+    assert res.details["gas"] == {"base:ETH": 0.0}
+
+    res = preflight.check(
+        intent,
+        mode="live",
+        equity_usd=10_000.0,
+        gas_balances={("base", "ETH"): 0.001},
+    )
+    assert res.approved is True
+    assert res.details["gas"] == {"base:ETH": 0.001}
+
+
+def test_preflight_check_many_shares_gas_outcome(temp_dir: Path, test_config: Config) -> None:
+    db = Database(temp_dir / "brain.db")
+    ks = KillSwitch(test_config, db)
+    policy = _mk_policy(max_position_pct=0.05)
+    preflight = Preflight(
+        policy=policy,
+        kill_switch=ks,
+        gas_requirements=[GasRequirement(venue="base", asset="ETH", min_amount=0.001)],
+    )
+
+    def _intent(size_pct: float) -> TradeIntent:
+        return TradeIntent(
+            symbol="ETH",
+            direction="long",
+            size_pct=size_pct,
+            leverage=1.0,
+            conviction_score=60.0,
+            regime="BULL",
+            rationale="",
+        )
+
+    small, huge = preflight.check_many(
+        [_intent(0.01), _intent(0.50)],
+        mode="live",
+        equity_usd=10_000.0,
+        gas_balances={("base", "ETH"): 0.0},
+    )
+    assert small.reasons == ("insufficient_gas",)
+    assert huge.reasons == ("position_size_limit", "insufficient_gas")
+    assert small.details["gas"] == huge.details["gas"] == {"base:ETH": 0.0}
 
 
 def test_rejects_whale_sized_order_for_non_whale(temp_dir: Path, test_config: Config) -> None:
@@ -145,3 +145,31 @@ def test_projection_manager_rebuild_from_replay() -> None:
     pm.rebuild([e1, e2])
     st = pm.get_state()
     assert st["signals_latest"]["BTC"][str(EventType.SIGNAL_TA_V1)]["payload"]["rsi_14"] == 20.0
+
+
+def test_projection_manager_routes_keyed_fallback_events() -> None:
+    pm = ProjectionManager()
+    e = _mk_event(
+        eid="1",
+        et=EventType.ORDER_FILLED_V1,
+        ts=datetime(2026, 1, 1, tzinfo=UTC),
+        payload={"position_id": "p9", "symbol": "eth", "realized_pnl": 5.0},
+    )
+    pm.handle(e)
+    st = pm.get_state()
+    assert st["position_state"]["positions"]["p9"]["status"] == "unknown"
+    assert st["outcomes"]["outcomes"]["p9"]["realized_pnl"] == 5.0
+    assert st["regime_state"]["current"] is None
+    assert st["signals_latest"] == {}
+
+
+def test_position_state_projector_filters_by_status() -> None:
+    p = PositionStateProjector()
+    for i, (pid, et) in enumerate([("p1", EventType.POSITION_OPENED_V1), ("p2", EventType.POSITION_OPENED_V1), ("p1", EventType.POSITION_CLOSED_V1)]):
+        p.handle(_mk_event(eid=str(i), et=et, ts=datetime(2026, 1, 1 + i, tzinfo=UTC), payload={"position_id": pid, "symbol": "BTC"}))
+
+    assert p.position_ids_with_status("open") == ["p2"]
+    assert p.position_ids_with_status("closed") == ["p1"]
+    p1 = p.get_state()["positions"]["p1"]
+    assert p1["opened_at"] == datetime(2026, 1, 1, tzinfo=UTC)
+    assert p1["closed_at"] == datetime(2026, 1, 3, tzinfo=UTC)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-from engine.core.time import parse_dt, staleness_ms, utc_now
+from engine.core.time import parse_dt, staleness_ms, utc_now, utc_now_iso_seconds
 
 
 def test_utc_now_is_aware_and_utc() -> None:
@@ -26,3 +26,11 @@ def test_staleness_ms_is_non_negative() -> None:
     base = datetime(2026, 2, 17, 23, 33, tzinfo=UTC)
     now = base + timedelta(seconds=1)
     assert staleness_ms(base, now=now) == 1000
+
+
+def test_utc_now_iso_seconds_matches_truncated_now() -> None:
+    before = utc_now().replace(microsecond=0)
+    got = parse_dt(utc_now_iso_seconds())
+    assert before <= got <= utc_now()
+    assert got.microsecond == 0
+    assert utc_now_iso_seconds().endswith("+00:00")
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import json
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+import time
 import urllib.error
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 
 from engine.core.database import Database
 from engine.core.events import EventType
+from engine.core.metrics import REGISTRY
 from engine.core.models import Event, compute_event_hash
 from engine.core.webhooks import (
     WebhookSubscription,
+    _encode_payload,
+    _iso,
+    _matching_urls,
+    _post_bytes,
     add_webhook_subscription,
     dispatch_event_webhooks,
+    remove_webhook_subscription,
     subscription_matches,
+    wait_for_webhooks,
 )
 
 
@@ -45,6 +62,7 @@ def test_subscription_matches_globs() -> None:
 
 
 def test_dispatch_retries_with_backoff(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("engine.core.webhooks._breakers", {})
     db = Database(tmp_path / "brain.db")
     add_webhook_subscription(db, url="http://example/hook", event_globs="signal.*")
 
@@ -54,39 +72,266 @@ def test_dispatch_retries_with_backoff(monkeypatch, tmp_path) -> None:
     def fake_sleep(s: float) -> None:
         sleeps.append(float(s))
 
-    def fake_urlopen(req, timeout: float = 0.0):  # noqa: ANN001
-        calls.append(float(timeout))
+    def fake_post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+        calls.append(float(timeout_s))
         if len(calls) < 3:
             raise urllib.error.URLError("boom")
 
-        class _Resp:
-            def __enter__(self):
-                return self
+    monkeypatch.setattr("time.sleep", fake_sleep)
+    monkeypatch.setattr("engine.core.webhooks._post_bytes", fake_post_bytes)
 
-            def __exit__(self, exc_type, exc, tb):
-                return False
+    dispatch_event_webhooks(db, _mk_event(EventType.SIGNAL_TA_V1))
+    wait_for_webhooks()
 
-            def read(self) -> bytes:
-                return b"ok"
+    assert len(calls) == 3
+    assert sleeps[0] == 0.5
+    assert 0.1 <= sleeps[1] <= 1.5
 
-        return _Resp()
 
-    monkeypatch.setattr("time.sleep", fake_sleep)
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+def test_dispatch_skips_endpoint_with_open_circuit(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("engine.core.webhooks._breakers", {})
+    db = Database(tmp_path / "brain.db")
+    add_webhook_subscription(db, url="http://example/down", event_globs="signal.*")
 
-    dispatch_event_webhooks(db, _mk_event(EventType.SIGNAL_TA_V1))
+    calls: list[str] = []
 
-    assert len(calls) == 3
-    assert sleeps == [0.5, 1.0]
+    def fake_post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+        calls.append(url)
+        raise urllib.error.URLError("down")
+
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    monkeypatch.setattr("engine.core.webhooks._post_bytes", fake_post_bytes)
+
+    for _ in range(6):
+        dispatch_event_webhooks(db, _mk_event(EventType.SIGNAL_TA_V1))
+        wait_for_webhooks()
+
+    # Five exhausted deliveries (3 attempts each) open the circuit; the sixth is skipped.
+    assert len(calls) == 15
 
 
 def test_dispatch_skips_nonmatching(monkeypatch, tmp_path) -> None:
     db = Database(tmp_path / "brain.db")
     add_webhook_subscription(db, url="http://example/hook", event_globs="system.*")
 
-    def fake_urlopen(req, timeout: float = 0.0):  # noqa: ANN001
-        raise AssertionError("should not be called")
+    calls: list[str] = []
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    def fake_post_bytes(url: str, body: bytes, *, timeout_s: float) -> None:
+        calls.append(url)
+
+    monkeypatch.setattr("engine.core.webhooks._post_bytes", fake_post_bytes)
 
     dispatch_event_webhooks(db, _mk_event(EventType.SIGNAL_TA_V1))
+    wait_for_webhooks()
+
+    assert calls == []
+
+
+def test_dispatch_drops_when_queue_full(monkeypatch, tmp_path) -> None:
+    db = Database(tmp_path / "brain.db")
+    add_webhook_subscription(db, url="http://example/a", event_globs="signal.*")
+    add_webhook_subscription(db, url="http://example/b", event_globs="signal.*")
+
+    # No workers draining a one-slot queue: the second delivery must be dropped, not block.
+    q: queue.Queue[tuple[str, bytes]] = queue.Queue(maxsize=1)
+    monkeypatch.setattr("engine.core.webhooks._queue", q)
+    monkeypatch.setattr("engine.core.webhooks._workers_started", True)
+    dropped = REGISTRY.counter("webhooks.dropped").value
+
+    dispatch_event_webhooks(db, _mk_event(EventType.SIGNAL_TA_V1))
+
+    assert q.get_nowait()[0] == "http://example/a"
+    assert REGISTRY.counter("webhooks.dropped").value == dropped + 1
+
+
+def test_subscription_matches_is_anchored_and_ignores_empty_globs() -> None:
+    sub = WebhookSubscription(id=1, url="http://example", event_globs="signal.ta.*, ,", enabled=True, created_at="")
+    assert subscription_matches(sub, event_type="signal.ta.v1")
+    assert not subscription_matches(sub, event_type="x.signal.ta.v1")
+    assert not subscription_matches(sub, event_type="signal.ta")
+
+    empty = WebhookSubscription(id=2, url="http://example", event_globs=" , ", enabled=True, created_at="")
+    assert not subscription_matches(empty, event_type="signal.ta.v1")
+
+
+def test_event_matches_sql_function_filters_subscriptions(tmp_path) -> None:
+    db = Database(tmp_path / "brain.db")
+    add_webhook_subscription(db, url="http://a", event_globs="signal.*")
+    add_webhook_subscription(db, url="http://b", event_globs="system.*, signal.ta.*")
+    add_webhook_subscription(db, url="http://c", event_globs="signal.*", enabled=False)
+
+    rows = db.conn.execute(
+        "SELECT url FROM webhook_subscriptions WHERE enabled = 1 AND event_matches(event_globs, ?) ORDER BY id",
+        ("signal.ta.v1",),
+    ).fetchall()
+    assert [r[0] for r in rows] == ["http://a", "http://b"]
+    assert db.conn.execute("SELECT event_matches(NULL, 'signal.ta.v1')").fetchone()[0] == 0
+
+
+def test_post_bytes_reuses_keep_alive_connection() -> None:
+    peers: list[tuple[str, int]] = []
+    bodies: list[bytes] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            peers.append(self.client_address)
+            bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+            status = {"/fail": 500, "/moved": 302}.get(self.path, 200)
+            self.send_response(status)
+            if status == 302:
+                self.send_header("Location", "/hook")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        _post_bytes(f"{base}/hook", b'{"a":1}', timeout_s=3.0)
+        _post_bytes(f"{base}/hook?x=1", b'{"a":2}', timeout_s=3.0)
+        with pytest.raises(urllib.error.HTTPError):
+            _post_bytes(f"{base}/fail", b"{}", timeout_s=3.0)
+        # Redirects are not followed and do not count as delivered.
+        with pytest.raises(urllib.error.HTTPError):
+            _post_bytes(f"{base}/moved", b"[]", timeout_s=3.0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert bodies == [b'{"a":1}', b'{"a":2}', b"{}", b"[]"]
+    assert len(set(peers)) == 1
+
+
+def test_post_bytes_goes_through_http_proxy(monkeypatch) -> None:
+    seen: list[tuple[str, str | None]] = []
+
+    class _Proxy(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            self.rfile.read(int(self.headers["Content-Length"]))
+            seen.append((self.path, self.headers.get("Proxy-Authorization")))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Proxy)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    try:
+        proxy = f"http://user:pw@127.0.0.1:{server.server_address[1]}"
+        for name in ("http_proxy", "HTTP_PROXY"):
+            monkeypatch.setenv(name, proxy)
+        for name in ("no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+        _post_bytes("http://hooks.invalid/in?x=1", b"{}", timeout_s=3.0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert seen == [("http://hooks.invalid/in?x=1", "Basic dXNlcjpwdw==")]
+
+
+def test_queued_delivery_is_sent_before_process_exit() -> None:
+    bodies: list[bytes] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            time.sleep(0.3)  # outlive the child's last statement
+            bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=server.serve_forever, daemon=True)
+    t.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/hook"
+        script = textwrap.dedent(
+            f"""
+            from engine.core import webhooks
+            webhooks._ensure_workers()
+            webhooks._queue.put_nowait(({url!r}, b'{{"a":1}}'))
+            """
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert bodies == [b'{"a":1}']
+
+
+def test_wait_for_webhooks_timeout_returns_false(monkeypatch) -> None:
+    q: queue.Queue[tuple[str, bytes]] = queue.Queue()
+    q.put(("http://example.invalid", b"{}"))
+    monkeypatch.setattr("engine.core.webhooks._queue", q)
+    assert wait_for_webhooks(timeout=0.01) is False
+    q.get()
+    q.task_done()
+    assert wait_for_webhooks(timeout=0.01) is True
+
+
+def test_post_bytes_rejects_non_http_urls() -> None:
+    with pytest.raises(ValueError):
+        _post_bytes("file:///etc/passwd", b"{}", timeout_s=1.0)
+
+
+def test_encode_payload_matches_stdlib_json(monkeypatch) -> None:
+    payload = {"event": {"b": [1, 2.5, None], "a": "é", "ts": datetime(2026, 1, 1, tzinfo=UTC)}}
+    huge = {"event": {"n": 2**70}}
+    fast, fast_huge = _encode_payload(payload), _encode_payload(huge)
+    monkeypatch.setattr("engine.core.webhooks.orjson", None)
+    slow, slow_huge = _encode_payload(payload), _encode_payload(huge)
+
+    assert json.loads(fast) == json.loads(slow)
+    assert json.loads(fast_huge) == json.loads(slow_huge) == huge
+    assert slow == json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def test_iso_cache_is_identity_keyed() -> None:
+    utc = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+    assert utc == plus_one
+
+    assert _iso(utc) == "2026-01-01T12:00:00+00:00"
+    assert _iso(utc) == "2026-01-01T12:00:00+00:00"
+    assert _iso(plus_one) == "2026-01-01T13:00:00+01:00"
+    assert _iso(None) is None
+
+
+def test_matching_urls_cache_follows_subscription_changes(tmp_path) -> None:
+    db = Database(tmp_path / "brain.db")
+    a = add_webhook_subscription(db, url="http://a", event_globs="signal.*")
+
+    first = _matching_urls(db, "signal.ta.v1")
+    assert first == ("http://a",)
+    assert _matching_urls(db, "signal.ta.v1") is first
+    assert _matching_urls(db, "system.kill_switch.v1") == ()
+
+    add_webhook_subscription(db, url="http://b", event_globs="signal.ta.*")
+    assert _matching_urls(db, "signal.ta.v1") == ("http://a", "http://b")
+
+    # A write from another connection (e.g. the CLI) is picked up via data_version.
+    other = Database(tmp_path / "brain.db")
+    with other.conn:
+        other.conn.execute("UPDATE webhook_subscriptions SET enabled = 0 WHERE id = ?", (a,))
+    assert _matching_urls(db, "signal.ta.v1") == ("http://b",)
+
+    remove_webhook_subscription(db, sub_id=a)
+    assert _matching_urls(other, "signal.ta.v1") == ("http://b",)